@@ -0,0 +1,209 @@
+#
+# Bistable Auxetic Batch Flattening - Developed By Dinuk Wijesiri
+#
+# Overview:
+#
+# Flattens many surfaces, each at any number of resolutions, across a
+# process pool. Jobs are listed in a JSON manifest:
+#
+#   [{"Mesh": "Shell.obj", "Resolution": [30, 60, 100], "Output": "Designs/"},
+#    {"Mesh": "Dome.obj", "Resolution": 45, "Output": "Dome.baux", "Coverage": 0.6}]
+#
+# A Resolution list expands into one job per resolution (An Output
+# directory, or one ending in "/", then holds "<Mesh>_<Resolution>.baux").
+# Pinned, Boundary Scale and Coverage are optional per entry. Paths are
+# relative to the manifest.
+#
+# The first job of each surface (and its Pinned and Boundary Scale) runs
+# its Boundary First Flattening, the other resolutions of it are only
+# started once it is cached, so no surface is flattened twice. Finished
+# jobs are recorded in a progress file beside the manifest after each
+# job, so an interrupted run resumes where it stopped. A summary table
+# of every job (Cells, Error Percentage, Largest Loss and Timings) is
+# printed at the end.
+#
+# Usage: python Bistable_Auxetic_Batch_Flattening.py Jobs.json -j 8
+#
+
+# -------- Imports --------
+
+import os as System
+import sys as ArgumentManage
+import json as FileManage
+import argparse as ArgumentParse
+from concurrent.futures import ProcessPoolExecutor as ProcessPool, wait as Wait, FIRST_COMPLETED # Parallel Flattening of Jobs
+from time import time as Time
+
+import Bistable_Auxetic_Flattening as Flattening # Flattening Pipeline (Shared with the single surface CLI)
+import Bistable_Auxetic_Format as Format # Writing .baux files (Shared with the Studio)
+
+# -------- Utilities --------
+
+ProgressPath = lambda Path: f"{System.path.splitext(Path)[0]}.progress.json" # Progress file of a Manifest
+
+def LoadJobs(Path, Defaults = None): # Jobs of a Manifest, one per (Mesh, Resolution) -> [{"Mesh", "Resolution", "Output", "Pinned", "Boundary Scale", "Coverage"}]
+
+    Defaults = dict({"Pinned": [0, 4], "Boundary Scale": 0.0, "Coverage": 0.5}, **(Defaults or {}))
+    Directory = System.path.dirname(System.path.abspath(Path))
+
+    with open(Path, "r", encoding = "utf-8") as FileSource: Entries = FileManage.load(FileSource)
+
+    Jobs = []
+
+    for Entry in Entries:
+
+        Mesh = System.path.normpath(System.path.join(Directory, Entry["Mesh"]))
+        Resolutions = Entry.get("Resolution", 30)
+        Resolutions = Resolutions if isinstance(Resolutions, list) else [Resolutions]
+        Output = Entry.get("Output", System.path.dirname(Mesh) + System.sep)
+        Stem = System.path.splitext(System.path.basename(Mesh))[0]
+
+        for Resolution in Resolutions:
+
+            Destination = System.path.join(Directory, Output, f"{Stem}_{Resolution}.baux") if len(Resolutions) > 1 or Output.endswith(("/", "\\")) or System.path.isdir(System.path.join(Directory, Output)) else System.path.join(Directory, Output)
+            Jobs.append({"Mesh": Mesh, "Resolution": int(Resolution), "Output": System.path.normpath(Destination),
+            "Pinned": list(Entry.get("Pinned", Defaults["Pinned"])), "Boundary Scale": float(Entry.get("Boundary Scale", Defaults["Boundary Scale"])), "Coverage": float(Entry.get("Coverage", Defaults["Coverage"]))})
+
+    return Jobs
+
+def JobSettings(Job): # Everything that determines the Output of a Job (A finished Job is only skipped if none of it changed)
+
+    Statistics = System.stat(Job["Mesh"])
+
+    return [Job["Mesh"], Statistics.st_size, Statistics.st_mtime_ns, Job["Resolution"], Job["Pinned"], Job["Boundary Scale"], Job["Coverage"]]
+
+def LoadProgress(Path): # Records of finished Jobs, keyed by Output
+
+    if not System.path.exists(Path): return {}
+
+    with open(Path, "r", encoding = "utf-8") as FileSource: return FileManage.load(FileSource)
+
+def SaveProgress(Path, Progress): # Written after every Job (Replaced in one step, so an interrupted run never leaves a partly written file)
+
+    with open(f"{Path}.tmp", "w", encoding = "utf-8") as FileSource: FileManage.dump(Progress, FileSource, indent = 1)
+
+    System.replace(f"{Path}.tmp", Path)
+
+def FlattenJob(Job, Cache = Flattening.CacheDirectory): # Flatten a single Job (Runs inside Worker Processes) -> Record
+
+    StartTime = Time()
+    System.makedirs(System.path.dirname(Job["Output"]) or ".", exist_ok = True)
+    Name = System.path.splitext(System.path.basename(Job["Output"]))[0]
+    Design, Report = Flattening.FlattenDesign(Job["Mesh"], Job["Resolution"], Name, Job["Pinned"], Job["Boundary Scale"], Cache, False, Job["Coverage"])
+    Format.SaveDesign(Job["Output"], Design)
+
+    return {"Cells": Report["Cells"], "Cached": Report["Cached"], "Error": Report["Error"], "Largest Loss": Report["Largest Loss"], "Timings": Report["Timings"], "Time": Time() - StartTime}
+
+CacheKey = lambda Job: (Job["Mesh"], tuple(int(_) for _ in Job["Pinned"]), float(Job["Boundary Scale"])) # Jobs with the same Key share a cached Boundary First Flattening (As Flattening.MeshKey)
+
+def FlattenJobs(Jobs, Workers = None, Cache = Flattening.CacheDirectory, Report = None): # Flatten Jobs across a Process Pool, Report(Job, Record) is called as each finishes -> [(Job, Record or Error)]
+
+    Results, Waiting, Running = [], {}, {}
+
+    for Job in Jobs: Waiting.setdefault(CacheKey(Job) if Cache != None else Job["Output"], []).append(Job) # Jobs sharing a Flattening wait for the first of them (Cached)
+
+    def Finished(Job, Result):
+
+        Results.append((Job, Result))
+
+        if Report != None: Report(Job, Result)
+
+    if Workers == 1 or len(Jobs) <= 1:
+
+        for Job in Jobs:
+
+            try: Finished(Job, FlattenJob(Job, Cache))
+
+            except Exception as Error: Finished(Job, Error)
+
+        return Results
+
+    with ProcessPool(max_workers = Workers) as Pool:
+
+        for Key in Waiting:
+
+            Job = Waiting[Key].pop(0)
+            Running[Pool.submit(FlattenJob, Job, Cache)] = (Key, Job)
+
+        while Running:
+
+            Done, _ = Wait(Running, return_when = FIRST_COMPLETED)
+
+            for Future in Done:
+
+                Key, Job = Running.pop(Future)
+
+                try: Finished(Job, Future.result())
+
+                except Exception as Error: Finished(Job, Error)
+
+                for Job in Waiting.pop(Key, []): Running[Pool.submit(FlattenJob, Job, Cache)] = (None, Job) # The Surface is now cached (Or failed, and each of its Jobs reports why)
+
+    return Results
+
+def SummaryTable(Results): # Text Table of Jobs, with their Cells, Error Percentage, Largest Loss and Timings
+
+    Rows = [("Mesh", "Resolution", "Cells", "Error (%)", "Largest Loss", "Flattening (s)", "Total (s)", "Status")]
+
+    for Job, Record in Results:
+
+        if isinstance(Record, Exception): Rows.append((System.path.basename(Job["Mesh"]), str(Job["Resolution"]), "-", "-", "-", "-", "-", f"Failed: {Record}"))
+
+        else: Rows.append((System.path.basename(Job["Mesh"]), str(Job["Resolution"]), str(Record["Cells"]), f"{Record['Error']:.3f}", f"{Record['Largest Loss']:.5f}",
+        f"{Record['Timings'].get('Boundary First Flattening', 0.0):.3f}", f"{Record['Time']:.3f}", ("Resumed" if Record.get("Resumed") else "Done") + (", Cached" if Record["Cached"] else "")))
+
+    Widths = [max(len(Row[_]) for Row in Rows) for _ in range(len(Rows[0]))]
+    Lines = ["  ".join(Text.ljust(Width) if Index in (0, 7) else Text.rjust(Width) for Index, (Text, Width) in enumerate(zip(Row, Widths))).rstrip() for Row in Rows]
+    Lines.insert(1, "-" * len(Lines[0]))
+
+    return "\n".join(Lines)
+
+# -------- Command Line Interface --------
+
+def Main(Arguments = None):
+
+    Parser = ArgumentParse.ArgumentParser(description = "Create Bistable Auxetic Designs (.baux) for many surfaces and resolutions in parallel.")
+    Parser.add_argument("Manifest", help = "JSON list of jobs ({\"Mesh\", \"Resolution\", \"Output\"})")
+    Parser.add_argument("-j", "--jobs", type = int, default = None, help = "Number of worker processes (Defaults to the number of CPUs)")
+    Parser.add_argument("--progress", default = None, help = "Progress file (Defaults to the manifest, as .progress.json)")
+    Parser.add_argument("--restart", action = "store_true", help = "Run every job again, instead of resuming")
+    Parser.add_argument("--coverage", type = float, default = 0.5, help = "Coverage of jobs that do not set one (Defaults to 0.5)")
+    Parser.add_argument("--cache", default = Flattening.CacheDirectory, help = "Directory of cached flattenings")
+    Parser.add_argument("--no-cache", action = "store_true", help = "Always flatten the surfaces again (Resolutions of a surface are not shared)")
+    Arguments = Parser.parse_args(Arguments)
+
+    Path = Arguments.progress if Arguments.progress != None else ProgressPath(Arguments.Manifest)
+    Jobs = LoadJobs(Arguments.Manifest, {"Coverage": Arguments.coverage})
+    Progress = {} if Arguments.restart else LoadProgress(Path)
+    Results, Pending = [], []
+
+    for Job in Jobs:
+
+        Record = Progress.get(Job["Output"])
+
+        if Record != None and Record["Settings"] == JobSettings(Job) and System.path.exists(Job["Output"]): Results.append((Job, dict(Record, Resumed = True)))
+
+        else: Pending.append(Job)
+
+    print(f"{len(Jobs)} Jobs, {len(Jobs) - len(Pending)} already finished.\n")
+
+    def Report(Job, Record):
+
+        if isinstance(Record, Exception):
+
+            print(f"Error: {Job['Mesh']} (Resolution {Job['Resolution']}) could not be flattened ({Record})")
+            return
+
+        Progress[Job["Output"]] = dict(Record, Settings = JobSettings(Job))
+        SaveProgress(Path, Progress)
+        print(f"{Job['Mesh']} -> {Job['Output']} ({Record['Cells']} Cells, {Record['Time']:.3f} Seconds)")
+
+    Results += FlattenJobs(Pending, Arguments.jobs, None if Arguments.no_cache else Arguments.cache, Report)
+    Order = {Job["Output"]: Index for Index, Job in enumerate(Jobs)}
+    Results.sort(key = lambda Result: Order[Result[0]["Output"]])
+    Failures = sum(isinstance(Record, Exception) for _, Record in Results)
+
+    print(f"\n{SummaryTable(Results)}\n\nFlattened {len(Jobs) - Failures} / {len(Jobs)} Jobs.\n")
+    return 1 if Failures else 0
+
+if __name__ == "__main__": ArgumentManage.exit(Main())
@@ -1,222 +1,317 @@
+#
+# Bistable Auxetic Flattening - Developed By Dinuk Wijesiri
+#
+# Overview:
+#
+# Creates a design (.baux) that deploys into a given surface (.obj). The
+# surface is flattened by Boundary First Flattening, the expansion of each
+# face is the ratio of its area on the surface and in the plane, and the
+# flattened faces are rasterized onto the triangular cells of the design
+# (Each face contributes to a cell by the exact area they overlap). Each
+# cell's Thickness and Theta are then solved for its mean expansion.
+#
+# Flattening is the slowest stage, so its results are cached on disk,
+# keyed by a hash of the mesh and the boundary scale settings. Running
+# again with another resolution only repeats the fast stages. Meshes can
+# also be passed in memory ((Vertices, Faces) arrays) to FlattenDesign.
+#
+# Usage: python Bistable_Auxetic_Flattening.py Surface.obj -o Design.baux -r 30
+#
+
 # -------- Imports --------
 
 import numpy as Data
-import torch as Optimize
-import trimesh as Mesh
-import matplotlib.pyplot as Plot
-from matplotlib import style as StyleI
-import matplotx as StyleII
-from matplotlib.cm import ScalarMappable
-from matplotlib.colors import Normalize
 import math as Math
-import json as FileManage
 import os as System
-import mouette as MeshOperations
+import sys as ArgumentManage
+import argparse as ArgumentParse
+import hashlib as Hash
 from time import time as Time
 
+ArgumentManage.path.append(System.path.join(System.path.dirname(System.path.abspath(__file__)), "..", "Source"))
+
+import Bistable_Auxetic_Format as Format # Writing .baux files (Shared with the Studio)
+import Bistable_Auxetic_Geometry as Geometry # Cells of the Isometric Grid (Shared with the Studio)
+
 # -------- Utilities --------
 
-Device = 'cuda' if Optimize.cuda.is_available() else 'cpu'
+Sine = lambda I: Data.sin(Data.radians(I)) # Element-wise (Numbers or Arrays)
 
-Resolutions = [10, 15, 20, 25, 30]
+Cosine = lambda I: Data.cos(Data.radians(I))
 
-Sine = lambda I: Math.sin(Math.radians(I))
+Tangent = lambda I: Data.tan(Data.radians(I))
 
-Cosine = lambda I: Math.cos(Math.radians(I))
+Limits = ((1.5, 13.5), (-5, 22.5)) # Range of Thickness and Theta
 
-Tangent = lambda I: Math.tan(Math.radians(I))
+Start = (2.5, 5.5) # Thickness and Theta that solutions are closest to (Starting Point of the former Adam Optimizer)
 
-ClearScreen = lambda: System.system('clear' if System.name != 'nt' else 'cls')
+CacheDirectory = System.path.join(System.path.expanduser("~"), ".cache", "Bistable_Auxetic", "Flattening") # Flattened Meshes (One .npz file per Mesh and Boundary Settings)
 
-ClearScreen()
+def Timed(Timings, Stage, Function, *Arguments): # Runs a Stage of the Pipeline, adding its Time to Timings
 
-print("\nBistable Auxetic Flattening Algorithm:")
+    StageTime = Time()
+    Result = Function(*Arguments)
+    Timings[Stage] = Timings.get(Stage, 0) + Time() - StageTime
+    return Result
 
-print("\nPlease Select A Resolution (Defaults To #5): \n")
+def Areas(Vertices, Faces): # Norm of the Cross Product of two Edges of every Face (Twice the Area), in one batch
 
-for _ in range(len(Resolutions)): print(f"{_ + 1} | ({Resolutions[_]} By {Resolutions[_]} Pixels) -> {int(Resolutions[_] * Math.sqrt(3)) * Resolutions[_]} Triangles")
+    Vertices = Data.asarray(Vertices, dtype = Data.float64)[Data.asarray(Faces)]
 
-Resolution = input("\nResolution: ")
+    return Data.linalg.norm(Data.cross(Vertices[:, 1] - Vertices[:, 0], Vertices[:, 2] - Vertices[:, 0]), axis = 1)
 
-Resolution = Resolution if Resolution.isdigit() else 5
+def ExpansionSize(Thickness, Theta, CellSize = 50, JointWidth = 1):
 
-Resolution = Resolution if 0 < int(Resolution) <= 5 else 5
+    ParameterI = (((CellSize - (1.5 * Thickness) - (Sine(60) * Thickness / Tangent(60 - Theta))) / (1 + (Tangent(Theta) / Tangent(60 - Theta)))) / Cosine(Theta)) - JointWidth # Length of Each Auxetic Line (2.5 is Gap Width)
+    ParameterII = ((Sine(60) * Thickness) / Sine(60 - Theta)) + ((ParameterI + JointWidth) * Sine(Theta)) / Sine(60 - Theta)
+    Expansion = 2 * (ParameterI - ParameterII) * Sine(Theta + 30)
+    Expansion = 1 + (Expansion / CellSize)
+    return Expansion
 
-print("\033[A\033[A") 
-print("\033[A\033[A") 
-print(f"\nResolution: #{Resolution}")
+def ParameterPath(Step): # Thickness and Theta moved equally (Step) from Start, within their Limits
 
-Resolution = Resolutions[int(Resolution) - 1]
+    return Data.clip(Start[0] + Step, *Limits[0]), Data.clip(Start[1] + Step, *Limits[1])
 
-# -------- Main Program --------
+def InverseTable(Samples = 4096, CellSize = 50, JointWidth = 1): # Expansion along the Parameter Path, only where it decreases monotonically -> Steps, Expansions
 
-File = input("\nFile Path: ")
+    Steps = Data.linspace(min(Limits[0][0] - Start[0], Limits[1][0] - Start[1]), max(Limits[0][1] - Start[0], Limits[1][1] - Start[1]), Samples)
+    Expansions = ExpansionSize(*ParameterPath(Steps), CellSize, JointWidth)
+    First = int(Data.argmax(Expansions)) # Largest Expansion, Expansion decreases with every Step beyond it
 
-def Area(Points):
+    return Steps[First:], Expansions[First:]
 
-    VectorI = Data.array(Points[1]) - Data.array(Points[0])
-    VectorII = Data.array(Points[2]) - Data.array(Points[0])
-    Output = Data.cross(VectorI, VectorII)
-    Output = Data.linalg.norm(Output)
-    return Output
+def InverseExpansion(TargetExpansion, Table = None, Iterations = 4, CellSize = 50, JointWidth = 1): # Thickness and Theta of every cell for its Expansion (Lookup, refined by Newton Steps) -> Thickness, Theta, Residual
 
-def ExpansionSize(Thickness, Theta, CellSize = 50, JointWidth = 1):
+    Steps, Expansions = Table if Table != None else InverseTable(CellSize = CellSize, JointWidth = JointWidth)
+    Slopes = Data.gradient(Expansions, Steps)
+    TargetExpansion = Data.asarray(TargetExpansion, dtype = Data.float64)
+    Step = Data.interp(TargetExpansion, Expansions[::-1], Steps[::-1]) # Expansions are decreasing
 
-    ParameterI = (((CellSize - (1.5 * Thickness) - (Sine(60) * Thickness / Tangent(60 - Theta))) / (1 + (Tangent(Theta) / Tangent(60 - Theta)))) / Cosine(Theta)) - JointWidth # Length of Each Auxetic Line (2.5 is Gap Width)
-    ParameterII = ((Sine(60) * Thickness) / Sine(60 - Theta)) + ((ParameterI + JointWidth) * Sine(Theta)) / Sine(60 - Theta)
-    Expansion = 2 * (ParameterI - ParameterII) * Sine(Theta + 30)
-    Expansion = 1 + (Expansion / CellSize)
-    return Expansion
+    for _ in range(Iterations):
 
-def LossComponent(Thickness, Theta, CellSize = 50, JointWidth = 1):
-
-    ParameterI = Optimize.sin(Optimize.deg2rad(Optimize.tensor(60.0).to(Device))) # Sine (60)
-    ParameterII = Optimize.sin(Optimize.deg2rad(Theta)) # Sine (Theta)
-    ParameterIII = Optimize.cos(Optimize.deg2rad(Theta)) # Cosine (Theta)
-    ParameterIV = Optimize.tan(Optimize.deg2rad(Theta)) # Tangent (Theta)
-    ParameterV = Optimize.tan(Optimize.deg2rad(60.0 - Theta)) # Tangent (60 - Theta)
-    ParameterVI = Optimize.sin(Optimize.deg2rad(60.0 - Theta)) # Sine (60 - Theta)
-    ParameterVII = (((CellSize - (1.5 * Thickness) - (ParameterI * Thickness / ParameterV)) / (1 + (ParameterIV / ParameterV))) / ParameterIII) - JointWidth # Length of Each Auxetic Line (2.5 is Gap Width)
-    ParameterVIII = ((ParameterI * Thickness) / ParameterVI) + ((ParameterVII + JointWidth) * ParameterII) / ParameterVI
-    ParameterIX = Optimize.sin(Optimize.deg2rad(Theta + 30.0))
-    Expansion = 2 * (ParameterVII - ParameterVIII) * ParameterIX
-    Expansion = 1 + (Expansion / CellSize)
-    return Expansion
+        Step = Data.clip(Step - (ExpansionSize(*ParameterPath(Step), CellSize, JointWidth) - TargetExpansion) / Data.interp(Step, Steps, Slopes), Steps[0], Steps[-1])
+
+    Thickness, Theta = ParameterPath(Step)
+
+    return Thickness, Theta, ExpansionSize(Thickness, Theta, CellSize, JointWidth) - TargetExpansion # Residual is only large for Expansions out of reach
 
 # -------- Boundary First Flattening --------
 
-print("\nBoundary First Flattening:\n")
+def MeshKey(Vertices, Faces, Pinned = (0, 4), Scale = 0.0): # Hash of a Mesh and its Boundary Settings (Name of its Cache File)
 
-MeshSource = MeshOperations.mesh.load(File)
-Scale = MeshSource.vertices.create_attribute("scale_factor", float)
-Scale[MeshSource.boundary_vertices[0]] = 0
-Scale[MeshSource.boundary_vertices[4]] = 0
-BoundaryFirstFlattening = MeshOperations.parametrization.BoundaryFirstFlattening(MeshSource, bnd_scale_fctr = Scale, verbose = True)
-MeshSource = BoundaryFirstFlattening.run()
-MeshOperations.mesh.save(MeshSource, "Initial.obj")
-MeshOperations.mesh.save(BoundaryFirstFlattening.flat_mesh, "Target.obj")
+    Key = Hash.sha256(b"Boundary First Flattening, Version 1")
+    Key.update(Data.ascontiguousarray(Vertices, dtype = "<f8").tobytes())
+    Key.update(Data.ascontiguousarray(Faces, dtype = "<i8").tobytes())
+    Key.update(repr((tuple(int(_) for _ in Pinned), float(Scale))).encode("utf-8"))
+    return Key.hexdigest()
 
-# -------- Get Expansion And Scaling --------
+def LoadMesh(Source): # Vertices and Faces of an .obj file (Or of (Vertices, Faces) arrays)
 
-Target = Mesh.load("Target.obj")
-TargetFaces = Target.faces
-TargetVertices = Target.vertices
-TargetAreas = Data.array([Area(TargetVertices[Face]) for Face in TargetFaces])
+    if not isinstance(Source, str): return Data.asarray(Source[0], dtype = Data.float64), Data.asarray(Source[1], dtype = Data.int64)
 
-Initial = Mesh.load("Initial.obj")
-InitialFaces = Initial.faces
-InitialVertices = Initial.vertices
-InitialAreas = Data.array([Area(InitialVertices[Face]) for Face in InitialFaces])
+    import mouette as MeshOperations
 
-ExpansionFactors = Data.sqrt(InitialAreas / TargetAreas)
+    MeshSource = MeshOperations.mesh.load(Source)
 
-if min(ExpansionFactors) < 1: ExpansionFactors += (1 - min(ExpansionFactors))
+    return Data.array(MeshSource.vertices, dtype = Data.float64), Data.array(list(MeshSource.faces), dtype = Data.int64)
 
-# -------- Visualisation --------
+def BoundaryFirstFlattening(Vertices, Faces, Pinned = (0, 4), Scale = 0.0, Verbose = False): # Initial (Surface) and Target (Flat) Meshes -> ((Vertices, Faces), (Vertices, Faces))
 
-print("\nDistribution of Expansion:\n")
+    import mouette as MeshOperations
 
-Plot.rcParams["font.family"] = "Bell MT"
-StyleI.use(StyleII.styles.dracula)
-Plot.box(False)
-Plot.title("Expansion Factors")
-Plot.plot(ExpansionFactors, linewidth = 0.5)
-Plot.show()
+    MeshSource = MeshOperations.mesh.from_arrays(Vertices, F = Faces)
+    ScaleFactor = MeshSource.vertices.create_attribute("scale_factor", float)
 
-print("3D Expansion Heatmap:\n")
+    for Boundary in Pinned: ScaleFactor[MeshSource.boundary_vertices[Boundary]] = Scale
 
-StyleI.use('default')
-Plot.rcParams["font.family"] = ["Bell MT", "sans-serif"]
-Figure = Plot.figure()
-Graph = Plot.axes()
-Faces = Target.triangles_center
-Shifting = [-min(Target.triangles_center[:, _]) for _ in range(3)]
-#ExpansionFactors = 1.1 + ((ExpansionFactors - min(ExpansionFactors)) * 0.85 / (max(ExpansionFactors) - min(ExpansionFactors)))
-Faces = Faces + Shifting
-Scaling = min([Resolution / max(Faces[:, _]) for _ in range(2)])
-Faces = Faces * Scaling
-Values = Graph.tripcolor(*(Target.vertices[:, 0], Target.vertices[:, 1]), Target.faces, ExpansionFactors, alpha = 0.55, lw = 0)
-Graph.set_aspect('equal')
-Figure.colorbar(ScalarMappable(cmap = 'viridis', norm = Normalize(vmin = min(ExpansionFactors), vmax = max(ExpansionFactors))), ax = Graph)
-Plot.box(False)
-Plot.show()
-Faces = Faces * [Math.sqrt(3), 1, 1]
-StartTime = Time()
+    Flattening = MeshOperations.parametrization.BoundaryFirstFlattening(MeshSource, bnd_scale_fctr = ScaleFactor, verbose = Verbose)
+    MeshSource = Flattening.run()
 
-# -------- Optimize For .Baux File --------
+    return tuple((Data.array(_.vertices, dtype = Data.float64), Data.array(list(_.faces), dtype = Data.int64)) for _ in (MeshSource, Flattening.flat_mesh))
 
-Expansion = Data.zeros((int((Resolution + 1) * Math.sqrt(3)), int(Resolution + 1), 2))
+def CachedFlattening(Vertices, Faces, Pinned = (0, 4), Scale = 0.0, Cache = CacheDirectory, Verbose = False): # Boundary First Flattening, reusing the result for the same Mesh and Boundary Settings (No Cache if Cache is None) -> Initial, Target, Cached
 
-for _ in range(len(ExpansionFactors)): 
-    
-    Expansion[int(Faces[_][0]), int(Faces[_][1]), 1] += ExpansionFactors[_]
-    Expansion[int(Faces[_][0]), int(Faces[_][1]), 0] += 1
+    Path = System.path.join(Cache, f"{MeshKey(Vertices, Faces, Pinned, Scale)}.npz") if Cache != None else None
 
-print("Checking For Matching Points:\n")
+    if Path != None and System.path.exists(Path):
 
-def Optimized(TargetExpansion, LearningRate = 5e-2, Iterations = 1150, BatchSize = 64):
+        with Data.load(Path) as Source: return (Source["InitialVertices"], Source["InitialFaces"]), (Source["TargetVertices"], Source["TargetFaces"]), True
 
-    Thickness = Optimize.full((BatchSize,), 2.5, requires_grad = True, device = Device)
-    Theta = Optimize.full((BatchSize,), 5.5, requires_grad = True, device = Device)
-    Optimizer = Optimize.optim.Adam([Thickness, Theta], lr = LearningRate)
-    TargetValue = Optimize.tensor(TargetExpansion, dtype = Optimize.float32, device = Device)
+    Initial, Target = BoundaryFirstFlattening(Vertices, Faces, Pinned, Scale, Verbose)
 
-    for _ in range(Iterations):
+    if Path != None:
+
+        System.makedirs(Cache, exist_ok = True)
+        Data.savez(f"{Path}.tmp.npz", InitialVertices = Initial[0], InitialFaces = Initial[1], TargetVertices = Target[0], TargetFaces = Target[1])
+        System.replace(f"{Path}.tmp.npz", Path) # Never leave a partly written Cache File
+
+    return Initial, Target, False
+
+# -------- Expansion --------
+
+def ExpansionFactors(Initial, Target): # Linear Expansion of every Face from the Plane to the Surface (At least 1)
+
+    Factors = Data.sqrt(Areas(*Initial) / Areas(*Target))
+
+    if Factors.min() < 1: Factors += 1 - Factors.min()
+
+    return Factors
+
+def GridPlacement(Vertices, Resolution, CellSize = 50): # Flat Vertices scaled onto the Grid (Resolution Rows across the longer side) -> Positions, Dimension
+
+    Positions = Data.asarray(Vertices, dtype = Data.float64)[:, :2]
+    Positions = Positions - Positions.min(axis = 0)
+    Positions = Positions * (Resolution * Geometry.CellHeight(CellSize) / max(Positions.max(), 1e-12))
+    Extent = Positions.max(axis = 0)
+
+    return Positions, [int(Math.ceil(Extent[0] / CellSize + 0.5)), int(Math.ceil(Extent[1] / Geometry.CellHeight(CellSize))) + 1] # Rows 1 to Dimension[1] - 1 and Columns up to Dimension[0] - 0.5 are filled
+
+Cross = lambda A, B: A[..., 0] * B[..., 1] - A[..., 1] * B[..., 0] # Z Component of the Cross Product of 2D Vectors
 
-        Optimizer.zero_grad()
-        ExpansionBatch = LossComponent(Thickness, Theta)
-        Loss = Optimize.nn.functional.mse_loss(ExpansionBatch, TargetValue)
-        Loss.backward()
-        Optimizer.step()
-        Thickness.data.clamp_(1.5, 13.5)
-        Theta.data.clamp_(-5, 22.5)
-        if float(Optimize.max(Optimize.abs(ExpansionBatch - TargetValue))) <= 1e-3: break
-    
-    return Thickness.detach().cpu().numpy(), Theta.detach().cpu().numpy()
+def OverlapAreas(Subject, Clip): # Area of the intersection of pairs of triangles ((Pairs, 3, 2) each), Subject clipped by each edge of Clip (Sutherland-Hodgman) in one batch
 
-CellList = [(X, Y, Expansion[X, Y, 1] / Expansion[X, Y, 0]) for X in range(int(Resolution * Math.sqrt(3))) for Y in range(Resolution) if Expansion[X, Y, 0] != 0]
-BatchSize = 256
-Batches = [CellList[Index: Index + BatchSize] for Index in range(0, len(CellList), BatchSize)]
-DataExport = []
-Index = 0
-Error = 0
+    Polygon, Count = Subject, Data.full(len(Subject), 3)
+    Sign = Data.sign(Cross(Clip[:, 1] - Clip[:, 0], Clip[:, 2] - Clip[:, 0]))[:, None] # Inside is on the same side of every edge
 
-CellLength = Data.count_nonzero(Expansion[:, :, 0] != 0)
+    for Edge in range(3):
 
-for Batch in Batches:
+        Slots = Data.arange(Polygon.shape[1])
+        Valid = Slots < Count[:, None]
+        Following = Data.take_along_axis(Polygon, Data.where(Slots + 1 < Count[:, None], Slots + 1, 0)[..., None], axis = 1) # Next Vertex (The last Vertex is followed by the first)
+        Start, End = Clip[:, Edge, None], Clip[:, (Edge + 1) % 3, None]
+        Side, FollowingSide = Cross(End - Start, Polygon - Start) * Sign, Cross(End - Start, Following - Start) * Sign
+        Crossing = Valid & ((Side >= 0) != (FollowingSide >= 0))
+        Blend = (Side / Data.where(Crossing, Side - FollowingSide, 1))[..., None]
+        Output = Data.stack([Polygon, Polygon + Blend * (Following - Polygon)], axis = 2).reshape(len(Polygon), -1, 2) # Vertex, then the Intersection of the Edge leaving it
+        Kept = Data.stack([Valid & (Side >= 0), Crossing], axis = 2).reshape(len(Polygon), -1)
+        Order = Data.argsort(~Kept, axis = 1, kind = "stable")[:, :Polygon.shape[1] + 1] # Clipping by one Edge adds at most one Vertex
+        Polygon, Count = Data.take_along_axis(Output, Order[..., None], axis = 1), Kept.sum(axis = 1)
 
-    XBatch, YBatch, ExpansionBatch = zip(*Batch)
-    ExpansionBatch = Data.array(ExpansionBatch, dtype = Data.float32)
-    ThicknessBatch, ThetaBatch = Optimized(ExpansionBatch, BatchSize = len(ExpansionBatch))
+    Slots = Data.arange(Polygon.shape[1])
+    Following = Data.take_along_axis(Polygon, Data.where(Slots + 1 < Count[:, None], Slots + 1, 0)[..., None], axis = 1)
 
-    for _ in range(len(Batch)):
+    return Data.abs(Data.where(Slots < Count[:, None], Cross(Polygon, Following), 0).sum(axis = 1)) / 2
 
-        Index += 1
-        X, Y, Thickness, Theta = XBatch[_], YBatch[_], ThicknessBatch[_], ThetaBatch[_]
-        Loss = float(ExpansionSize(Thickness, Theta) - ExpansionBatch[_])
-        if abs(Loss) >= 1e-3: Error += 1
-        print(f"Index: {Index} / {CellLength}, Grid Cell: ({X}, {Y}), Expansion: {ExpansionBatch[_]:.3f}, Loss: {Loss:.3f}")
-        DataExport.append([[int(X + 1), int(Y + 1)], float(round(Thickness, 3)), float(round(Theta, 3))])
+def RasterizeFaces(Positions, Faces, Values, Dimension, CellSize = 50, Chunk = 1 << 18): # Area of every Face in each Grid Cell, and the Area-weighted sum of the Values of the Faces -> Covered Areas, Sums (Indexed [Y][X])
 
-EndTime = Time()
+    Triangles = Positions[Data.asarray(Faces)]
+    Shape = (Dimension[1] + 1, 2 * Dimension[0])
+    Exists = Geometry.CellExistence(Dimension)
+    IndexX, IndexY = Geometry.CellIndex(Triangles[..., 0], Triangles[..., 1], CellSize) # Cell of each Vertex
+    Whole = (IndexX == IndexX[:, :1]).all(axis = 1) & (IndexY == IndexY[:, :1]).all(axis = 1) # Faces inside a single cell (Most Faces of fine Meshes) overlap it entirely
+    Whole &= (0 <= IndexY[:, 0]) & (IndexY[:, 0] < Shape[0]) & (0 <= IndexX[:, 0]) & (IndexX[:, 0] < Shape[1])
+    Cells = IndexY[Whole, 0] * Shape[1] + IndexX[Whole, 0]
+    Overlap = Data.abs(Cross(Triangles[Whole, 1] - Triangles[Whole, 0], Triangles[Whole, 2] - Triangles[Whole, 0])) / 2 * Exists.ravel()[Cells]
+    Covered, Sums = Data.zeros(Shape[0] * Shape[1]), Data.zeros(Shape[0] * Shape[1])
+    Covered += Data.bincount(Cells, Overlap, minlength = len(Covered))
+    Sums += Data.bincount(Cells, Overlap * Data.asarray(Values)[Whole], minlength = len(Sums))
+    Triangles, Values = Triangles[~Whole], Data.asarray(Values)[~Whole]
+    Height = Geometry.CellHeight(CellSize)
+    Rows = Data.floor(Triangles[..., 1] / Height).astype(Data.int64) + 1 # Cells overlapping the bounds of each Face (Each Row of the Grid is a bucket of cells)
+    Columns = Data.floor(Triangles[..., 0] / (CellSize / 2)).astype(Data.int64)
+    FirstRow, FirstColumn = Rows.min(axis = 1), Columns.min(axis = 1)
+    Width = Columns.max(axis = 1) + 2 - FirstColumn
+    Candidates = (Rows.max(axis = 1) + 1 - FirstRow) * Width
+    Bounds = Data.unique(Data.searchsorted(Data.cumsum(Candidates), Data.arange(Chunk, Candidates.sum() + Chunk, Chunk), side = "right")) # Faces of each Chunk of Candidate Pairs (Remaining Faces are clipped by every cell near them)
+    Bounds = Bounds[Bounds > 0] # A Face with more Candidates than a Chunk is a Chunk of its own (Each Face is in exactly one Chunk)
 
-Error = (Error / CellLength) * 100
+    for First, Last in zip(Data.concatenate([[0], Bounds[:-1]]), Bounds):
 
-print(f"\nError Percentage {Error:.5f}%")
+        Face = Data.repeat(Data.arange(First, Last), Candidates[First:Last])
+        Local = Data.arange(len(Face)) - Data.repeat(Data.cumsum(Candidates[First:Last]) - Candidates[First:Last], Candidates[First:Last])
+        IndexY, IndexX = FirstRow[Face] + Local // Width[Face], FirstColumn[Face] + Local % Width[Face]
+        Inside = (0 <= IndexY) & (IndexY < Shape[0]) & (0 <= IndexX) & (IndexX < Shape[1])
+        Face, IndexX, IndexY = Face[Inside], IndexX[Inside], IndexY[Inside]
+        Inside = Exists[IndexY, IndexX]
+        Face, IndexX, IndexY = Face[Inside], IndexX[Inside], IndexY[Inside]
+        Overlap = OverlapAreas(Triangles[Face], Geometry.CellCorners(Geometry.CellOrigins(IndexX, IndexY, CellSize), Geometry.CellReversal(IndexX, IndexY), CellSize))
+        Cells = IndexY * Shape[1] + IndexX
+        Covered += Data.bincount(Cells, Overlap, minlength = len(Covered))
+        Sums += Data.bincount(Cells, Overlap * Values[Face], minlength = len(Sums))
 
-print(f"\nTotal Time: {(EndTime - StartTime):.5f} Seconds")
+    return Covered.reshape(Shape), Sums.reshape(Shape)
 
-# -------- Saving Data To File --------
+def ExpansionCells(Covered, Sums, Coverage = 0.5, CellSize = 50): # Cells covered by the flattened Mesh (At least Coverage of their Area) -> Index X, Index Y, Area-weighted Expansion
 
-FileName = input("\nFile Name: ")
+    IndexY, IndexX = Data.nonzero(Covered >= Coverage * CellSize * Geometry.CellHeight(CellSize) / 2)
 
-print("\033[A\033[A") 
+    return IndexX, IndexY, Sums[IndexY, IndexX] / Covered[IndexY, IndexX]
 
-print(f"File Name: {FileName}.baux\n")
+def FlattenDesign(Source, Resolution = 30, Name = "Design", Pinned = (0, 4), Scale = 0.0, Cache = CacheDirectory, Verbose = False, Coverage = 0.5): # Design for a Surface (.obj file, or (Vertices, Faces) arrays) -> Design, Report
 
-FileManage.dump(({
-    "Name": FileName, 
-    "Cell Size": 50, 
-    "Grid Size": [int(Resolution * Math.sqrt(3)), Resolution], 
-    "Data": DataExport,
-}), open(f"{FileName}.baux", "w"))
+    Timings = {}
+    Vertices, Faces = Timed(Timings, "Loading Mesh", LoadMesh, Source)
+    Initial, Target, Cached = Timed(Timings, "Boundary First Flattening", CachedFlattening, Vertices, Faces, Pinned, Scale, Cache, Verbose)
+    Factors = Timed(Timings, "Triangle Areas", ExpansionFactors, Initial, Target)
+    Positions, Dimension = GridPlacement(Target[0], Resolution)
+    Covered, Sums = Timed(Timings, "Rasterization", RasterizeFaces, Positions, Target[1], Factors, Dimension)
+    X, Y, Expansions = Timed(Timings, "Cell List", ExpansionCells, Covered, Sums, Coverage)
+    Thickness, Theta, Residuals = Timed(Timings, "Inverse Expansion", InverseExpansion, Expansions) # Every cell in one call
+
+    Design = Format.Design(Name, 50, Dimension, len(X), (Data.column_stack([X, Y]).astype(Data.int32),
+    Data.round(Thickness, 3).astype(Data.float32), Data.round(Theta, 3).astype(Data.float32)))
+
+    return Design, {"Cells": len(X), "Cached": Cached, "Error": 100 * float(Data.mean(Data.abs(Residuals) >= 1e-3)) if len(X) else 0.0,
+    "Largest Loss": float(Data.abs(Residuals).max()) if len(X) else 0.0, "Timings": Timings,
+    "Factors": Factors, "Target": Target, "Cell Expansions": (X, Y, Expansions, Residuals)}
+
+def PlotExpansion(Report): # Distribution of Expansion, and a Heatmap of it over the flattened Mesh (Needs matplotlib and matplotx)
+
+    import matplotlib.pyplot as Plot
+    from matplotlib import style as StyleI
+    import matplotx as StyleII
+    from matplotlib.cm import ScalarMappable
+    from matplotlib.colors import Normalize
+
+    Factors, (Vertices, Faces) = Report["Factors"], Report["Target"]
+    Plot.rcParams["font.family"] = "Bell MT"
+    StyleI.use(StyleII.styles.dracula)
+    Plot.box(False)
+    Plot.title("Expansion Factors")
+    Plot.plot(Factors, linewidth = 0.5)
+    Plot.show()
+    StyleI.use('default')
+    Plot.rcParams["font.family"] = ["Bell MT", "sans-serif"]
+    Figure = Plot.figure()
+    Graph = Plot.axes()
+    Graph.tripcolor(Vertices[:, 0], Vertices[:, 1], Faces, Factors, alpha = 0.55, lw = 0)
+    Graph.set_aspect('equal')
+    Figure.colorbar(ScalarMappable(cmap = 'viridis', norm = Normalize(vmin = Factors.min(), vmax = Factors.max())), ax = Graph)
+    Plot.box(False)
+    Plot.show()
+
+# -------- Command Line Interface --------
+
+def Main(Arguments = None):
+
+    Parser = ArgumentParse.ArgumentParser(description = "Create a Bistable Auxetic Design (.baux) that deploys into a surface (.obj).")
+    Parser.add_argument("Path", help = "Surface to flatten (.obj)")
+    Parser.add_argument("-o", "--output", default = None, help = "Output file (Defaults to the name of the surface, as .baux)")
+    Parser.add_argument("-r", "--resolution", type = int, default = 30, help = "Rows of cells across the longer side of the flattened surface (Defaults to 30)")
+    Parser.add_argument("--coverage", type = float, default = 0.5, help = "Fraction of a cell the flattened surface must cover to include it (Defaults to 0.5)")
+    Parser.add_argument("--pinned", type = int, nargs = "*", default = [0, 4], help = "Boundary vertices with a fixed scale factor (Defaults to 0 4)")
+    Parser.add_argument("--boundary-scale", type = float, default = 0.0, help = "Scale factor of the pinned boundary vertices (Defaults to 0)")
+    Parser.add_argument("--cache", default = CacheDirectory, help = "Directory of cached flattenings")
+    Parser.add_argument("--no-cache", action = "store_true", help = "Always flatten the surface again")
+    Parser.add_argument("--plot", action = "store_true", help = "Show the distribution of expansion (Needs matplotlib)")
+    Parser.add_argument("-v", "--verbose", action = "store_true", help = "Report the flattening and the loss of every cell")
+    Arguments = Parser.parse_args(Arguments)
+
+    Destination = Arguments.output if Arguments.output != None else f"{System.path.splitext(Arguments.Path)[0]}.baux"
+    Name = System.path.splitext(System.path.basename(Destination))[0]
+    Design, Report = FlattenDesign(Arguments.Path, Arguments.resolution, Name, Arguments.pinned, Arguments.boundary_scale, None if Arguments.no_cache else Arguments.cache, Arguments.verbose, Arguments.coverage)
+
+    if Arguments.verbose:
+
+        for Index, (X, Y, Expansion, Loss) in enumerate(zip(*(_.tolist() for _ in Report["Cell Expansions"]))): print(f"Index: {Index + 1} / {Report['Cells']}, Grid Cell: ({X}, {Y}), Expansion: {Expansion:.3f}, Loss: {Loss:.3f}")
+
+    if Arguments.plot: PlotExpansion(Report)
+
+    Format.SaveDesign(Destination, Design)
+    print(f"{Arguments.Path} -> {Destination} ({Report['Cells']} Cells{', Cached Flattening' if Report['Cached'] else ''}), Error Percentage {Report['Error']:.5f}%, Largest Loss: {Report['Largest Loss']:.5f}")
+
+    for Stage, StageTime in Report["Timings"].items(): print(f"{Stage}: {StageTime:.5f} Seconds")
+
+    return 0
+
+if __name__ == "__main__": ArgumentManage.exit(Main())
@@ -0,0 +1,239 @@
+#
+# Bistable Auxetic Benchmark - Developed By Dinuk Wijesiri
+#
+# Overview:
+#
+# Times the hot paths of the studio and the flattening tool on synthetic
+# grids (10 x 10 up to 500 x 500 cells) and synthetic meshes, without a
+# window: pygame runs on the SDL dummy video driver and Tkinter is never
+# started (Frames are drawn directly instead of being scheduled).
+#
+# Stages: Grid Build, Render (Full Canvas), Render (Dirty Cells), Auxetics
+# (Drawing the cuts of every cell on the Canvas), Hit Test, Export (SVG),
+# Load (Version 1 JSON and Version 2 Binary .baux), Flattening Areas,
+# Rasterization (Binning of faces onto cells) and Inverse Expansion.
+#
+# Each stage is run several times and its fastest Wall Time is kept, then
+# run once more under tracemalloc for its Peak Memory (Python and NumPy
+# allocations). Results are written to a JSON file, and compared against
+# a stored Baseline, so regressions stand out.
+#
+# Usage: python Bistable_Auxetic_Benchmark.py -o Results.json --baseline Baseline.json
+#
+
+# --------- Imports ---------
+
+import os as System # Headless Video Driver and Temporary Files
+import sys as ArgumentManage # Manage Arguments (External)
+import json as FileManage # Results and Baselines
+import argparse as ArgumentParse # Command Line Arguments
+import platform as Platform # Machine of the Results
+import tempfile as Temporary # Exported and Saved Files
+import tracemalloc as MemoryTrace # Peak Memory of each Stage
+from time import perf_counter as Time # Wall Time of each Stage
+
+System.environ.setdefault("SDL_VIDEODRIVER", "dummy") # Set before pygame is imported (No Window)
+System.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import numpy as Data # Synthetic Grids and Meshes
+import pygame as RenderEngine # Off-screen Rendering
+import Bistable_Auxetic_Geometry as Geometry # Vectorized Auxetic Geometry Kernel
+import Bistable_Auxetic_Format as Format # Reading and Writing .baux files (JSON or Binary)
+import Bistable_Auxetic_Surface_Studio as Studio # Grid, GridCell (Rendering and Hit Testing)
+
+ArgumentManage.path.append(System.path.join(System.path.dirname(System.path.abspath(__file__)), "..", "Experimental"))
+
+import Bistable_Auxetic_Flattening as Flattening # Flattening Stages
+
+# --------- Utilities (Functions) ---------
+
+Sizes = [10, 50, 100, 250, 500] # Synthetic Grids (Dimension[0] x Dimension[1] Cells)
+
+MeshSizes = [50, 200, 600] # Synthetic Meshes (Vertices along each side, 2 x (Size - 1) ** 2 Faces)
+
+class Scheduler: # Stands in for the Tkinter Window (Frames are drawn by the Benchmark, never scheduled)
+
+    after = after_idle = lambda Module, *Arguments: None
+    after_cancel = lambda Module, *Arguments: None
+
+class Interface: # Stands in for the Studio GUI (Scrolling Events are not benchmarked)
+
+    AdjustOffset = lambda Module, *Arguments: None
+
+def HeadlessStudio(Screen = (1600, 900)): # Sets up the Globals the Studio creates with its Window (CreateGUIWindow)
+
+    RenderEngine.display.init()
+    Studio.ScreenObject = RenderEngine.display.set_mode(Screen)
+    Studio.WindowRendering = Scheduler()
+    Studio.OffSet = [0, 0]
+    Studio.CanvasFocus = True
+
+def SyntheticArrays(Size, Seed = 0): # Thickness, Theta and Selection of a Size x Size Grid, every cell Selected with Parameters from a handful of values (as in real Designs)
+
+    Generator = Data.random.default_rng(Seed)
+    Exists = Geometry.CellExistence([Size, Size])
+    Thickness = Generator.choice(Data.float32([3, 4, 5, 6, 7]), Exists.shape) * Exists
+    Theta = Generator.choice(Data.float32([2.5, 5, 10, 15, 20]), Exists.shape) * Exists
+
+    return Thickness.astype(Data.float32), Theta.astype(Data.float32), Exists.copy()
+
+def SyntheticDesign(Size, Seed = 0): # Design of a Synthetic Grid
+
+    return Format.DesignFromGrid(f"Benchmark_{Size}", 50, *SyntheticArrays(Size, Seed))
+
+def SyntheticMesh(Size): # Surface (Initial) and its Flattening (Target) on a Size x Size Grid of Vertices, Flattened by dropping the Height
+
+    X, Y = Data.meshgrid(Data.linspace(0, 1, Size), Data.linspace(0, 1, Size))
+    Vertices = Data.stack([X.ravel(), Y.ravel(), (0.4 * Data.sin(3 * X) * Data.cos(2 * Y)).ravel()], axis = 1)
+    Index = (Data.arange(Size - 1)[None, :] + Size * Data.arange(Size - 1)[:, None]).ravel()
+    Faces = Data.concatenate([Data.stack([Index, Index + 1, Index + Size], axis = 1), Data.stack([Index + 1, Index + Size + 1, Index + Size], axis = 1)])
+    Flat = Vertices * [1, 1, 0]
+
+    return (Vertices, Faces), (Flat, Faces)
+
+def Measure(Function, Setup = None, Repeat = 3): # Fastest Wall Time of Function(*Setup()) and its Peak Memory -> Time (Seconds), Peak Memory (Bytes)
+
+    Times = []
+
+    for _ in range(Repeat):
+
+        Arguments = Setup() if Setup != None else ()
+        StartTime = Time()
+        Function(*Arguments)
+        Times.append(Time() - StartTime)
+
+    Arguments = Setup() if Setup != None else ()
+    MemoryTrace.start()
+    Function(*Arguments)
+    Peak = MemoryTrace.get_traced_memory()[1]
+    MemoryTrace.stop()
+
+    return min(Times), Peak
+
+def GridStages(Size, Directory): # Stages of the Studio on a Size x Size Grid -> {Stage: Setup, Function}
+
+    Design = SyntheticDesign(Size)
+    Built = lambda: Studio.Grid(Interface(), 50, Design, [Size, Size])
+    Rendered = lambda: Rendering(Built())
+    Positions = Data.random.default_rng(1).uniform([0, 0], [Size * 50, Size * Geometry.CellHeight(50)], (10000, 2))
+    Edited = Data.argwhere(Design.GridArrays()[2])[::max(Size * Size // 100, 1), ::-1][:100] # About 100 cells spread over the Grid
+
+    def Rendering(Application):
+
+        Application.RenderGrid()
+        return (Application,)
+
+    def Redraw(Application):
+
+        Application.SetValues(Edited, 6.5, 12.5)
+        Application.RenderDirty()
+
+    def Auxetics(Application):
+
+        Application.Geometry = None
+        Application.CanvasGeometry()
+        [Cell.Auxetics(Application.Canvas, Application.CanvasShift) for Cell in Application.Cells(*Application.CanvasRange) if Application.Selected[Cell.Index[1], Cell.Index[0]]]
+
+    Paths = {Version: System.path.join(Directory, f"Benchmark_{Size}_v{Version}.baux") for Version in (1, 2)}
+
+    for Version, Path in Paths.items(): Format.SaveDesign(Path, Design, Version)
+
+    return {
+    "Grid Build": (None, Built),
+    "Render (Full Canvas)": (lambda: (Built(),), lambda Application: Application.RenderGrid()),
+    "Render (Dirty Cells)": (Rendered, Redraw),
+    "Auxetics": (Rendered, Auxetics),
+    "Hit Test": (lambda: (Built(),), lambda Application: [Application.CellAt(_) for _ in Positions.tolist()]),
+    "Export (SVG)": (lambda: (Built(),), lambda Application: Application.ExportSVG(System.path.join(Directory, "Benchmark.svg"))),
+    "Load (Version 1)": (None, lambda: Format.LoadDesign(Paths[1]).GridArrays()),
+    "Load (Version 2)": (None, lambda: Format.LoadDesign(Paths[2]).GridArrays())}
+
+def MeshStages(Size): # Stages of the Flattening Tool on a Synthetic Mesh -> {Stage: Setup, Function}
+
+    Initial, Target = SyntheticMesh(Size)
+    Factors = Flattening.ExpansionFactors(Initial, Target)
+    Positions, Dimension = Flattening.GridPlacement(Target[0], 100)
+    Covered, Sums = Flattening.RasterizeFaces(Positions, Target[1], Factors, Dimension)
+    Expansions = Flattening.ExpansionCells(Covered, Sums)[2]
+
+    return {
+    "Flattening Areas": (None, lambda: Flattening.ExpansionFactors(Initial, Target)),
+    "Rasterization": (None, lambda: Flattening.RasterizeFaces(Positions, Target[1], Factors, Dimension)),
+    "Inverse Expansion": (None, lambda: Flattening.InverseExpansion(Expansions))}
+
+def RunBenchmarks(Sizes = Sizes, MeshSizes = MeshSizes, Repeat = 3, Stages = None, Report = None): # Every Stage at every Size -> {"Stage | Size": {"Time", "Peak Memory"}}
+
+    HeadlessStudio()
+    Results = {}
+
+    with Temporary.TemporaryDirectory() as Directory:
+
+        Cases = [(f"{Size} x {Size}", lambda Size = Size: GridStages(Size, Directory)) for Size in Sizes] + [(f"{2 * (Size - 1) ** 2} Faces", lambda Size = Size: MeshStages(Size)) for Size in MeshSizes]
+
+        for Name, Case in Cases:
+
+            for Stage, (Setup, Function) in Case().items():
+
+                if Stages != None and Stage not in Stages: continue
+
+                Results[f"{Stage} | {Name}"] = dict(zip(("Time", "Peak Memory"), Measure(Function, Setup, Repeat)))
+
+                if Report != None: Report(f"{Stage} | {Name}", Results[f"{Stage} | {Name}"])
+
+    return Results
+
+def CompareResults(Results, Baseline, Tolerance = 1.25): # Ratio of each Result to the Baseline -> [(Key, Time Ratio, Memory Ratio, Regressed)]
+
+    Comparison = []
+
+    for Key, Result in Results.items():
+
+        if Key not in Baseline: continue
+
+        TimeRatio = Result["Time"] / max(Baseline[Key]["Time"], 1e-9)
+        MemoryRatio = Result["Peak Memory"] / max(Baseline[Key]["Peak Memory"], 1)
+        Comparison.append((Key, TimeRatio, MemoryRatio, TimeRatio > Tolerance or MemoryRatio > Tolerance))
+
+    return Comparison
+
+# --------- Command Line Interface ---------
+
+def Main(Arguments = None):
+
+    Parser = ArgumentParse.ArgumentParser(description = "Benchmark the hot paths of Bistable Auxetic Studio headless (No Window).")
+    Parser.add_argument("-o", "--output", default = "Benchmark_Results.json", help = "Results file (Defaults to Benchmark_Results.json)")
+    Parser.add_argument("--baseline", default = None, help = "Results of an earlier run to compare against")
+    Parser.add_argument("--save-baseline", action = "store_true", help = "Write the results to the baseline file instead of comparing")
+    Parser.add_argument("--sizes", type = int, nargs = "*", default = Sizes, help = "Grid sizes (Defaults to 10 50 100 250 500)")
+    Parser.add_argument("--mesh-sizes", type = int, nargs = "*", default = MeshSizes, help = "Vertices along each side of the synthetic meshes (Defaults to 50 200 600)")
+    Parser.add_argument("--stages", nargs = "*", default = None, help = "Only run these stages, e.g. \"Grid Build\" \"Hit Test\"")
+    Parser.add_argument("--repeat", type = int, default = 3, help = "Runs of each stage, the fastest is kept (Defaults to 3)")
+    Parser.add_argument("--tolerance", type = float, default = 1.25, help = "Ratio to the baseline reported as a regression (Defaults to 1.25)")
+    Arguments = Parser.parse_args(Arguments)
+
+    Results = RunBenchmarks(Arguments.sizes, Arguments.mesh_sizes, Arguments.repeat, Arguments.stages,
+    lambda Key, Result: print(f"{Key}: {Result['Time']:.5f} Seconds, {Result['Peak Memory'] / 2 ** 20:.2f} MB"))
+    Machine = {"Platform": Platform.platform(), "Processor": Platform.processor(), "Python": Platform.python_version(), "NumPy": Data.__version__, "Pygame": RenderEngine.version.ver}
+    Destination = Arguments.baseline if Arguments.save_baseline and Arguments.baseline != None else Arguments.output
+
+    with open(Destination, "w", encoding = "utf-8") as FileSource: FileManage.dump({"Machine": Machine, "Results": Results}, FileSource, indent = 1)
+
+    print(f"\nResults -> {Destination}")
+
+    if Arguments.save_baseline or Arguments.baseline == None or not System.path.exists(Arguments.baseline): return 0
+
+    with open(Arguments.baseline, "r", encoding = "utf-8") as FileSource: Baseline = FileManage.load(FileSource)
+
+    if Baseline["Machine"] != Machine: print("Warning: The baseline was recorded on another machine or version")
+
+    Comparison = CompareResults(Results, Baseline["Results"], Arguments.tolerance)
+
+    print(f"\nCompared to {Arguments.baseline} (Time, Memory):\n")
+
+    for Key, TimeRatio, MemoryRatio, Regressed in Comparison: print(f"{'Regression: ' if Regressed else ''}{Key}: {TimeRatio:.2f}x, {MemoryRatio:.2f}x")
+
+    Regressions = sum(_[3] for _ in Comparison)
+    print(f"\n{Regressions} / {len(Comparison)} Stages regressed.\n")
+    return 1 if Regressions else 0
+
+if __name__ == "__main__": ArgumentManage.exit(Main())
@@ -0,0 +1,208 @@
+#
+# Bistable Auxetic Export - Developed By Dinuk Wijesiri
+#
+# Overview:
+#
+# Headless conversion of .baux designs into .svg files for lasercutting.
+# Uses the same geometry as the studio, without Tkinter, PyGame or Ctypes,
+# so designs can be exported on render nodes. Directories are spread
+# across a process pool.
+#
+# Each layer (Outline and Auxetics) is written as a single <path>, with
+# absolute moves, relative line segments and coordinates rounded to a
+# fixed number of decimals. Geometry is computed and written a block of
+# rows at a time, so memory does not grow with the size of the design.
+# With --optimize, edges are deduplicated, joined and ordered for the
+# laser (See Bistable_Auxetic_Toolpath), which needs the whole design
+# in memory, and the Auxetics are cut before the Outline.
+#
+# Usage: python Bistable_Auxetic_Export.py Design.baux Designs/ -o Exports/ -j 8 --precision 3 --optimize
+#
+
+# --------- Imports ---------
+
+import os as System # Basic System Commands
+import sys as ArgumentManage # Manage Arguments (External)
+import argparse as ArgumentParse # Command Line Arguments
+from concurrent.futures import ProcessPoolExecutor as ProcessPool # Parallel Conversion of Designs
+from time import perf_counter as Time # Conversion Timing
+import numpy as Data # Quantizing Coordinates
+import Bistable_Auxetic_Geometry as Geometry # Vectorized Auxetic Geometry Kernel
+import Bistable_Auxetic_Format as Format # Reading .baux files (JSON or Binary)
+import Bistable_Auxetic_Toolpath as Toolpath # Laser Path Optimization
+
+# --------- Utilities (Functions) ---------
+
+def NumberText(Value, Precision = 3): # Quantized integer as compact decimal text (12500 -> "12.5", -500 -> "-.5" with 3 Decimals)
+
+    Text = f"{abs(Value) / 10 ** Precision:.{Precision}f}".rstrip("0").rstrip(".") if Precision > 0 else str(abs(Value))
+    Text = Text[1:] if Text.startswith("0.") else Text
+    return ("-" if Value < 0 and Text != "0" else "") + Text
+
+JoinNumbers = lambda Tokens: Tokens[0] + "".join(_ if _[0] == "-" else " " + _ for _ in Tokens[1:]) # Negative Numbers need no Separator
+
+def PathTexts(Polylines, Precision = 3, Numbers = None): # Path data of each Polyline of an array (Lines, Points, 2), Each is "M" (Absolute Start) followed by "l" (Relative Segments)
+
+    Numbers = Numbers if Numbers != None else {} # Text of each Quantized Number and Segment (Shared between calls, Cells repeat the same Segments)
+
+    if len(Numbers) > 65536: Numbers.clear()
+
+    Quantized = Data.rint(Data.asarray(Polylines, dtype = Data.float64) * 10 ** Precision).astype(Data.int64) # Rounded once, so Relative Segments do not accumulate Error
+    Quantized[:, 1:] = Data.diff(Quantized, axis = 1)
+    Text = []
+
+    for Values in Quantized.reshape(len(Quantized), -1).tolist():
+
+        Segments = tuple(Values[2:])
+
+        if Segments not in Numbers: Numbers[Segments] = "l" + JoinNumbers([NumberText(_, Precision) for _ in Segments])
+
+        Tokens = [Numbers[_] if _ in Numbers else Numbers.setdefault(_, NumberText(_, Precision)) for _ in Values[:2]]
+        Text.append("M" + JoinNumbers(Tokens) + Numbers[Segments])
+
+    return Text
+
+PathData = lambda Polylines, Precision = 3, Numbers = None: "".join(PathTexts(Polylines, Precision, Numbers)) # Path data of all Polylines (Subpaths of one <path>)
+
+def LayerPolylines(Layer, GridGeometry): # Polylines of a Layer ("Outline" Edges or "Auxetics" Cuts) from Geometry arrays
+
+    Indices, Corners, Cuts, Outlines = GridGeometry[:4]
+
+    return Corners[:, Geometry.OutlineEdges][Outlines] if Layer == "Outline" else Cuts.reshape(-1, 3, 2)
+
+def LayerBlocks(Layer, Thickness, Theta, Selected, CellSize, JointWidth = 3, Cache = None, BlockSize = 16384): # Polylines of a Layer, one block of Rows (About BlockSize cells) at a time
+
+    Rows = max(BlockSize // Selected.shape[1], 1)
+
+    for Start in range(0, Selected.shape[0], Rows):
+
+        yield LayerPolylines(Layer, Geometry.BlockGeometry(Thickness, Theta, Selected, slice(Start, Start + Rows), slice(None), CellSize, JointWidth, Cache))
+
+def WriteSVG(Destination, Dimension, CellSize, Thickness, Theta, Selected, Precision = 3, Optimize = False, BlockSize = 16384, JointWidth = 3): # Stream a Grid (Indexed [Y][X]) to an .svg file, One <path> per Layer, Returns the Toolpath Report if Optimized
+
+    Cache, Numbers, Report = Geometry.GeometryCache(CellSize, JointWidth), {}, None
+    Layers = ["Auxetics", "Outline"] if Optimize else ["Outline", "Auxetics"] # Inner Cuts first, so the part does not move before they are cut
+    Blocks = [LayerBlocks(Layer, Thickness, Theta, Selected, CellSize, JointWidth, Cache, BlockSize) for Layer in Layers]
+
+    if Optimize:
+
+        Blocks, Report = Toolpath.OptimizePaths([Data.concatenate(list(_)) for _ in Blocks], Precision)
+        Blocks = [[_[None] for _ in Paths] for Paths in Blocks] # Polylines have different Lengths
+
+    WriteLayers(Destination, Dimension, CellSize, Layers, [(PathData(Block, Precision, Numbers) for Block in Polylines) for Polylines in Blocks], Precision)
+    return Report
+
+def WriteLayers(Destination, Dimension, CellSize, Layers, Texts, Precision = 3): # Write an .svg file with one <path> per Layer, from an iterable of Path data Texts for each Layer
+
+    Size = [NumberText(int(round(_ * 10 ** Precision)), Precision) for _ in (Dimension[0] * CellSize, Dimension[1] * Geometry.CellHeight(CellSize))]
+
+    with open(Destination, "w", encoding = "utf-8") as FileSource:
+
+        FileSource.write(f'<?xml version="1.0" encoding="UTF-8"?>\n<svg xmlns="http://www.w3.org/2000/svg" width="{Size[0]}" height="{Size[1]}" viewBox="0 0 {Size[0]} {Size[1]}">\n')
+
+        for Layer, Text in zip(Layers, Texts):
+
+            FileSource.write(f'<path id="{Layer}" fill="none" stroke="black" d="')
+
+            for _ in Text: FileSource.write(_)
+
+            FileSource.write('"/>\n')
+
+        FileSource.write("</svg>\n")
+
+    return Destination
+
+def CellFragments(Thickness, Theta, Selected, IndexX, IndexY, CellSize = 50, Precision = 3, JointWidth = 3, Cache = None, Numbers = None): # Path data of listed (Selected) cells of a Grid -> [(Outline, Auxetics)] per Cell
+
+    IndexX, IndexY = Data.asarray(IndexX, dtype = Data.int64), Data.asarray(IndexY, dtype = Data.int64)
+    Cuts, Outlines, Keys = Geometry.CellGeometry(Thickness, Theta, Selected, IndexX, IndexY, CellSize, JointWidth, Cache)
+    Corners = Geometry.CellCorners(Geometry.CellOrigins(IndexX, IndexY, CellSize), Geometry.CellReversal(IndexX, IndexY), CellSize)
+    Edges = PathTexts(Corners[:, Geometry.OutlineEdges][Outlines], Precision, Numbers) if Outlines.any() else []
+    Cuts = PathTexts(Cuts.reshape(-1, 3, 2), Precision, Numbers) if len(Cuts) else []
+    Offsets = [0] + Data.cumsum(Outlines.sum(axis = 1)).tolist() # Edges of each Cell
+
+    return [("".join(Edges[Offsets[Cell]:Offsets[Cell + 1]]), "".join(Cuts[3 * Cell:3 * Cell + 3])) for Cell in range(len(IndexX))]
+
+def WriteFragments(Destination, Dimension, CellSize, Fragments, Precision = 3): # Write an .svg file from the (Outline, Auxetics) Path data of each Cell, Same output as WriteSVG
+
+    return WriteLayers(Destination, Dimension, CellSize, ["Outline", "Auxetics"], [(_[0] for _ in Fragments), (_[1] for _ in Fragments)], Precision)
+
+def ConvertDesign(Source, Destination, CellSize = None, Precision = 3, Optimize = False): # Convert a single .baux file (Runs inside Worker Processes)
+
+    StartTime = Time()
+    Design = Format.LoadDesign(Source)
+    Report = WriteSVG(Destination, Design.Dimension, CellSize if CellSize != None else Design.CellSize, *Design.GridArrays(), Precision, Optimize)
+    return Destination, Time() - StartTime, Report
+
+def CollectDesigns(Paths, OutputDirectory = None): # Pairs of (.baux, .svg) paths from files and directories
+
+    Jobs = []
+
+    for Path in Paths:
+
+        Sources = sorted(System.path.join(Path, _) for _ in System.listdir(Path) if _.endswith(".baux")) if System.path.isdir(Path) else [Path]
+
+        for Source in Sources:
+
+            Name = System.path.splitext(System.path.basename(Source))[0] + ".svg"
+            Jobs.append((Source, System.path.join(OutputDirectory if OutputDirectory != None else System.path.dirname(Source), Name)))
+
+    return Jobs
+
+def ConvertDesigns(Jobs, Workers = None, CellSize = None, Precision = 3, Optimize = False): # Convert many designs across a Process Pool, returns (Source, Destination, Time or Error, Toolpath Report)
+
+    Results = []
+
+    if Workers == 1 or len(Jobs) <= 1:
+
+        for Source, Destination in Jobs:
+
+            try: Results.append((Source, *ConvertDesign(Source, Destination, CellSize, Precision, Optimize)))
+
+            except Exception as Error: Results.append((Source, Destination, Error, None))
+
+        return Results
+
+    with ProcessPool(max_workers = Workers) as Pool:
+
+        Futures = [(Source, Destination, Pool.submit(ConvertDesign, Source, Destination, CellSize, Precision, Optimize)) for Source, Destination in Jobs]
+
+        for Source, Destination, Future in Futures:
+
+            try: Results.append((Source, *Future.result()))
+
+            except Exception as Error: Results.append((Source, Destination, Error, None))
+
+    return Results
+
+# --------- Command Line Interface ---------
+
+def Main(Arguments = None):
+
+    Parser = ArgumentParse.ArgumentParser(description = "Convert Bistable Auxetic Designs (.baux) into .svg files.")
+    Parser.add_argument("Paths", nargs = "+", help = ".baux files or directories containing .baux files")
+    Parser.add_argument("-o", "--output", default = None, help = "Output directory (Defaults to the directory of each design)")
+    Parser.add_argument("-j", "--jobs", type = int, default = None, help = "Number of worker processes (Defaults to the number of CPUs)")
+    Parser.add_argument("--cell-size", type = float, default = None, help = "Override the Cell Size stored in each design")
+    Parser.add_argument("--precision", type = int, default = 3, help = "Decimal places of exported coordinates (Defaults to 3)")
+    Parser.add_argument("--optimize", action = "store_true", help = "Merge, deduplicate and order cuts for the laser, and report cut and travel lengths")
+    Arguments = Parser.parse_args(Arguments)
+
+    if Arguments.output != None: System.makedirs(Arguments.output, exist_ok = True)
+
+    Jobs = CollectDesigns(Arguments.Paths, Arguments.output)
+    Failures = 0
+
+    for Source, Destination, Result, Report in ConvertDesigns(Jobs, Arguments.jobs, Arguments.cell_size, Arguments.precision, Arguments.optimize):
+
+        if isinstance(Result, Exception):
+
+            Failures += 1
+            print(f"Error: {Source} could not be exported ({Result})")
+
+        else: print(f"{Source} -> {Destination} ({Result:.3f} Seconds)" + (f"\n    {Toolpath.ReportText(Report)}" if Report != None else ""))
+
+    print(f"\nExported {len(Jobs) - Failures} / {len(Jobs)} Designs.\n")
+    return 1 if Failures else 0
+
+if __name__ == "__main__": ArgumentManage.exit(Main())
@@ -0,0 +1,164 @@
+#
+# Bistable Auxetic Format - Developed By Dinuk Wijesiri
+#
+# Overview:
+#
+# Reading and writing of .baux designs. Version 1 files are JSON, with
+# one [[X, Y], Thickness, Theta] list per selected cell. Version 2 files
+# are binary: a fixed header, a JSON header (Name, Cell Size, Grid Size)
+# and packed Index / Thickness / Theta arrays, which are memory-mapped
+# and only read when they are used. Both versions are accepted anywhere
+# a design is loaded.
+#
+# Layout (Version 2, Little Endian):
+#
+#   "BAUX" | Version (uint16) | Reserved (uint16) | Header Length (uint64)
+#   Header (JSON, padded to 16 bytes)
+#   Index (int32, Cells x 2) | Thickness (float32, Cells) | Theta (float32, Cells)
+#
+# Usage: python Bistable_Auxetic_Format.py Design.baux -o Design_v2.baux --version 2
+#
+
+# --------- Imports ---------
+
+import sys as ArgumentManage # Manage Arguments (External)
+import json as FileManage # Interpret Version 1 files and Version 2 headers as JSON
+import struct as BinaryManage # Fixed Header of Version 2 files
+import argparse as ArgumentParse # Command Line Arguments
+import numpy as Data # Packed (Memory-Mapped) Cell Arrays
+import Bistable_Auxetic_Geometry as Geometry # Vectorized Auxetic Geometry Kernel
+
+# --------- Utilities (Functions) ---------
+
+Magic = b"BAUX" # First bytes of every Version 2 file (Version 1 files start with "{")
+
+Header = BinaryManage.Struct("<4sHHQ") # Magic, Version, Reserved, Length of JSON Header
+
+Alignment = 16 # Arrays start on a multiple of this many bytes
+
+Layout = [("Index", "<i4", 2), ("Thickness", "<f4", 1), ("Theta", "<f4", 1)] # Packed Arrays (Name, Type, Values per Cell), In File Order
+
+Aligned = lambda Size: -(-Size // Alignment) * Alignment
+
+def FileVersion(Path): # 2 for binary files, 1 for legacy JSON files
+
+    with open(Path, "rb") as FileSource: return 2 if FileSource.read(len(Magic)) == Magic else 1
+
+class Design: # A loaded .baux design, Cell Arrays of Version 2 files are memory-mapped on first use
+
+    def __init__(Module, Name, CellSize, Dimension, Cells = 0, Arrays = None, Path = None, Offset = 0):
+
+        Module.Name = Name
+        Module.CellSize = CellSize
+        Module.Dimension = [int(Dimension[0]), int(Dimension[1])] # Grid Size
+        Module.Cells = Cells # Number of selected cells
+        Module.Path, Module.Offset = Path, Offset # Location of the packed Arrays (Version 2 files)
+        Module.Packed = Arrays # (Index, Thickness, Theta), None until loaded
+
+    def __repr__(Module):
+
+        return f"Design({Module.Name!r}, Cell Size = {Module.CellSize}, Grid Size = {Module.Dimension}, Cells = {Module.Cells})"
+
+    def Arrays(Module): # Index (Cells x 2), Thickness and Theta of the selected cells
+
+        if Module.Packed == None:
+
+            Offset, Packed = Module.Offset, []
+
+            for Name, Type, Width in Layout:
+
+                Shape = (Module.Cells, Width) if Width > 1 else (Module.Cells,)
+                Packed.append(Data.memmap(Module.Path, dtype = Type, mode = "r", offset = Offset, shape = Shape) if Module.Cells else Data.zeros(Shape, dtype = Type))
+                Offset += Module.Cells * Width * Data.dtype(Type).itemsize
+
+            Module.Packed = tuple(Packed)
+
+        return Module.Packed
+
+    def GridArrays(Module): # Thickness, Theta and Selection arrays of the whole Grid (Indexed [Y][X])
+
+        return Geometry.PackedArrays(Module.Dimension, *Module.Arrays())
+
+    def CellList(Module): # [[X, Y], Thickness, Theta] per selected cell (Data of Version 1 files)
+
+        Index, Thickness, Theta = Module.Arrays()
+
+        return [[[X, Y], round(T, 5), round(A, 5)] for (X, Y), T, A in zip(Index.tolist(),
+        Thickness.astype(Data.float64).tolist(), Theta.astype(Data.float64).tolist())]
+
+def DesignFromCells(Name, CellSize, Dimension, Cells): # Design from a list of [[X, Y], Thickness, Theta]
+
+    Index = Data.array([Cell[0] for Cell in Cells], dtype = Data.int32).reshape(-1, 2)
+    Thickness = Data.array([Cell[1] for Cell in Cells], dtype = Data.float32)
+    Theta = Data.array([Cell[2] for Cell in Cells], dtype = Data.float32)
+
+    return Design(Name, CellSize, Dimension, len(Cells), (Index, Thickness, Theta))
+
+def DesignFromGrid(Name, CellSize, Thickness, Theta, Selected): # Design from Grid arrays (Indexed [Y][X]), Only selected cells are stored
+
+    IndexY, IndexX = Data.nonzero(Selected)
+
+    return Design(Name, CellSize, [Selected.shape[1] // 2, Selected.shape[0] - 1], len(IndexX),
+    (Data.column_stack([IndexX, IndexY]).astype(Data.int32), Thickness[IndexY, IndexX].astype(Data.float32), Theta[IndexY, IndexX].astype(Data.float32)))
+
+def LoadDesign(Path): # Load a Version 1 (JSON) or Version 2 (Binary) .baux file
+
+    if FileVersion(Path) == 1:
+
+        with open(Path, "r", encoding = "utf-8") as FileSource: Source = FileManage.load(FileSource)
+
+        return DesignFromCells(Source.get("Name", ""), Source.get("Cell Size", 50), Source["Grid Size"], Source["Data"])
+
+    with open(Path, "rb") as FileSource:
+
+        _, Version, _, Length = Header.unpack(FileSource.read(Header.size))
+
+        if Version != 2: raise ValueError(f"{Path} is a Version {Version} .baux file, which is not supported")
+
+        Source = FileManage.loads(FileSource.read(Length).decode("utf-8"))
+
+    return Design(Source["Name"], Source["Cell Size"], Source["Grid Size"], Source["Cells"], Path = Path, Offset = Aligned(Header.size + Length))
+
+def SaveDesign(Path, Design, Version = 2): # Write a Design as a Version 1 (JSON) or Version 2 (Binary) .baux file
+
+    if Version == 1:
+
+        with open(Path, "w", encoding = "utf-8") as FileSource:
+
+            FileManage.dump({"Name": Design.Name, "Cell Size": Design.CellSize, "Grid Size": Design.Dimension, "Data": Design.CellList()}, FileSource)
+
+        return Path
+
+    Source = FileManage.dumps({"Name": Design.Name, "Cell Size": Design.CellSize, "Grid Size": Design.Dimension, "Cells": Design.Cells}).encode("utf-8")
+    Source += b" " * (Aligned(Header.size + len(Source)) - Header.size - len(Source)) # Pad JSON Header with Whitespace
+
+    with open(Path, "wb") as FileSource:
+
+        FileSource.write(Header.pack(Magic, 2, 0, len(Source)))
+        FileSource.write(Source)
+
+        for (Name, Type, Width), Array in zip(Layout, Design.Arrays()): FileSource.write(Data.ascontiguousarray(Array, dtype = Type).tobytes())
+
+    return Path
+
+def ConvertFormat(Source, Destination, Version = 2): # Rewrite a .baux file in another Version (Source may be either Version, or the Destination itself)
+
+    Design = LoadDesign(Source)
+    Design.Packed = tuple(Data.array(_) for _ in Design.Arrays()) # Read into memory, so a design can be overwritten in place
+    return SaveDesign(Destination, Design, Version), Design
+
+# --------- Command Line Interface ---------
+
+def Main(Arguments = None):
+
+    Parser = ArgumentParse.ArgumentParser(description = "Convert Bistable Auxetic Designs (.baux) between JSON (Version 1) and Binary (Version 2) files.")
+    Parser.add_argument("Path", help = ".baux file to convert")
+    Parser.add_argument("-o", "--output", default = None, help = "Output file (Defaults to overwriting the design)")
+    Parser.add_argument("--version", type = int, choices = [1, 2], default = 2, help = "Version to write (Defaults to 2)")
+    Arguments = Parser.parse_args(Arguments)
+
+    Destination, Design = ConvertFormat(Arguments.Path, Arguments.output if Arguments.output != None else Arguments.Path, Arguments.version)
+    print(f"{Arguments.Path} -> {Destination} (Version {Arguments.version}, {Design.Cells} Cells)")
+    return 0
+
+if __name__ == "__main__": ArgumentManage.exit(Main())
@@ -0,0 +1,267 @@
+#
+# Bistable Auxetic Geometry Kernel - Developed By Dinuk Wijesiri
+#
+# Overview:
+#
+# Vectorized geometry of Bistable Auxetic Surfaces. Computes the
+# auxetic cuts and outlines of every selected cell of a grid in a
+# single batched NumPy call. Does not depend on Tkinter, PyGame or
+# Ctypes, so it can be used by headless tools as well as the studio.
+#
+
+# --------- Imports ---------
+
+import numpy as Data # Batched (Vectorized) Mathematical Operations
+import math as Math # Basic Mathematical Operations
+from collections import OrderedDict as OrderedStore # Least Recently Used Ordering
+
+# --------- Utilities (Functions) ---------
+
+CellHeight = lambda CellSize: Math.sqrt(3 * (CellSize ** 2) / 4) # Height of Isometric Cell
+
+CellReversal = lambda IndexX, IndexY: (Data.asarray(IndexX) + Data.asarray(IndexY)) % 2 == 0 # Reversed Cells (Apex Up) have Even Index Sum
+
+OutlineEdges = [(1, 0), (1, 2), (2, 0)] # Node Pairs of each Edge (Same Order as GridCell.GetCells)
+
+Colours = [(255, 0, 0), (0, 0, 200), (195, 0, 255)] # Colour of each Auxetic Cut (Rendering)
+
+def CellOrigins(IndexX, IndexY, CellSize = 50): # Position of Bottom Left Node of each cell (Index -> Position)
+
+    IndexX, IndexY = Data.asarray(IndexX), Data.asarray(IndexY)
+
+    return Data.stack([
+    (IndexX - 1) * CellSize / 2,
+    (IndexY - Data.where(CellReversal(IndexX, IndexY), 0, 1)) * CellHeight(CellSize)], axis = -1)
+
+def CellCorners(Origins, Reversal, CellSize = 50): # Nodes of each cell (Apex, Left, Right), Same Order as GridCell.GridPoints
+
+    Origins = Data.asarray(Origins, dtype = Data.float64)
+    Corners = Data.repeat(Origins[..., None, :], 3, axis = -2)
+    Corners[..., 0, 0] += 0.5 * CellSize
+    Corners[..., 0, 1] += CellHeight(CellSize) * Data.where(Reversal, -1, 1)
+    Corners[..., 2, 0] += CellSize
+    return Corners
+
+def CellExistence(Dimension): # Mask of Grid Indices occupied by a Cell (First and Last Rows are Half Filled)
+
+    IndexY, IndexX = Data.indices((Dimension[1] + 1, 2 * Dimension[0]))
+    Reversal = CellReversal(IndexX, IndexY)
+    return (Reversal & (IndexY < Dimension[1])) | (~Reversal & (IndexY > 0))
+
+def CellRange(Region, CellSize, Dimension): # Rows and Columns of cells overlapping a Region (X0, Y0, X1, Y1) of the Grid (Viewport Culling)
+
+    return (
+    slice(max(Math.floor(Region[1] / CellHeight(CellSize)) - 1, 0), max(min(Math.floor(Region[3] / CellHeight(CellSize)) + 3, Dimension[1] + 1), 0)),
+    slice(max(Math.floor(2 * Region[0] / CellSize) - 3, 0), max(min(Math.floor(2 * Region[2] / CellSize) + 4, 2 * Dimension[0]), 0)))
+
+def CellIndex(PositionX, PositionY, CellSize = 50): # Index of the cell containing a Position of the Grid (Analytic Hit-Test, works on Arrays)
+
+    IndexY = Data.floor(Data.asarray(PositionY) / CellHeight(CellSize)) + 1 # Each Row is a band of alternating triangles
+    Depth = Data.asarray(PositionY) / CellHeight(CellSize) - (IndexY - 1) # 0 at the top of the band, 1 at the bottom
+    Column = Data.asarray(PositionX) / (CellSize / 2) # Cell centres are half a cell apart
+    IndexX = Data.floor(Column)
+    HalfWidth = Data.where(CellReversal(IndexX, IndexY), Depth, 1 - Depth) # Half width of the left triangle at this depth (Apex up if Reversed)
+    IndexX = IndexX + (Column - IndexX > HalfWidth)
+    return IndexX.astype(int), IndexY.astype(int)
+
+def NeighbourSelection(Selected, Start = (0, 0)): # Selection State of Surrounding Cells (Same Order as GridCell.GetCells), Start is the Index of the first cell of a block
+
+    Padded = Data.pad(Selected, 1, constant_values = False)
+    IndexY, IndexX = Data.indices(Selected.shape)
+    Reversal = CellReversal(IndexX + Start[0], IndexY + Start[1])
+
+    return Data.stack([
+    Padded[1:-1, :-2], # Position 0 (Left Neighbour)
+    Data.where(Reversal, Padded[2:, 1:-1], Padded[:-2, 1:-1]), # Position 1 (Neighbour Sharing the Base)
+    Padded[1:-1, 2:]], axis = -1) # Position 2 (Right Neighbour)
+
+def NeighbourAveraging(Thickness, Selected, Start = (0, 0)): # Averages Thickness Values with Selected Neighbouring cells (enables cell cuts to align)
+
+    Thickness = Data.asarray(Thickness, dtype = Data.float64)
+    Padded = Data.pad(Thickness, 1)
+    IndexY, IndexX = Data.indices(Thickness.shape)
+    Reversal = CellReversal(IndexX + Start[0], IndexY + Start[1])
+
+    Neighbours = Data.stack([
+    Padded[1:-1, :-2],
+    Data.where(Reversal, Padded[2:, 1:-1], Padded[:-2, 1:-1]),
+    Padded[1:-1, 2:]], axis = -1)
+
+    return Data.where(NeighbourSelection(Selected, Start), (Thickness[..., None] + Neighbours) / 2, Thickness[..., None])
+
+CellKeys = lambda Thickness, Theta, Reversal, Averaged: Data.column_stack([Thickness, Theta, Reversal, Averaged]).astype(Data.float64) # Parameters that fully determine the Cuts of a Cell (Cache Key)
+
+# --------- Caching ---------
+
+class LeastRecentlyUsed: # Bounded Cache, evicts the Least Recently Used entry once Capacity is reached
+
+    def __init__(Module, Capacity = 4096):
+
+        Module.Capacity = Capacity
+        Module.Entries = OrderedStore()
+        Module.Hits = 0
+        Module.Misses = 0
+
+    def Get(Module, Key): # Returns None (Miss) if Key is not cached
+
+        if Key in Module.Entries:
+
+            Module.Entries.move_to_end(Key)
+            Module.Hits += 1
+            return Module.Entries[Key]
+
+        Module.Misses += 1
+        return None
+
+    def Put(Module, Key, Value):
+
+        Module.Entries[Key] = Value
+        Module.Entries.move_to_end(Key)
+
+        while len(Module.Entries) > Module.Capacity: Module.Entries.popitem(last = False)
+
+    def Clear(Module):
+
+        Module.Entries.clear()
+        Module.Hits = Module.Misses = 0
+
+    def __len__(Module):
+
+        return len(Module.Entries)
+
+    def __repr__(Module):
+
+        return f'\nCache Object:\n\nEntries: {len(Module)} / {Module.Capacity}\n\nHits: {Module.Hits}\n\nMisses: {Module.Misses}\n'
+
+class GeometryCache(LeastRecentlyUsed): # Memoized origin-relative Auxetic Cuts (Most cells share a handful of Parameters)
+
+    def __init__(Module, CellSize = 50, JointWidth = 3, Capacity = 4096):
+
+        super().__init__(Capacity)
+        Module.CellSize = CellSize
+        Module.JointWidth = JointWidth
+
+    def __call__(Module, Keys): # Cuts of N cells relative to their Origins from their Keys (See CellKeys) -> (N, 3, 3, 2)
+
+        Unique, Inverse, Counts = Data.unique(Keys, axis = 0, return_inverse = True, return_counts = True)
+        Result = Data.empty((len(Unique), 3, 3, 2))
+        Missing = []
+
+        for Row, Key in enumerate(map(tuple, Unique.tolist())):
+
+            Cuts = Module.Get(Key)
+            Module.Hits += int(Counts[Row]) - 1 # Other cells sharing the Key reuse the same Cuts
+
+            if Cuts is None: Missing.append(Row)
+
+            else: Result[Row] = Cuts
+
+        if Missing: # Compute every Missing Key in one batch
+
+            Missing = Data.array(Missing)
+            Result[Missing] = AuxeticKernel(Unique[Missing, 0], Unique[Missing, 1], Unique[Missing, 2] != 0, Unique[Missing, 3:], Module.CellSize, Module.JointWidth)
+
+            for Row in Missing.tolist(): Module.Put(tuple(Unique[Row].tolist()), Result[Row].copy())
+
+        return Result[Inverse.ravel()]
+
+# --------- Geometry Kernel ---------
+
+def AuxeticKernel(Thickness, Theta, Reversal, Averaged, CellSize = 50, JointWidth = 3): # Auxetic Cuts of N cells relative to their Origins -> (N, 3 Cuts, 3 Points, 2)
+
+    Thickness = Data.asarray(Thickness, dtype = Data.float64)[:, None]
+    Theta = Data.radians(Data.asarray(Theta, dtype = Data.float64))[:, None]
+    Averaged = Data.asarray(Averaged, dtype = Data.float64)
+    Direction = Data.where(Data.asarray(Reversal), -1.0, 1.0)[:, None] # Normal cells are Reversed cells mirrored in their Base
+    Sixty = Math.radians(60)
+
+    ParameterI = (((CellSize - (1.5 * Thickness) - (Math.sin(Sixty) * Thickness / Data.tan(Sixty - Theta))) / (1 + (Data.tan(Theta) / Data.tan(Sixty - Theta)))) / Data.cos(Theta)) - JointWidth # Length of Each Auxetic Line
+    ParameterII = ((Math.sin(Sixty) * Thickness) / Data.sin(Sixty - Theta)) + ((ParameterI + JointWidth) * Data.sin(Theta)) / Data.sin(Sixty - Theta)
+
+    Anchor = Data.array([0.0, CellSize, CellSize]) # Node each Cut is measured from (Left, Right, Right)
+    Spoke = Data.radians([60.0, 180.0, 120.0]) # Edge each Cut starts on
+    Start = Data.stack([Averaged[:, 0], Averaged[:, 1], CellSize - Averaged[:, 2]], axis = -1) # Distance of Cut from Anchor (Neighbour Averaged)
+    Base = Data.concatenate([Thickness, Thickness, CellSize - Thickness], axis = -1) # Distance of Hinge from Anchor
+    Angle = Data.radians([0.0, 120.0, 240.0]) + Theta # Direction of each Cut
+
+    Cuts = Data.empty((Thickness.shape[0], 3, 3, 2))
+    Cuts[:, :, 0, 0] = Anchor + Start * Data.cos(Spoke)
+    Cuts[:, :, 0, 1] = Direction * Start * Data.sin(Spoke)
+    HingeX, HingeY = Anchor + Base * Data.cos(Spoke), Direction * Base * Data.sin(Spoke)
+    Cuts[:, :, 1, 0] = HingeX + ParameterII * Data.cos(Angle)
+    Cuts[:, :, 1, 1] = HingeY + Direction * ParameterII * Data.sin(Angle)
+    Cuts[:, :, 2, 0] = HingeX + ParameterI * Data.cos(Angle)
+    Cuts[:, :, 2, 1] = HingeY + Direction * ParameterI * Data.sin(Angle)
+    return Cuts
+
+def GridGeometry(Thickness, Theta, Selected, CellSize = 50, JointWidth = 3, Cache = None, Start = (0, 0)): # Geometry of every Selected cell in a grid or a block of it (Indexed [Y][X] like Grid.Grid)
+
+    Selected = Data.asarray(Selected, dtype = bool)
+    Averaged = NeighbourAveraging(Thickness, Selected, Start)
+    IndexY, IndexX = Data.nonzero(Selected)
+    IndexX, IndexY = IndexX + Start[0], IndexY + Start[1]
+    Reversal = CellReversal(IndexX, IndexY)
+    Origins = CellOrigins(IndexX, IndexY, CellSize)
+    Keys = CellKeys(Data.asarray(Thickness)[Selected], Data.asarray(Theta)[Selected], Reversal, Averaged[Selected])
+    Cuts = Cache(Keys) if Cache != None else AuxeticKernel(Keys[:, 0], Keys[:, 1], Reversal, Keys[:, 3:], CellSize, JointWidth)
+
+    return (
+    Data.stack([IndexX, IndexY], axis = -1), # Cell Indices (N, 2)
+    CellCorners(Origins, Reversal, CellSize), # Cell Nodes (N, 3, 2)
+    Cuts + Origins[:, None, None, :], # Auxetic Cuts (N, 3, 3, 2)
+    ~NeighbourSelection(Selected, Start)[Selected], # Outline Edges without a Selected Neighbour (N, 3)
+    Keys) # Cell Parameters (N, 6), See CellKeys
+
+def BlockGeometry(Thickness, Theta, Selected, Rows = slice(None), Columns = slice(None), CellSize = 50, JointWidth = 3, Cache = None): # Same as GridGeometry, for the Selected cells of a block of a grid (Neighbours outside the block are included)
+
+    Rows, Columns = slice(*Rows.indices(Selected.shape[0])[:2]), slice(*Columns.indices(Selected.shape[1])[:2])
+    Padded = (slice(max(Rows.start - 1, 0), Rows.stop + 1), slice(max(Columns.start - 1, 0), Columns.stop + 1)) # Neighbours of cells on the edge of the Block
+    Geometry = GridGeometry(Thickness[Padded], Theta[Padded], Selected[Padded], CellSize, JointWidth, Cache, Start = (Padded[1].start, Padded[0].start))
+    Inside = (Rows.start <= Geometry[0][:, 1]) & (Geometry[0][:, 1] < Rows.stop) & (Columns.start <= Geometry[0][:, 0]) & (Geometry[0][:, 0] < Columns.stop)
+
+    return tuple(_[Inside] for _ in Geometry)
+
+def NeighbourIndices(IndexX, IndexY): # Index of Surrounding Cells (Same Order as GridCell.GetCells) -> (N, 3, 2)
+
+    IndexX, IndexY = Data.asarray(IndexX), Data.asarray(IndexY)
+
+    return Data.stack([
+    Data.stack([IndexX - 1, IndexY], axis = -1),
+    Data.stack([IndexX, Data.where(CellReversal(IndexX, IndexY), IndexY + 1, IndexY - 1)], axis = -1),
+    Data.stack([IndexX + 1, IndexY], axis = -1)], axis = -2)
+
+def CellGeometry(Thickness, Theta, Selected, IndexX, IndexY, CellSize = 50, JointWidth = 3, Cache = None): # Geometry of a list of Selected cells of a grid (Cuts, Outlines, Keys), Same as GridGeometry
+
+    IndexX, IndexY = Data.asarray(IndexX, dtype = Data.int64), Data.asarray(IndexY, dtype = Data.int64)
+    Neighbours = NeighbourIndices(IndexX, IndexY)
+    Inside = (0 <= Neighbours[..., 0]) & (Neighbours[..., 0] < Selected.shape[1]) & (0 <= Neighbours[..., 1]) & (Neighbours[..., 1] < Selected.shape[0])
+    NeighbourSelected = Data.zeros(Inside.shape, dtype = bool)
+    NeighbourSelected[Inside] = Selected[Neighbours[..., 1][Inside], Neighbours[..., 0][Inside]]
+    NeighbourThickness = Data.zeros(Inside.shape)
+    NeighbourThickness[Inside] = Thickness[Neighbours[..., 1][Inside], Neighbours[..., 0][Inside]]
+    CellThickness = Data.asarray(Thickness, dtype = Data.float64)[IndexY, IndexX]
+    Reversal = CellReversal(IndexX, IndexY)
+    Keys = CellKeys(CellThickness, Theta[IndexY, IndexX], Reversal, Data.where(NeighbourSelected, (CellThickness[:, None] + NeighbourThickness) / 2, CellThickness[:, None]))
+    Cuts = Cache(Keys) if Cache != None else AuxeticKernel(Keys[:, 0], Keys[:, 1], Reversal, Keys[:, 3:], CellSize, JointWidth)
+    return Cuts + CellOrigins(IndexX, IndexY, CellSize)[:, None, None, :], ~NeighbourSelected, Keys
+
+def PackedArrays(Dimension, Index, Thickness, Theta): # Thickness, Theta and Selection arrays of a Grid from packed cell arrays (Index is Cells x 2)
+
+    Grid = (Data.full((Dimension[1] + 1, 2 * Dimension[0]), 5.0), Data.full((Dimension[1] + 1, 2 * Dimension[0]), 2.5)) # Same Defaults as GridCell
+    Selected = Data.zeros(Grid[0].shape, dtype = bool)
+
+    if len(Index):
+
+        IndexX, IndexY = Data.asarray(Index, dtype = Data.int64).T
+        Valid = (0 <= IndexX) & (IndexX < Selected.shape[1]) & (0 <= IndexY) & (IndexY < Selected.shape[0]) # Ignore Cells outside of the Grid
+        Valid[Valid] = CellExistence(Dimension)[IndexY[Valid], IndexX[Valid]]
+        Grid[0][IndexY[Valid], IndexX[Valid]] = Data.asarray(Thickness, dtype = Data.float64)[Valid]
+        Grid[1][IndexY[Valid], IndexX[Valid]] = Data.asarray(Theta, dtype = Data.float64)[Valid]
+        Selected[IndexY[Valid], IndexX[Valid]] = True
+
+    return Grid[0], Grid[1], Selected
+
+def DesignArrays(Dimension, Cells): # Thickness, Theta and Selection arrays from the Data of a Version 1 .baux file ([[X, Y], Thickness, Theta] per Cell)
+
+    return PackedArrays(Dimension, Data.array([Cell[0] for Cell in Cells], dtype = Data.int64).reshape(-1, 2),
+    [Cell[1] for Cell in Cells], [Cell[2] for Cell in Cells])
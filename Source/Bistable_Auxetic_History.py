@@ -0,0 +1,210 @@
+#
+# Bistable Auxetic History - Developed By Dinuk Wijesiri
+#
+# Overview:
+#
+# Undo and Redo of Grid edits. Each edit is stored as a delta: the
+# indices of the edited cells with their Old and New values (Thickness,
+# Theta, Selected), so a bulk edit of many cells is a single compact
+# entry. Undo and Redo only write the values of one entry back into the
+# Grid arrays (Independent of the length of the History), and the oldest
+# entries are dropped once the History holds too many cells.
+#
+# The History can also be appended to a Journal next to a .baux file,
+# which is removed when the design is saved. A Journal left behind (the
+# studio closed without saving) is replayed when the design is opened.
+#
+# Layout (Journal, Little Endian):
+#
+#   "BAUJ" | Size of the design (uint64) | Modification Time of the design (uint64, Nanoseconds)
+#   Per Record: Kind ("E"dit, "U"ndo, "R"edo) | Cells (uint32)
+#   Edits only: Index X, Index Y (int32, Cells) | Old, New (float32, Cells x 3)
+#
+# Usage: python Bistable_Auxetic_History.py Design.baux -o Recovered.baux
+#
+
+# --------- Imports ---------
+
+import os as System # Journal Paths and Design Statistics
+import sys as ArgumentManage # Manage Arguments (External)
+import struct as BinaryManage # Journal Header and Records
+import argparse as ArgumentParse # Command Line Arguments
+from collections import deque as Queue # Entries of the History (Oldest are dropped first)
+import numpy as Data # Packed Cell Values
+import Bistable_Auxetic_Format as Format # Reading and Writing .baux files (Recovering designs)
+
+# --------- Utilities (Functions) ---------
+
+Magic = b"BAUJ" # First bytes of every Journal
+
+Header = BinaryManage.Struct("<4sQQ") # Magic, Size and Modification Time of the design the Journal belongs to
+
+Record = BinaryManage.Struct("<cI") # Kind, Number of Cells
+
+JournalPath = lambda Path: f"{Path}.journal" # Journal of a .baux file
+
+def CellValues(Thickness, Theta, Selected, IndexX, IndexY): # Thickness, Theta and Selected of cells -> (Cells, 3)
+
+    return Data.stack([Thickness[IndexY, IndexX], Theta[IndexY, IndexX], Selected[IndexY, IndexX]], axis = -1).astype(Data.float32)
+
+def ApplyValues(Thickness, Theta, Selected, IndexX, IndexY, Values): # Writes (Cells, 3) Values back into the Grid arrays
+
+    Thickness[IndexY, IndexX], Theta[IndexY, IndexX], Selected[IndexY, IndexX] = Values[:, 0], Values[:, 1], Values[:, 2] != 0
+
+def DesignStamp(Path): # Size and Modification Time of a design (A Journal is only replayed onto the design it was written for)
+
+    Statistics = System.stat(Path)
+
+    return Statistics.st_size, Statistics.st_mtime_ns
+
+class History: # Entries of (Index X, Index Y, Old, New), Entries[:Position] can be undone and the rest redone
+
+    def __init__(Module, Capacity = 1 << 20, Limit = 256):
+
+        Module.Capacity = Capacity # Most cells held by all Entries (32 Bytes per Cell), The latest Entry is always kept
+        Module.Limit = Limit # Most Entries
+        Module.Entries = Queue()
+        Module.Position = 0
+        Module.Cells = 0
+        Module.Journal = None # Open Journal (File), None if edits are not journaled
+
+    def __len__(Module):
+
+        return len(Module.Entries)
+
+    def Record(Module, IndexX, IndexY, Old, New): # Adds an edit (Redo Entries are discarded), Cells that did not change are left out
+
+        Changed = (Old != New).any(axis = 1)
+
+        if not Changed.any(): return False
+
+        IndexX, IndexY = Data.asarray(IndexX, dtype = Data.int32)[Changed], Data.asarray(IndexY, dtype = Data.int32)[Changed]
+        Old, New = Data.asarray(Old, dtype = Data.float32)[Changed], Data.asarray(New, dtype = Data.float32)[Changed]
+
+        while len(Module.Entries) > Module.Position: Module.Cells -= len(Module.Entries.pop()[0])
+
+        Module.Entries.append((IndexX, IndexY, Old, New))
+        Module.Position += 1
+        Module.Cells += len(IndexX)
+
+        while len(Module.Entries) > 1 and (Module.Cells > Module.Capacity or len(Module.Entries) > Module.Limit): # Bounded Memory
+
+            Module.Cells -= len(Module.Entries.popleft()[0])
+            Module.Position -= 1
+
+        Module.Write(b"E", IndexX, IndexY, Old, New)
+        return True
+
+    def Undo(Module, Thickness, Theta, Selected): # Restores the Old values of the last Entry -> Index X, Index Y of the restored cells (None if there is nothing to undo)
+
+        if not Module.Position: return None
+
+        Module.Position -= 1
+        IndexX, IndexY, Old, New = Module.Entries[Module.Position]
+        ApplyValues(Thickness, Theta, Selected, IndexX, IndexY, Old)
+        Module.Write(b"U")
+        return IndexX, IndexY
+
+    def Redo(Module, Thickness, Theta, Selected): # Applies the New values of the next Entry -> Index X, Index Y of the changed cells (None if there is nothing to redo)
+
+        if Module.Position == len(Module.Entries): return None
+
+        IndexX, IndexY, Old, New = Module.Entries[Module.Position]
+        Module.Position += 1
+        ApplyValues(Thickness, Theta, Selected, IndexX, IndexY, New)
+        Module.Write(b"R")
+        return IndexX, IndexY
+
+    def Open(Module, Path, Design): # Appends edits to a Journal (Path) of a saved Design (Path of the .baux file)
+
+        Module.Close()
+        Module.Journal = open(Path, "ab")
+
+        if not Module.Journal.tell(): Module.Journal.write(Header.pack(Magic, *DesignStamp(Design)))
+
+        Module.Journal.flush()
+
+    def Write(Module, Kind, *Arrays): # Appends a Record to the Journal (Flushed, so it survives the studio closing unexpectedly)
+
+        if Module.Journal == None: return
+
+        Module.Journal.write(Record.pack(Kind, len(Arrays[0]) if Arrays else 0))
+
+        for Array in Arrays: Module.Journal.write(Data.ascontiguousarray(Array).tobytes())
+
+        Module.Journal.flush()
+
+    def Close(Module, Remove = False): # Stops journaling, Remove the Journal once its edits are saved (or discarded)
+
+        if Module.Journal == None: return
+
+        Module.Journal.close()
+
+        if Remove: System.remove(Module.Journal.name)
+
+        Module.Journal = None
+
+def ReplayJournal(Path, Design, Thickness, Theta, Selected, Replay = None): # Applies the edits of a Journal to the Grid arrays of a Design -> History of the replayed edits (None if there is no Journal for this Design)
+
+    if not System.path.exists(Path): return None
+
+    with open(Path, "rb") as FileSource:
+
+        Stamp = FileSource.read(Header.size)
+
+        if len(Stamp) < Header.size or Header.unpack(Stamp) != (Magic, *DesignStamp(Design)): return None # Written for another version of the design
+
+        Replay = Replay if Replay != None else History()
+
+        while True:
+
+            Kind = FileSource.read(Record.size)
+
+            if len(Kind) < Record.size: break
+
+            Kind, Cells = Record.unpack(Kind)
+
+            if Kind == b"E":
+
+                Arrays = FileSource.read(Cells * 32)
+
+                if len(Arrays) < Cells * 32: break # Record cut short (Studio closed while writing it)
+
+                IndexX, IndexY = Data.frombuffer(Arrays, Data.int32, Cells), Data.frombuffer(Arrays, Data.int32, Cells, Cells * 4)
+                Old, New = Data.frombuffer(Arrays, Data.float32, Cells * 3, Cells * 8).reshape(-1, 3), Data.frombuffer(Arrays, Data.float32, Cells * 3, Cells * 20).reshape(-1, 3)
+                ApplyValues(Thickness, Theta, Selected, IndexX, IndexY, New)
+                Replay.Record(IndexX, IndexY, Old, New)
+
+            elif Kind == b"U": Replay.Undo(Thickness, Theta, Selected)
+
+            elif Kind == b"R": Replay.Redo(Thickness, Theta, Selected)
+
+    return Replay
+
+# --------- Command Line Interface ---------
+
+def Main(Arguments = None):
+
+    Parser = ArgumentParse.ArgumentParser(description = "Recover unsaved edits of a Bistable Auxetic Design (.baux) from its Journal.")
+    Parser.add_argument("Path", help = ".baux file with a Journal")
+    Parser.add_argument("-o", "--output", default = None, help = "Output file (Defaults to overwriting the design, which removes the Journal)")
+    Arguments = Parser.parse_args(Arguments)
+
+    Design = Format.LoadDesign(Arguments.Path)
+    Thickness, Theta, Selected = Design.GridArrays()
+    Replay = ReplayJournal(JournalPath(Arguments.Path), Arguments.Path, Thickness, Theta, Selected)
+
+    if Replay == None:
+
+        print(f"{Arguments.Path} has no Journal to recover")
+        return 1
+
+    Destination = Arguments.output if Arguments.output != None else Arguments.Path
+    Format.SaveDesign(Destination, Format.DesignFromGrid(Design.Name, Design.CellSize, Thickness, Theta, Selected))
+
+    if Destination == Arguments.Path: System.remove(JournalPath(Arguments.Path))
+
+    print(f"{Arguments.Path} -> {Destination} ({Replay.Position} Edits Recovered)")
+    return 0
+
+if __name__ == "__main__": ArgumentManage.exit(Main())
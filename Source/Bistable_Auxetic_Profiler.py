@@ -0,0 +1,187 @@
+#
+# Bistable Auxetic Profiler - Developed By Dinuk Wijesiri
+#
+# Overview:
+#
+# Optional instrumentation of the hot paths of the studio (Geometry of
+# the cuts, drawing outlines and cuts, SVG export, presenting the screen
+# and handling events). Enabled with the --profile flag or the
+# BAUX_PROFILE environment variable, otherwise every call returns at once.
+#
+# Each frame records its time, the cells rendered, the SVG elements
+# created and the events processed (and the time of each stage within
+# it). A small overlay in the corner of the screen shows the rolling
+# frame time percentiles, and a Chrome Trace (JSON, opened in
+# chrome://tracing or https://ui.perfetto.dev) is written on exit.
+#
+# Usage: python Bistable_Auxetic_Surface_Studio.py --profile=Trace.json (or BAUX_PROFILE=Trace.json)
+#
+
+# --------- Imports ---------
+
+import os as System # Environment Variable and Process Identifier
+import json as FileManage # Chrome Trace
+import atexit as ExitHandler # Trace is written when the studio closes
+from collections import deque as Queue # Rolling Window of Frame Times
+from contextlib import nullcontext as NullContext # Span of a disabled Profiler
+from time import perf_counter as Time # Timings
+import numpy as Data # Percentiles
+
+# --------- Utilities (Functions) ---------
+
+DefaultTrace = "Bistable_Auxetic_Trace.json" # Trace written when no Path is given
+
+def Requested(Arguments, Environment = System.environ): # Trace Path if profiling is requested (--profile[=Path] or BAUX_PROFILE=1 / Path), None otherwise
+
+    for Argument in Arguments:
+
+        if Argument == "--profile": return DefaultTrace
+        if Argument.startswith("--profile="): return Argument.split("=", 1)[1] or DefaultTrace
+
+    Value = Environment.get("BAUX_PROFILE", "")
+
+    if Value in ("", "0"): return None
+
+    return Value if Value.endswith(".json") else DefaultTrace
+
+class Span: # Times a block as a Trace Event (and adds it to the Stage Times of the Frame)
+
+    __slots__ = ("Profile", "Name", "Start")
+
+    def __init__(Module, Profile, Name):
+
+        Module.Profile, Module.Name = Profile, Name
+
+    def __enter__(Module):
+
+        Module.Start = Time()
+        return Module
+
+    def __exit__(Module, *Exception):
+
+        End = Time()
+        Module.Profile.Add(Module.Name, Module.Start, End)
+        Module.Profile.Event({"name": Module.Name, "ph": "X", "ts": Module.Profile.Microseconds(Module.Start), "dur": (End - Module.Start) * 1e6})
+
+class Profiler: # Frames, Counters and Trace Events of the studio (Every method is a no-op unless Enabled)
+
+    def __init__(Module, Path = None, Window = 240, Limit = 1 << 20):
+
+        Module.Enabled = Path != None
+        Module.Path = Path # Chrome Trace written on exit
+        Module.Window = Queue(maxlen = Window) # Times of the latest Frames (Milliseconds)
+        Module.Limit = Limit # Most Trace Events held (Later Events are counted as Dropped)
+        Module.Events = []
+        Module.Dropped = 0
+        Module.Counters = {} # Cells Rendered, SVG Elements, Events ... since the last Frame
+        Module.Stages = {} # Time of each Stage since the last Frame (Seconds)
+        Module.Last = ({}, {}) # Counters and Stages of the last Frame (Shown by the Overlay)
+        Module.FrameStart = None
+        Module.Origin = Time()
+        Module.Font = None
+        Module.Written = False
+
+        if Module.Enabled: ExitHandler.register(Module.Dump)
+
+    Clock = staticmethod(Time)
+
+    def Microseconds(Module, Moment):
+
+        return (Moment - Module.Origin) * 1e6
+
+    def Event(Module, Event): # Adds a Trace Event (Process and Thread of the studio)
+
+        if len(Module.Events) >= Module.Limit:
+
+            Module.Dropped += 1
+            return
+
+        Event.update(pid = System.getpid(), tid = 0)
+        Module.Events.append(Event)
+
+    def Span(Module, Name): # with Profile.Span("Stage"): ... (Nothing is recorded if disabled)
+
+        return Span(Module, Name) if Module.Enabled else NullContext()
+
+    def Call(Module, Name, Function, *Arguments): # Function(*Arguments) timed as a Span
+
+        if not Module.Enabled: return Function(*Arguments)
+
+        with Span(Module, Name): return Function(*Arguments)
+
+    def Add(Module, Name, Start, End = None): # Adds the time since Start to a Stage of the Frame, without a Trace Event (For calls made for every cell)
+
+        if not Module.Enabled: return
+
+        Module.Stages[Name] = Module.Stages.get(Name, 0.0) + (End if End != None else Time()) - Start
+
+    def Count(Module, Name, Value = 1):
+
+        if not Module.Enabled: return
+
+        Module.Counters[Name] = Module.Counters.get(Name, 0) + Value
+
+    def BeginFrame(Module):
+
+        if Module.Enabled: Module.FrameStart = Time()
+
+    def EndFrame(Module, Surface = None): # Records the Frame (and draws the Overlay on Surface)
+
+        if not Module.Enabled or Module.FrameStart == None: return
+
+        End = Time()
+        Module.Window.append((End - Module.FrameStart) * 1e3)
+        Arguments = dict(Module.Counters, **{f"{Name} (ms)": Stage * 1e3 for Name, Stage in Module.Stages.items()})
+        Module.Event({"name": "Frame", "ph": "X", "ts": Module.Microseconds(Module.FrameStart), "dur": (End - Module.FrameStart) * 1e6, "args": Arguments})
+        Module.Event({"name": "Frame Counters", "ph": "C", "ts": Module.Microseconds(End), "args": dict(Module.Counters, **{"Frame Time (ms)": Module.Window[-1]})})
+        Module.Last, Module.Counters, Module.Stages = (Module.Counters, Module.Stages), {}, {}
+        Module.FrameStart = None
+
+        if Surface != None: Module.DrawOverlay(Surface)
+
+    def Percentiles(Module, Quantiles = (50, 95, 99)): # Rolling Frame Time Percentiles (Milliseconds)
+
+        return Data.percentile(Data.array(Module.Window), Quantiles).tolist() if Module.Window else [0.0] * len(Quantiles)
+
+    def OverlayLines(Module): # Text of the Overlay
+
+        Counters, Stages = Module.Last
+        Median, High, Highest = Module.Percentiles()
+
+        return [f"Frame {Module.Window[-1] if Module.Window else 0:.1f} ms  p50 {Median:.1f}  p95 {High:.1f}  p99 {Highest:.1f}  ({len(Module.Window)} Frames)",
+        f"Cells {Counters.get('Cells Rendered', 0)}  SVG Elements {Counters.get('SVG Elements', 0)}  Events {Counters.get('Events', 0)}",
+        "  ".join(f"{Name} {Stage * 1e3:.1f}" for Name, Stage in sorted(Stages.items(), key = lambda _: -_[1])[:4]) or "-"]
+
+    def DrawOverlay(Module, Surface, Position = (8, 8)): # Draws the Overlay over a corner of the screen (Only that area is updated)
+
+        import pygame as RenderEngine
+
+        if Module.Font == None:
+
+            RenderEngine.font.init()
+            Module.Font = RenderEngine.font.Font(None, 18)
+
+        Lines = [Module.Font.render(Line, True, (0, 0, 0)) for Line in Module.OverlayLines()]
+        Area = RenderEngine.Rect(*Position, max(_.get_width() for _ in Lines) + 8, sum(_.get_height() for _ in Lines) + 8)
+        Surface.fill((255, 255, 210), Area)
+        RenderEngine.draw.rect(Surface, (0, 0, 0), Area, 1)
+
+        for Index, Line in enumerate(Lines): Surface.blit(Line, (Position[0] + 4, Position[1] + 4 + Index * Line.get_height()))
+
+        RenderEngine.display.update(Area)
+        return Area
+
+    def Dump(Module, Path = None): # Writes the Chrome Trace (Once, unless a Path is given)
+
+        if not Module.Enabled or (Path == None and Module.Written): return
+
+        Path = Path if Path != None else Module.Path
+        Median, High, Highest = Module.Percentiles()
+
+        with open(Path, "w", encoding = "utf-8") as FileSource:
+
+            FileManage.dump({"traceEvents": Module.Events, "displayTimeUnit": "ms", "otherData": {"Dropped Events": Module.Dropped,
+            "Frame Time p50 (ms)": Median, "Frame Time p95 (ms)": High, "Frame Time p99 (ms)": Highest}}, FileSource)
+
+        Module.Written = True
+        print(f"Profile -> {Path} ({len(Module.Events)} Events)")
@@ -0,0 +1,193 @@
+#
+# Bistable Auxetic Regions - Developed By Dinuk Wijesiri
+#
+# Overview:
+#
+# Bulk editing of many cells at once. A region is a mask of cells chosen
+# by a rectangle, a lasso (polygon) or a flood fill. Thickness and Theta
+# are then set from a function of each cell's position (a number, a
+# linear or radial gradient, or an expression), in one vectorized step.
+# Works on the Grid arrays of the studio, or headless on .baux files.
+#
+# Positions are in the same units as the Grid (One Cell is Cell Size
+# wide), measured from the Grid origin to the centre of each cell.
+#
+# Usage: python Bistable_Auxetic_Regions.py Design.baux -o Edited.baux --rectangle 0 0 1000 500 --thickness "Linear(0, 0, 1000, 0, 3, 9)"
+#
+
+# --------- Imports ---------
+
+import sys as ArgumentManage # Manage Arguments (External)
+import argparse as ArgumentParse # Command Line Arguments
+import ast as Syntax # Checking Field Expressions
+import numpy as Data # Batched (Vectorized) Mathematical Operations
+import Bistable_Auxetic_Geometry as Geometry # Vectorized Auxetic Geometry Kernel
+import Bistable_Auxetic_Format as Format # Reading and Writing .baux files (JSON or Binary)
+
+# --------- Utilities (Functions) ---------
+
+Limits = lambda CellSize: ((0, 0.3 * CellSize), (0, 22.5)) # Bistability Requirements for Thickness and Theta (Same as the Studio)
+
+def CellCentres(IndexX, IndexY, CellSize = 50): # Centre of each cell (Mean of its Nodes) -> X, Y
+
+    Centres = Geometry.CellCorners(Geometry.CellOrigins(IndexX, IndexY, CellSize), Geometry.CellReversal(IndexX, IndexY), CellSize).mean(axis = -2)
+
+    return Centres[..., 0], Centres[..., 1]
+
+def GridCentres(Dimension, CellSize = 50): # Centres of every Index of a Grid (Indexed [Y][X]) -> X, Y
+
+    IndexY, IndexX = Data.indices((Dimension[1] + 1, 2 * Dimension[0]))
+
+    return CellCentres(IndexX, IndexY, CellSize)
+
+def RectangleMask(Dimension, Rectangle, CellSize = 50): # Cells with their centre inside a Rectangle (X0, Y0, X1, Y1)
+
+    X, Y = GridCentres(Dimension, CellSize)
+
+    return (min(Rectangle[0], Rectangle[2]) <= X) & (X <= max(Rectangle[0], Rectangle[2])) & (min(Rectangle[1], Rectangle[3]) <= Y) & (Y <= max(Rectangle[1], Rectangle[3])) & Geometry.CellExistence(Dimension)
+
+def LassoMask(Dimension, Polygon, CellSize = 50): # Cells with their centre inside a Polygon ([(X, Y), ...], Even-Odd Rule)
+
+    X, Y = GridCentres(Dimension, CellSize)
+    Polygon = Data.asarray(Polygon, dtype = Data.float64)
+    Inside = Data.zeros(X.shape, dtype = bool)
+
+    for (AX, AY), (BX, BY) in zip(Polygon, Data.roll(Polygon, -1, axis = 0)): # Each Edge crossed by a ray to the right toggles the cells
+
+        Crossing = (AY > Y) != (BY > Y)
+        Inside ^= Crossing & (X < AX + (Y - AY) * (BX - AX) / Data.where(BY != AY, BY - AY, 1))
+
+    return Inside & Geometry.CellExistence(Dimension)
+
+def FloodMask(Selected, Start, Thickness = None, Theta = None): # Cells reachable from Start through shared edges, with the same Selection (and Thickness and Theta, if given)
+
+    Selected = Data.asarray(Selected, dtype = bool)
+    Dimension = [Selected.shape[1] // 2, Selected.shape[0] - 1]
+    Mask = Data.zeros(Selected.shape, dtype = bool)
+    Exists = Geometry.CellExistence(Dimension)
+
+    if not (0 <= Start[1] < Selected.shape[0] and 0 <= Start[0] < Selected.shape[1] and Exists[Start[1], Start[0]]): return Mask
+
+    Matching = Exists & (Selected == Selected[Start[1], Start[0]])
+
+    if Thickness is not None: Matching &= Data.asarray(Thickness) == Thickness[Start[1], Start[0]]
+    if Theta is not None: Matching &= Data.asarray(Theta) == Theta[Start[1], Start[0]]
+
+    Frontier = Data.array([Start], dtype = Data.int64)
+    Mask[Start[1], Start[0]] = True
+
+    while len(Frontier): # One ring of Neighbours per step (Breadth First)
+
+        Cells = Geometry.NeighbourIndices(Frontier[:, 0], Frontier[:, 1]).reshape(-1, 2)
+        Cells = Cells[(0 <= Cells[:, 0]) & (Cells[:, 0] < Selected.shape[1]) & (0 <= Cells[:, 1]) & (Cells[:, 1] < Selected.shape[0])]
+        Cells = Cells[Matching[Cells[:, 1], Cells[:, 0]] & ~Mask[Cells[:, 1], Cells[:, 0]]]
+        Cells = Data.unique(Cells, axis = 0) if len(Cells) else Cells
+        Mask[Cells[:, 1], Cells[:, 0]] = True
+        Frontier = Cells
+
+    return Mask
+
+def LinearGradient(X, Y, Start, End, From, To): # Blends From -> To along the line Start -> End (Constant beyond its ends)
+
+    Direction = Data.subtract(End, Start, dtype = Data.float64)
+    Blend = Data.clip(((X - Start[0]) * Direction[0] + (Y - Start[1]) * Direction[1]) / max(Direction @ Direction, 1e-12), 0, 1)
+
+    return From + Blend * (To - From)
+
+def RadialGradient(X, Y, Centre, Radius, From, To): # Blends From (at the Centre) -> To (at the Radius and beyond)
+
+    return From + Data.clip(Data.hypot(X - Centre[0], Y - Centre[1]) / max(Radius, 1e-12), 0, 1) * (To - From)
+
+Functions = {_: getattr(Data, _) for _ in ("sin", "cos", "tan", "arcsin", "arccos", "arctan", "arctan2", "sqrt", "exp", "log", "abs", "minimum", "maximum", "clip", "hypot", "where", "floor", "ceil", "round", "pi")} # Available in Expressions
+
+def CheckExpression(Expression): # Parsed Expression, Names and Attributes starting with "_" (e.g. X.__class__) are rejected to guard against mistakes
+
+    Tree = Syntax.parse(Expression, "<Field>", "eval")
+
+    for Node in Syntax.walk(Tree):
+
+        if isinstance(Node, Syntax.Attribute) and Node.attr.startswith("_") or isinstance(Node, Syntax.Name) and Node.id.startswith("_"): raise ValueError(f"\"{Syntax.unparse(Node)}\" is not allowed")
+
+    return Tree
+
+def FieldValues(Field, IndexX, IndexY, CellSize = 50, Current = None): # Value of a Field at each cell: None (Current Values), a number, an expression or a function of (X, Y, IndexX, IndexY)
+
+    if Field is None: return Current
+
+    X, Y = CellCentres(IndexX, IndexY, CellSize)
+
+    if isinstance(Field, str): # Expression of X, Y, IndexX, IndexY and Value (Current Values), e.g. "5 + 2 * sin(X / 200)"
+
+        Names = dict(Functions, X = X, Y = Y, IndexX = IndexX, IndexY = IndexY, Value = Current,
+        Linear = lambda X0, Y0, X1, Y1, From, To: LinearGradient(X, Y, (X0, Y0), (X1, Y1), From, To),
+        Radial = lambda X0, Y0, Radius, From, To: RadialGradient(X, Y, (X0, Y0), Radius, From, To))
+
+        try: Field = eval(compile(CheckExpression(Field), "<Field>", "eval"), {"__builtins__": {}}, Names) # Not a sandbox: Expressions come from the local CLI or the studio's own user
+
+        except Exception as Error: raise ValueError(f"Invalid expression \"{Field}\" ({type(Error).__name__}: {Error})") from None
+
+    elif callable(Field): Field = Field(X, Y, IndexX, IndexY)
+
+    Field = Data.broadcast_to(Data.asarray(Field, dtype = Data.float64), IndexX.shape)
+
+    if not Data.isfinite(Field).all(): raise ValueError("Field has values that are not finite (Division by zero, Logarithm of zero ...)")
+
+    return Field
+
+def EditRegion(Thickness, Theta, Selected, Mask, ThicknessField = None, ThetaField = None, CellSize = 50, Select = True): # Sets Thickness and Theta of every cell in the Mask (Arrays are edited in place) -> IndexX, IndexY of edited cells
+
+    IndexY, IndexX = Data.nonzero(Data.asarray(Mask, dtype = bool) & Geometry.CellExistence([Selected.shape[1] // 2, Selected.shape[0] - 1]))
+    (ThicknessMinimum, ThicknessMaximum), (ThetaMinimum, ThetaMaximum) = Limits(CellSize)
+    Values = (FieldValues(ThicknessField, IndexX, IndexY, CellSize, Thickness[IndexY, IndexX]), FieldValues(ThetaField, IndexX, IndexY, CellSize, Theta[IndexY, IndexX])) # Both Fields are evaluated first (An invalid Field leaves the Arrays unchanged)
+    Thickness[IndexY, IndexX] = Data.clip(Values[0], ThicknessMinimum, ThicknessMaximum)
+    Theta[IndexY, IndexX] = Data.clip(Values[1], ThetaMinimum, ThetaMaximum)
+
+    if Select: Selected[IndexY, IndexX] = True
+
+    return IndexX, IndexY
+
+def EditDesign(Source, Destination, Region = None, ThicknessField = None, ThetaField = None, Select = True, Version = 2): # Edit a .baux file headless, Region is a function of (Dimension, CellSize, Thickness, Theta, Selected) returning a Mask (Selected cells if None)
+
+    Design = Format.LoadDesign(Source)
+    Thickness, Theta, Selected = Design.GridArrays()
+    Mask = Region(Design.Dimension, Design.CellSize, Thickness, Theta, Selected) if Region != None else Selected.copy()
+    IndexX, IndexY = EditRegion(Thickness, Theta, Selected, Mask, ThicknessField, ThetaField, Design.CellSize, Select)
+    Format.SaveDesign(Destination, Format.DesignFromGrid(Design.Name, Design.CellSize, Thickness, Theta, Selected), Version)
+    return len(IndexX)
+
+# --------- Command Line Interface ---------
+
+def Main(Arguments = None):
+
+    Parser = ArgumentParse.ArgumentParser(description = "Edit a region of a Bistable Auxetic Design (.baux) in one step.")
+    Parser.add_argument("Path", help = ".baux file to edit")
+    Parser.add_argument("-o", "--output", default = None, help = "Output file (Defaults to overwriting the design)")
+    Regions = Parser.add_mutually_exclusive_group()
+    Regions.add_argument("--rectangle", type = float, nargs = 4, metavar = ("X0", "Y0", "X1", "Y1"), help = "Cells with their centre inside a rectangle")
+    Regions.add_argument("--lasso", type = float, nargs = "+", metavar = "X Y", help = "Cells with their centre inside a polygon (X Y pairs)")
+    Regions.add_argument("--flood", type = int, nargs = 2, metavar = ("IX", "IY"), help = "Cells connected to a cell with the same selection, thickness and theta")
+    Parser.add_argument("--thickness", default = None, help = "Number or expression of X, Y, IndexX, IndexY and Value, e.g. \"Linear(0, 0, 1000, 0, 3, 9)\"")
+    Parser.add_argument("--theta", default = None, help = "Number or expression, e.g. \"Radial(500, 500, 400, 20, 2.5)\"")
+    Parser.add_argument("--selected-only", action = "store_true", help = "Only edit cells that are already selected (Others are selected by default)")
+    Parser.add_argument("--version", type = int, choices = [1, 2], default = 2, help = ".baux Version to write (Defaults to 2)")
+    Arguments = Parser.parse_args(Arguments)
+
+    if Arguments.lasso != None and (len(Arguments.lasso) < 6 or len(Arguments.lasso) % 2): Parser.error("--lasso needs at least three X Y pairs")
+
+    def Region(Dimension, CellSize, Thickness, Theta, Selected):
+
+        if Arguments.rectangle != None: Mask = RectangleMask(Dimension, Arguments.rectangle, CellSize)
+        elif Arguments.lasso != None: Mask = LassoMask(Dimension, Data.reshape(Arguments.lasso, (-1, 2)), CellSize)
+        elif Arguments.flood != None: Mask = FloodMask(Selected, Arguments.flood, Thickness, Theta)
+        else: Mask = Selected.copy()
+
+        return Mask & Selected if Arguments.selected_only else Mask
+
+    try: Edited = EditDesign(Arguments.Path, Arguments.output if Arguments.output != None else Arguments.Path, Region, Arguments.thickness, Arguments.theta, not Arguments.selected_only, Arguments.version)
+
+    except ValueError as Error: Parser.error(str(Error)) # Invalid --thickness or --theta
+
+    print(f"{Arguments.Path} -> {Arguments.output if Arguments.output != None else Arguments.Path} ({Edited} Cells Edited)")
+    return 0
+
+if __name__ == "__main__": ArgumentManage.exit(Main())
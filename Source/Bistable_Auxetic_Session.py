@@ -0,0 +1,81 @@
+#
+# Bistable Auxetic Session - Developed By Dinuk Wijesiri
+#
+# Overview:
+#
+# Warm start of the studio. The Grid of the last session is kept as a
+# binary (Version 2) .baux file in ~/.cache/Bistable_Auxetic/Session,
+# with the design it was opened from and the position and Zoom of the
+# Viewport.
+#
+# Started without a design, the studio continues the last session. A
+# design passed on the command line is read from the cache instead when
+# the last session left it unchanged (Version 1 JSON files are slow to
+# parse). Either way the design is read on a background thread while the
+# window and splash are set up.
+#
+
+# --------- Imports ---------
+
+import os as System # Cache Paths
+import json as FileManage # State of the Session (Design, Viewport)
+import numpy as Data # Grid Arrays
+from concurrent.futures import ThreadPoolExecutor as ThreadPool # Reading the Design while the Window is set up
+import Bistable_Auxetic_Format as Format # Reading and Writing .baux files (JSON or Binary)
+import Bistable_Auxetic_History as History # Size and Modification Time of designs
+
+# --------- Utilities (Functions) ---------
+
+SessionDirectory = System.path.join(System.path.expanduser("~"), ".cache", "Bistable_Auxetic", "Session") # Grid (Session.baux) and State (Session.json) of the last session
+
+def SaveSession(Thickness, Theta, Selected, CellSize, Position, Source = None, Edited = False, Zoom = 1.0, Directory = SessionDirectory): # Keeps the Grid of a closing session (Source is the design it was opened from, Edited if it has unsaved Edits)
+
+    System.makedirs(Directory, exist_ok = True)
+    Path = System.path.join(Directory, "Session.baux")
+    Format.SaveDesign(f"{Path}.tmp", Format.DesignFromGrid("Session", CellSize, Thickness, Theta, Selected))
+    System.replace(f"{Path}.tmp", Path) # Never leave a partly written Session
+
+    State = {"Source": System.path.abspath(Source) if Source != None else None, "Stamp": list(History.DesignStamp(Source)) if Source != None and System.path.exists(Source) else None,
+    "Edited": bool(Edited), "Position": [float(_) for _ in Position], "Zoom": float(Zoom)}
+
+    with open(System.path.join(Directory, "Session.json"), "w", encoding = "utf-8") as FileSource: FileManage.dump(State, FileSource)
+
+def LoadSession(Directory = SessionDirectory): # Design and State of the last session (None if there is none)
+
+    try:
+
+        with open(System.path.join(Directory, "Session.json"), "r", encoding = "utf-8") as FileSource: State = FileManage.load(FileSource)
+
+        return Format.LoadDesign(System.path.join(Directory, "Session.baux")), State
+
+    except (OSError, ValueError, KeyError): return None
+
+def StartupDesign(Source = None, Directory = SessionDirectory): # Design to open on startup -> Path (None if unsaved), Dimension, Grid Arrays, Viewport Position (None to centre it), Zoom, or None for an empty Grid
+
+    Session = LoadSession(Directory) if Directory != None else None
+
+    if Source != None:
+
+        Matching = Session != None and not Session[1]["Edited"] and Session[1]["Source"] == System.path.abspath(Source) and Session[1]["Stamp"] == list(History.DesignStamp(Source)) # Last session left the design unchanged
+        Design, Position, Zoom = (Session[0], Session[1]["Position"], Session[1].get("Zoom", 1.0)) if Matching else (Format.LoadDesign(Source), None, 1.0)
+        Path = Source
+
+    elif Session != None:
+
+        (Design, State), Path = Session, Session[1]["Source"]
+        Position, Zoom = State["Position"], State.get("Zoom", 1.0)
+
+        if State["Edited"] or Path == None or not System.path.exists(Path) or State["Stamp"] != list(History.DesignStamp(Path)): Path = None # Continued as an unsaved Grid
+
+    else: return None
+
+    Thickness, Theta, Selected = Design.GridArrays() # Copied out of the memory-mapped file (The Session is replaced on exit)
+
+    return Path, Design.Dimension, (Thickness.astype(Data.float32), Theta.astype(Data.float32), Selected), Position, Zoom
+
+def LoadInBackground(Function, *Arguments): # Runs Function on a background thread -> Future
+
+    Pool = ThreadPool(max_workers = 1)
+    Future = Pool.submit(Function, *Arguments)
+    Pool.shutdown(wait = False)
+    return Future
@@ -18,15 +18,18 @@ import tkinter as WindowRender # Base for GUI Application
 from tkinter import ttk as ExtensionsI # Frame for Render Canvas
 import math as Math # Basic and Complex Mathematical Operations
 import ctypes as WindowStatistics # Deal with Window Size and Scaling
-from itertools import chain as ToolI # Managing Lists
 from contextlib import suppress as ToolII # Used in File Selection Modal
 from tkinter.filedialog import askopenfilename as FileOpen # File Selection Dialog #1 (Opening Files ...)
-from tkinter.filedialog import asksaveasfile as FileSaveI # File Selection Dialog #2 (Saving Files - returns File Object)
-from tkinter.filedialog import asksaveasfilename as FileSaveII # File Selection Dialog #3 (Saving Files - returns File Path)
-import json as FileManage # Interpret .baux files as JSON
-from PIL import (Image as ImageI, ImageTk as ImageII) # Image Support In MessageBox
-import drawsvg as Export # Exporting to SVG
+from tkinter.filedialog import asksaveasfilename as FileSaveII # File Selection Dialog #2 (Saving Files - returns File Path)
 import sys as ArgumentManage # Manage Arguments (External)
+import numpy as Data # Batched Geometry Arrays
+import Bistable_Auxetic_Geometry as Geometry # Vectorized Auxetic Geometry Kernel
+import Bistable_Auxetic_Export as Export # Exporting to SVG (Built on demand from Geometry)
+import Bistable_Auxetic_Format as Format # Reading and Writing .baux files (JSON or Binary)
+import Bistable_Auxetic_Regions as Regions # Bulk Editing of Regions (Rectangle, Lasso, Flood Fill)
+import Bistable_Auxetic_History as History # Undo and Redo of Edits (Journaled next to opened .baux files)
+import Bistable_Auxetic_Profiler as Profiler # Optional Instrumentation of Hot Paths (--profile or BAUX_PROFILE)
+import Bistable_Auxetic_Session as Session # Warm Start (Grid of the last session, read while the Window is set up)
 
 # --------- Utilities (Functions) ---------
 
@@ -34,16 +37,14 @@ ClearEntireConsole = lambda: System.system('clear' if System.name != 'nt' else '
 
 ClearEntireScreen = lambda Channel: Channel.fill([255, 255, 255])
 
-UpdateScreen = lambda: RenderEngine.display.flip()
+Profile = Profiler.Profiler(Profiler.Requested(ArgumentManage.argv[1:])) # Disabled unless requested (Every call returns at once)
+
+UpdateScreen = lambda: Profile.Call("Display", RenderEngine.display.flip)
 
 GetScreenScale = lambda: WindowStatistics.windll.shcore.GetScaleFactorForDevice(0) / 100
 
 PolarToNormal = lambda Radius, Theta, OffSet: (OffSet[0] + Radius * Cosine(-Theta), OffSet[1] + Radius * Sine(-Theta))
 
-TrianglePointTestI = lambda I, II, III: ((I[0]- III[0]) * (II[1] - III[1]) - (II[0] - III[0]) * (I[1] - III[1])) < 0
-
-TrianglePointTestII = lambda I, II, III, IV: ((TrianglePointTestI(I, II, III) == TrianglePointTestI(I, III, IV)) and (TrianglePointTestI(I, III, IV) == TrianglePointTestI(I, IV, II)))
-
 Tangent = lambda I: Math.tan(Math.radians(I))
 
 Cosine = lambda I: Math.cos(Math.radians(I))
@@ -144,158 +145,160 @@ def ResourceLocator(InputPath): # Script Can Locate Resources across Working Dir
 
     return System.path.join(Path, InputPath)
 
-def LogoBox():
+def LogoBox(Root): # Splash over the Window while the Studio starts (Removed once the first Frame is drawn)
 
-    LogoBox = WindowRender.Tk()
+    from PIL import (Image as ImageI, ImageTk as ImageII) # Image Support In MessageBox (Only needed for the Splash)
+
+    LogoBox = WindowRender.Toplevel(Root)
     LogoBox.overrideredirect(True)
-    Image = ImageII.PhotoImage(ImageI.open(ResourceLocator("Logo_1.png")).resize((956, 576)))
+    Image = ImageII.PhotoImage(ImageI.open(ResourceLocator("Logo_1.png")).resize((956, 576)), master = LogoBox)
     ImageLabel = WindowRender.Label(LogoBox, image = Image, bd = 0, highlightthickness = 0)
     ImageLabel.image = Image
     ImageLabel.pack(fill = "both", expand = True)
-    LogoBox.attributes('-topmost', True)
-    LogoBox.after(100, lambda: LogoBox.attributes('-topmost', False))
+    LogoBox.attributes('-topmost', True) # Above the Window being set up
     LogoBox.geometry("+{}+{}".format(int(WindowSize()[0]/2 -  478), int(WindowSize()[1]/2 - 288)))
     LogoBox.resizable(False, False)
-    LogoBox.after(3000, lambda: LogoBox.destroy())
-    LogoBox.mainloop()
+    LogoBox.update()
     return LogoBox
 
-# --------- Interface Components ---------
-
-class GridCell: # Each Component is a Single Bistable Auxetic Cell
+def AuxeticSprite(Cuts, Reversal, Phase, CellSize): # Pre-rasterized Auxetic Cuts of a Cell (Origin-relative Cuts at a Sub-Pixel Phase)
 
-    def __init__(Module, GridSearch, Index, Position, CellSize, Reversal = False):
+    Margin = SpriteMargin(CellSize, Reversal)
+    Sprite = RenderEngine.Surface((Math.ceil(CellSize) + 6, Math.ceil(Math.sqrt(3 * CellSize ** 2 / 4)) + 6))
+    Sprite.fill((255, 255, 255)) # White is Transparent when blitted with BLEND_RGB_MULT
 
-        Module.Index = Index # Index in Grid
-        Module.GridSearch = GridSearch # Parent Object
-        Module.Data = [5, 2.5, False] # Thickness, Angle, Selected
-        Module.MetaData = (CellSize, Position[0], Position[1], Reversal) # CellSize, XPosition, YPosition, Reversal
-
-    def IsometricGrid(Module): # Basic outline of clickable Isometric Grid
+    for Cut in range(3): RenderEngine.draw.aalines(Sprite, Geometry.Colours[Cut], False, (Cuts[Cut] + Margin + Phase).tolist(), 2)
 
-        Points =  [(Module.MetaData[1] + 0.5 * Module.MetaData[0] + OffSet[0], 
-        Module.MetaData[2] + (Module.MetaData[0] * (3 ** 0.5) * 0.5) * (-1 if Module.MetaData[3] else 1) + OffSet[1]),
-        (Module.MetaData[1] + OffSet[0], Module.MetaData[2] + OffSet[1]),
-        (Module.MetaData[1] + OffSet[0] + Module.MetaData[0], Module.MetaData[2] + OffSet[1])]
-        if Module.Data[2]: RenderEngine.draw.aalines(ScreenObject, (0,0, 0), True, Points, 5) # Selected Form - Triangles
-        else: [RenderEngine.draw.circle(ScreenObject, (0, 0, 0), Points[_], 2) for _ in range(3)] # Unselected Form - Circular Nodes
-        Module.GridPoints = Points
+    return Sprite
 
-    def CellAveraging(Module, Position): # Averages Thickness Values in Neighbouring cells (enables cell cuts to align)
+SpriteMargin = lambda CellSize, Reversal: (3, 3 + (Math.ceil(Math.sqrt(3 * CellSize ** 2 / 4)) if Reversal else 0)) # Position of Cell Origin within its Sprite
 
-        Result = Module.GetCells(Position) # Get Surrounding Cells
-        if Result == None or Result.Data[2] == False: return Module.Data[0] # If no neighbour cell, return Cell Thickness
-        else: return (Module.Data[0] + Result.Data[0]) / 2 # Otherwise average Cell Thicknesses
+# --------- Interface Components ---------
 
-    def CellOutline(Module, Position):  # Outline of Grid Cell in SVG File
+class GridCell: # View of a Single Bistable Auxetic Cell (Its State is held in the Arrays of the parent Grid)
 
-        Result = Module.GetCells(Position)
+    __slots__ = ("GridSearch", "Index") # Cells are created on demand, so they must be lightweight
 
-        if Result == None or Result.Data[2] == False:  # If no overlap of selected cells, draw outline
+    def __init__(Module, GridSearch, Index):
 
-            if Position == 0: Module.GridSearch.ExportSVG[1].append(Export.Lines(Module.GridPoints[1][0] - OffSet[0], Module.GridPoints[1][1] - OffSet[1], Module.GridPoints[0][0] - OffSet[0], Module.GridPoints[0][1] - OffSet[1], fill = "none", stroke = "black"))
-            elif Position == 1: Module.GridSearch.ExportSVG[1].append(Export.Lines(Module.GridPoints[1][0] - OffSet[0], Module.GridPoints[1][1] - OffSet[1], Module.GridPoints[2][0] - OffSet[0], Module.GridPoints[2][1] - OffSet[1], fill = "none", stroke = "black"))
-            elif Position == 2: Module.GridSearch.ExportSVG[1].append(Export.Lines(Module.GridPoints[2][0] - OffSet[0], Module.GridPoints[2][1] - OffSet[1], Module.GridPoints[0][0] - OffSet[0], Module.GridPoints[0][1] - OffSet[1], fill = "none", stroke = "black"))
+        Module.Index = Index # Index in Grid
+        Module.GridSearch = GridSearch # Parent Object
 
-    def GetCells(Module, Position): # Gets Surrounding Grid Cell Objects (Based on Position Argument)
+    @property
+    def Data(Module): # Thickness, Angle, Selected
 
-        if Position == 0: Result = Module.GridSearch((Module.Index[0] - 1, Module.Index[1]))
-        elif Position == 1: Result = Module.GridSearch((Module.Index[0], Module.Index[1] + 1) if Module.MetaData[3] else (Module.Index[0], Module.Index[1] - 1))
-        elif Position == 2: Result = Module.GridSearch((Module.Index[0] + 1, Module.Index[1])) 
-        return Result
+        return [round(float(Module.GridSearch.Thickness[Module.Index[1], Module.Index[0]]), 5),
+        round(float(Module.GridSearch.Theta[Module.Index[1], Module.Index[0]]), 5),
+        bool(Module.GridSearch.Selected[Module.Index[1], Module.Index[0]])]
 
-    def Auxetics(Module): # Make Auxetic cuts in isometric cell (Most memory intensive component)
+    @Data.setter
+    def Data(Module, Values):
 
-        JointWidth = 3 # Width of Auxetic Hinge
+        Module.GridSearch.Thickness[Module.Index[1], Module.Index[0]] = Values[0]
+        Module.GridSearch.Theta[Module.Index[1], Module.Index[0]] = Values[1]
+        Module.GridSearch.Selected[Module.Index[1], Module.Index[0]] = Values[2]
 
-        ParameterI = (((Module.MetaData[0] - (1.5 * Module.Data[0]) - (Sine(60) * Module.Data[0] / Tangent(60 - Module.Data[1]))) / (1 + (Tangent(Module.Data[1]) / Tangent(60 - Module.Data[1])))) / Cosine(Module.Data[1])) - JointWidth # Length of Each Auxetic Line (2.5 is Gap Width)
+    @property
+    def MetaData(Module): # CellSize, XPosition, YPosition, Reversal (Derived from Index)
 
-        ParameterII = ((Sine(60) * Module.Data[0]) / Sine(60 - Module.Data[1])) + ((ParameterI + JointWidth) * Sine(Module.Data[1])) / Sine(60 - Module.Data[1])
+        Reversal = (Module.Index[0] + Module.Index[1]) % 2 == 0
 
-        if Module.MetaData[3]: # If Cell Is Reversed ... 
+        return (Module.GridSearch.CellSize, (Module.Index[0] - 1) * Module.GridSearch.CellSize / 2,
+        (Module.Index[1] - (0 if Reversal else 1)) * Math.sqrt(3 * (Module.GridSearch.CellSize ** 2) / 4), Reversal)
 
-            Points = [PolarToNormal(Module.CellAveraging(0), 60, (Module.MetaData[1] + OffSet[0], Module.MetaData[2] + OffSet[1])), # (Point 1)
-            PolarToNormal(ParameterII, Module.Data[1],
-            PolarToNormal(Module.Data[0], 60, (Module.MetaData[1] + OffSet[0], Module.MetaData[2] + OffSet[1]))), # (Point 2)
-            PolarToNormal(ParameterI, Module.Data[1], # Radius and Theta Value (Point 3)
-            PolarToNormal(Module.Data[0], 60, (Module.MetaData[1] + OffSet[0], Module.MetaData[2] + OffSet[1])))] # (Point 3)
+    def CellPoints(Module, Shift): # Nodes of Cell on a Surface (Apex, Left, Right), Shift is OffSet for the Screen (Scaled by the Zoom of the Grid)
 
-            RenderEngine.draw.aalines(ScreenObject, (255, 0, 0), False, Points, 2)
+        CellSize, XPosition, YPosition, Reversal = Module.MetaData
+        Zoom = Module.GridSearch.Zoom
 
-            Module.GridSearch.ExportSVG[2].append(Export.Lines(Points[0][0] - OffSet[0], Points[0][1] - OffSet[1], Points[1][0] - OffSet[0], Points[1][1] - OffSet[1], Points[2][0] - OffSet[0], Points[2][1] - OffSet[1], fill = "none", stroke = "black"))
+        return [((XPosition + 0.5 * CellSize) * Zoom + Shift[0], 
+        (YPosition + (CellSize * (3 ** 0.5) * 0.5) * (-1 if Reversal else 1)) * Zoom + Shift[1]),
+        (XPosition * Zoom + Shift[0], YPosition * Zoom + Shift[1]),
+        ((XPosition + CellSize) * Zoom + Shift[0], YPosition * Zoom + Shift[1])]
 
-            Points =  [(Module.MetaData[1] + Module.MetaData[0] - Module.CellAveraging(1) + OffSet[0], Module.MetaData[2] + OffSet[1]),
-            PolarToNormal(ParameterII, 120 + Module.Data[1],
-            (Module.MetaData[1] + Module.MetaData[0] - Module.Data[0] + OffSet[0], Module.MetaData[2] + OffSet[1])),
-            PolarToNormal(ParameterI, 120 + Module.Data[1],
-            (Module.MetaData[1] + Module.MetaData[0] - Module.Data[0] + OffSet[0], Module.MetaData[2] + OffSet[1]))]
+    def IsometricGrid(Module, Surface, Shift): # Basic outline of clickable Isometric Grid
 
-            RenderEngine.draw.aalines(ScreenObject, (0, 0, 200), False, Points, 2)
+        Points = Module.CellPoints(Shift)
+        if Module.Data[2]: RenderEngine.draw.aalines(Surface, (0,0, 0), True, Points, 5) # Selected Form - Triangles
+        else: [RenderEngine.draw.circle(Surface, (0, 0, 0), Points[_], 2) for _ in range(3)] # Unselected Form - Circular Nodes
 
-            Module.GridSearch.ExportSVG[2].append(Export.Lines(Points[0][0] - OffSet[0], Points[0][1] - OffSet[1], Points[1][0] - OffSet[0], Points[1][1] - OffSet[1], Points[2][0] - OffSet[0], Points[2][1] - OffSet[1], fill = "none", stroke = "black"))
+    def GetCells(Module, Position): # Gets Surrounding Grid Cell Objects (Based on Position Argument)
 
-            Points = [PolarToNormal(Module.MetaData[0] - Module.CellAveraging(2), 120, (Module.MetaData[1] + Module.MetaData[0] + OffSet[0], Module.MetaData[2] + OffSet[1])),
-            PolarToNormal(ParameterII, 240 + Module.Data[1], 
-            PolarToNormal(Module.MetaData[0] - Module.Data[0], 120, (Module.MetaData[1] + Module.MetaData[0] + OffSet[0], Module.MetaData[2] + OffSet[1]))), 
-            PolarToNormal(ParameterI, 240 + Module.Data[1], 
-            PolarToNormal(Module.MetaData[0] - Module.Data[0], 120, (Module.MetaData[1] + Module.MetaData[0] + OffSet[0], Module.MetaData[2] + OffSet[1])))]
+        if Position == 0: Result = Module.GridSearch((Module.Index[0] - 1, Module.Index[1]))
+        elif Position == 1: Result = Module.GridSearch((Module.Index[0], Module.Index[1] + 1) if Module.MetaData[3] else (Module.Index[0], Module.Index[1] - 1))
+        elif Position == 2: Result = Module.GridSearch((Module.Index[0] + 1, Module.Index[1])) 
+        return Result
 
-            RenderEngine.draw.aalines(ScreenObject, (195, 0, 255), False, Points, 2)
+    def Auxetics(Module, Surface, Shift): # Draws Auxetic cuts from the Geometry cached by the Grid (Translate and Blit a cached Sprite where possible)
 
-            Module.GridSearch.ExportSVG[2].append(Export.Lines(Points[0][0] - OffSet[0], Points[0][1] - OffSet[1], Points[1][0] - OffSet[0], Points[1][1] - OffSet[1], Points[2][0] - OffSet[0], Points[2][1] - OffSet[1], fill = "none", stroke = "black"))
+        Cuts = Module.GridSearch.Geometry[0][Module.Index[1] - Module.GridSearch.CanvasRange[0].start, Module.Index[0] - Module.GridSearch.CanvasRange[1].start]
+        Zoom = Module.GridSearch.Zoom
 
-        else: # If Cell is Normal ... 
+        if Module.GridSearch.SpriteCache == None:
 
-            Points = [PolarToNormal(Module.CellAveraging(0), -60, (Module.MetaData[1] + OffSet[0], Module.MetaData[2] + OffSet[1])), 
-            PolarToNormal(ParameterII, - Module.Data[1], 
-            PolarToNormal(Module.Data[0], -60, (Module.MetaData[1] + OffSet[0], Module.MetaData[2] + OffSet[1]))),
-            PolarToNormal(ParameterI, - Module.Data[1], 
-            PolarToNormal(Module.Data[0], -60, (Module.MetaData[1] + OffSet[0], Module.MetaData[2] + OffSet[1])))]
+            for Cut in range(3): RenderEngine.draw.aalines(Surface, Geometry.Colours[Cut], False, (Cuts[Cut] * Zoom + Shift).tolist(), 2)
 
-            RenderEngine.draw.aalines(ScreenObject, (255, 0, 0), False, Points, 2)
-            
-            Module.GridSearch.ExportSVG[2].append(Export.Lines(Points[0][0] - OffSet[0], Points[0][1] - OffSet[1], Points[1][0] - OffSet[0], Points[1][1] - OffSet[1], Points[2][0] - OffSet[0], Points[2][1] - OffSet[1], fill = "none", stroke = "black"))
+            return
 
-            Points = [(Module.MetaData[1] + Module.MetaData[0] - Module.CellAveraging(1) + OffSet[0], Module.MetaData[2] + OffSet[1]),
-            PolarToNormal(ParameterII, 240 - Module.Data[1], 
-            (Module.MetaData[1] + Module.MetaData[0] - Module.Data[0] + OffSet[0], Module.MetaData[2] + OffSet[1])),
-            PolarToNormal(ParameterI, 240 - Module.Data[1], 
-            (Module.MetaData[1] + Module.MetaData[0] - Module.Data[0] + OffSet[0], Module.MetaData[2] + OffSet[1]))]
+        Position = (round((Module.MetaData[1] * Zoom + Shift[0]) * 4) / 4, round((Module.MetaData[2] * Zoom + Shift[1]) * 4) / 4) # Sprites are rasterized at Quarter Pixel Phases
+        Phase = (Position[0] - Math.floor(Position[0]), Position[1] - Math.floor(Position[1]))
+        Key = (*Module.GridSearch.Geometry[2][Module.Index[1] - Module.GridSearch.CanvasRange[0].start, Module.Index[0] - Module.GridSearch.CanvasRange[1].start].tolist(), *Phase, Zoom)
+        Sprite = Module.GridSearch.SpriteCache.Get(Key)
 
-            RenderEngine.draw.aalines(ScreenObject, (0, 0, 200), False, Points, 2)
+        if Sprite is None:
 
-            Module.GridSearch.ExportSVG[2].append(Export.Lines(Points[0][0] - OffSet[0], Points[0][1] - OffSet[1], Points[1][0] - OffSet[0], Points[1][1] - OffSet[1], Points[2][0] - OffSet[0], Points[2][1] - OffSet[1], fill = "none", stroke = "black"))
+            Sprite = AuxeticSprite((Cuts - Module.MetaData[1:3]) * Zoom, Module.MetaData[3], Phase, Module.MetaData[0] * Zoom)
+            Module.GridSearch.SpriteCache.Put(Key, Sprite)
 
-            Points = [PolarToNormal(Module.MetaData[0] - Module.CellAveraging(2), 240, (Module.MetaData[1] + Module.MetaData[0] + OffSet[0], Module.MetaData[2] + OffSet[1])),
-            PolarToNormal(ParameterII, 120 - Module.Data[1], 
-            PolarToNormal(Module.MetaData[0] - Module.Data[0], 240, (Module.MetaData[1] + Module.MetaData[0] + OffSet[0], Module.MetaData[2] + OffSet[1]))),
-            PolarToNormal(ParameterI, 120 - Module.Data[1], 
-            PolarToNormal(Module.MetaData[0] - Module.Data[0], 240, (Module.MetaData[1] + Module.MetaData[0] + OffSet[0], Module.MetaData[2] + OffSet[1])))]
-            
-            RenderEngine.draw.aalines(ScreenObject, (195, 0, 255), False, Points, 2)
+        Margin = SpriteMargin(Module.MetaData[0] * Zoom, Module.MetaData[3])
+        Surface.blit(Sprite, (Math.floor(Position[0]) - Margin[0], Math.floor(Position[1]) - Margin[1]), special_flags = RenderEngine.BLEND_RGB_MULT)
 
-            Module.GridSearch.ExportSVG[2].append(Export.Lines(Points[0][0] - OffSet[0], Points[0][1] - OffSet[1], Points[1][0] - OffSet[0], Points[1][1] - OffSet[1], Points[2][0] - OffSet[0], Points[2][1] - OffSet[1], fill = "none", stroke = "black"))
+    def CellRendering(Module, Surface, Shift):
 
-        [Module.CellOutline(_) for _ in range(3)] # Check Surrounding Cells and Draw SVG Outline
-
-    def CellRendering(Module):
-
-        Module.IsometricGrid()
+        Start = Profile.Clock()
+        Module.IsometricGrid(Surface, Shift)
+        Profile.Add("Outlines", Start)
 
         if Module.Data[2]: 
             
-            Module.Auxetics()
+            Start = Profile.Clock()
+            Module.Auxetics(Surface, Shift)
+            Profile.Add("Cuts", Start)
+
+        Profile.Count("Cells Rendered")
 
     def ClickEvent(Module):
 
+        Old = History.CellValues(*Module.GridSearch.GridArrays(), [Module.Index[0]], [Module.Index[1]])
         Module.Data = [5, 2.5, not Module.Data[2]]
+        Module.GridSearch.Commit([Module.Index[0]], [Module.Index[1]], Old)
+        Module.GridSearch.Invalidate(Module.Index) # Only this cell and its Neighbours need to be recomputed and redrawn
 
-    def CellValueAdjustment(Module):
+    def CellValueAdjustment(Module): # Panel editing this cell, Shift + Right Click adds more cells to it (Edits are applied to every cell in one update)
 
         AdjustmentWindow = WindowRender.Frame(WindowRendering)
+        Module.GridSearch.Selection = [Module.Index] # Cells edited by the Panel
+        Pending = [None] # Scheduled Edit (Typing is applied once it pauses for Grid.EditDelay)
+
+        def ApplyValues():
+
+            Pending[0] = None
+
+            if Thickness.get() != "" and Theta.get() != "" and ValidateTheta(Theta.get()) and ValidateThickness(Thickness.get(), Module.MetaData[0]): 
+                
+                Module.GridSearch.SetValues(Module.GridSearch.Selection, float(Thickness.get()), float(Theta.get())) # Redrawn on the next Frame
+
+        def CellFade(Event = None):
 
-        def CellFade(*Values):
+            if Event != None and Event.state & 0x0001: return # Shift is held (Adding cells to the Panel)
 
+            if Pending[0] != None: 
+                
+                WindowRendering.after_cancel(Pending[0])
+                ApplyValues()
+
+            Module.GridSearch.Selection = []
+            Module.GridSearch.SelectionLabel = None
             AdjustmentWindow.destroy()
             FrameObject.unbind_all("<Button-1>")
             FrameObject.unbind_all("<Button-3>")
@@ -311,20 +314,19 @@ class GridCell: # Each Component is a Single Bistable Auxetic Cell
         ThetaInput = ExtensionsI.Entry(AdjustmentWindow, textvariable = Theta, font = ("Bahnschrift", 10), width = 5, justify = "center", validate = "key", validatecommand = (AdjustmentWindow.register(ValidateTheta), '%P'))
         ThetaLabel.grid(row = 2, column = 0, padx = 15)
         ThetaInput.grid(row = 2, column = 1, ipady = 10, ipadx = 10)
+        Module.GridSearch.SelectionLabel = WindowRender.Label(AdjustmentWindow, text = "1 Cell", font = ("Bahnschrift", 8)) # Number of cells edited by the Panel
+        Module.GridSearch.SelectionLabel.grid(row = 3, column = 0, columnspan = 2)
         CloseButton = WindowRender.Button(AdjustmentWindow, text="Close", command = CellFade, width = 15, highlightthickness = 0, bd = 0, font = ("Bahnschrift", 10))
-        CloseButton.grid(row = 3, column = 0, columnspan = 2)
+        CloseButton.grid(row = 4, column = 0, columnspan = 2)
         AdjustmentWindow.update()
         AdjustmentWindow.place(
         x = WindowRendering.winfo_screenwidth() - AdjustmentWindow.winfo_reqwidth(),
         y = WindowRendering.winfo_screenheight() - AdjustmentWindow.winfo_reqheight() - CloseButton.winfo_reqheight())
 
-        def UpdateValues(*Values):
-    
-            if Thickness.get() != "" and Theta.get() != "" and ValidateTheta(Theta.get()) and ValidateThickness(Thickness.get(), Module.MetaData[0]): 
-                
-                Module.Data[0], Module.Data[1] = float(Thickness.get()), float(Theta.get())
+        def UpdateValues(*Values): # Restarts the Edit Delay on every Keystroke
 
-            Module.GridSearch.RenderGrid()
+            if Pending[0] != None: WindowRendering.after_cancel(Pending[0])
+            Pending[0] = WindowRendering.after(Module.GridSearch.EditDelay, ApplyValues)
 
         Thickness.trace_add('write', UpdateValues)
         Theta.trace_add('write', UpdateValues)
@@ -335,124 +337,378 @@ class GridCell: # Each Component is a Single Bistable Auxetic Cell
 
         return f'\nGrid Cell Object:\n\nThickness: { Module.Data[0]}\n\nAngle: {Module.Data[1]}\n'
 
-class Grid: # Sets up Grid of GridCell objects based on preset argument or Screen Size
+class Grid: # Holds the State of every cell in contiguous Arrays, based on preset argument or Screen Size
 
     def __init__(Module, GUI, CellSize = 50, Input = [], Dimension = [0, 0]):
 
-        Module.Clock = RenderEngine.time.Clock() # Controls Frame Rate (40 FPS)
         Module.GUI = GUI
         Module.RunProgram = True
         Module.Dimension = Dimension if bool(Dimension[0]) and bool(Dimension[1]) else [
         int(WindowSize()[0] / CellSize) + 1,
         int(WindowSize()[1] // (Math.sqrt( 3 * (CellSize ** 2) / 4)) + 1)]
         Module.CellSize = CellSize
-        Module.ExportSVG = [Export.Drawing(Module.Dimension[0] * CellSize, Module.Dimension[1] * Math.sqrt(3 * (CellSize ** 2) / 4), origin = (0, 0)), Export.Group(id = "Outline"), Export.Group(id = "Auxetics")]
-
-        Module.Grid = [
-            
-        [(GridCell(Module, # Parent Grid Object
-        (2 * XDimension + 1 if # Index Calculation
-        bool(YDimension % 2) else 
-        2 * XDimension, YDimension + 1),
-        ((XDimension * Module.CellSize + (YDimension % 2) * (Module.CellSize / 2)) - 0.5 * CellSize,
-        (YDimension * Math.sqrt(3 * (Module.CellSize ** 2) / 4))), #Calculate Position
-        Module.CellSize, # Size of Isometric Cell
-        Reversal = False), # Type of Cell (Reversed or Normal)
-
-        GridCell(Module,
-        (2 * XDimension + 1 if
-        bool(YDimension % 2) else
-        2 * XDimension, YDimension), 
-        ((XDimension * Module.CellSize + (YDimension % 2) * (Module.CellSize / 2)) - 0.5 * CellSize,
-        (YDimension * Math.sqrt(3 * (Module.CellSize ** 2) / 4))), 
-        Module.CellSize, 
-        Reversal = True))
-
-        for XDimension in range(Module.Dimension[0])] # loops over Each Row
-        
-        for YDimension in range(Module.Dimension[1])] # Loops over Each Column
+        Module.Exists = Geometry.CellExistence(Module.Dimension) # Indices occupied by a Cell (Reversal and Position are derived from the Index)
+        Thickness, Theta, Selected = Input if isinstance(Input, tuple) else Input.GridArrays() if isinstance(Input, Format.Design) else Geometry.DesignArrays(Module.Dimension, Input) # Applies existing Data (Grid Arrays, a loaded Design, or [[X, Y], Thickness, Theta] per Cell)
+        Module.Thickness = Thickness.astype(Data.float32) # State of every Cell (Indexed [Y][X])
+        Module.Theta = Theta.astype(Data.float32)
+        Module.Selected = Selected
+        Module.Geometry = None # Cached Geometry of the cells on the Canvas (Cuts, Outlines, Keys), Indexed relative to Module.CanvasRange
+        Module.Dirty = set() # Indices of cells that must be redrawn
+        Module.Fragments = {} # SVG Path data of each exported cell (Outline, Auxetics), Removed when a cell or its Neighbour is edited
+        Module.GeometryCache = Geometry.GeometryCache(CellSize) # Cuts shared by cells with the same Parameters (Hits and Misses in Module.GeometryCache.Hits / .Misses)
+        Module.SpriteCache = Geometry.LeastRecentlyUsed(512) # Pre-rasterized Cuts (Set to None to draw Cuts directly)
+        Module.Canvas = None # Off-screen Surface holding the rendered Viewport and a Margin around it (Scrolling only blits it)
+        Module.CanvasShift = (0, 0) # Position of Grid Origin on the Canvas
+        Module.CanvasRange = None # Rows and Columns of cells drawn on the Canvas (None if it must be Re-rendered)
+        Module.FramePending = None # Scheduled Frame (Tkinter 'after' Identifier), Invalidations before it are drawn together
+        Module.Moved = False # Viewport moved since the last Frame (Canvas must be presented again)
+        Module.LastFrame = -1000 # Time of the last Frame (Milliseconds)
+        Module.FrameTime = 25 # Minimum Time between Frames (Caps Frame Rate to 40 FPS while changes keep arriving)
+        Module.IdleTime = 250 # Time between Idle Polls (Events not reported by Tkinter, such as Quitting)
+        Module.EditDelay = 150 # Typing in the Adjustment Panel is applied once it pauses for this long (Milliseconds)
+        Module.Selection = [] # Cells edited by the open Adjustment Panel
+        Module.SelectionLabel = None # Label of the open Adjustment Panel
+        Module.ExtendSelection = False # Shift was held during the last Click
+        Module.RegionLimit = 1024 # Larger Region Edits re-render the Canvas once instead of redrawing each cell
+        Module.Edits = History.History() # Undo and Redo (Deltas of edited cells)
+        Module.Zoom = 1.0 # Screen Pixels per unit of the Grid (Cell Size is unchanged, so Designs are not affected)
+        Module.ZoomLimits = (0.01, 4.0)
+        Module.ZoomModifier = False # Control was held during the last Scroll (Scrolling Zooms instead)
+        Module.DetailSize = 32 # Cells smaller than this (Pixels) are drawn as shaded triangles instead of their Cuts (Level of Detail)
 
-        Grid = [[None for _ in range(2 * Module.Dimension[0])] for _ in range(Module.Dimension[1] + 1)]
-        
-        Module.Grid = list(ToolI(*[ # Reorganizing grid so that it can be efficiently indexed into.
-        [XPosition[0] 
-        for XPosition in YPosition]
-        for YPosition in Module.Grid]
-        + [[XPosition[1] for XPosition in YPosition]
-        for YPosition in Module.Grid]))
+        Module.RenderLoop()
 
-        for Cell in Module.Grid: 
+    def __call__(Module, Input): # Same Structure as Module.UpdateGrid() Function
 
-            Grid[Cell.Index[1]][Cell.Index[0]] = Cell
+        if 0 <= Input[0] < 2 * Module.Dimension[0] and 0 <= Input[1] <= Module.Dimension[1] and Module.Exists[Input[1], Input[0]]:
 
-        Module.Grid = Grid
+            return GridCell(Module, (int(Input[0]), int(Input[1])))
 
-        for Inputs in Input: 
-            
-            if Module(Inputs[0]) != None: 
-                
-                Module(Inputs[0]).Data[2] = True # Loops through Inputs and applies existing Data
-                Module(Inputs[0]).Data[0] = Inputs[1]
-                Module(Inputs[0]).Data[1] = Inputs[2]
+        return None
 
-        Module.RenderLoop()
+    def CellAt(Module, Position): # Cell under a Position on the Screen, in constant time (None if there is no cell)
 
-    def __call__(Module, Input): # Same Structure as Module.UpdateGrid() Function
+        return Module(tuple(int(_) for _ in Geometry.CellIndex((Position[0] - OffSet[0]) / Module.Zoom, (Position[1] - OffSet[1]) / Module.Zoom, Module.CellSize)))
 
-        if 0 <= Input[0] < 2 * Module.Dimension[0] and 0 <= Input[1] < Module.Dimension[1]:
+    def Cells(Module, Rows = slice(None), Columns = slice(None)): # Cells in a block of the Grid
 
-            return Module.Grid[Input[1]][Input[0]]
+        return [GridCell(Module, (IndexX + (Columns.start or 0), IndexY + (Rows.start or 0))) for IndexY, IndexX in Data.argwhere(Module.Exists[Rows, Columns]).tolist()]
 
-        return None
+    def CellList(Module): # Selected cells as [[X, Y], Thickness, Theta] (.baux Data)
 
-    def RenderLoop(Module):
-        
-        if RenderEngine.time.get_ticks() < 1000: 
+        IndexY, IndexX = Data.nonzero(Module.Selected)
 
-            ClearEntireScreen(ScreenObject)
+        return [[[X, Y], round(Thickness, 5), round(Theta, 5)] for X, Y, Thickness, Theta in zip(IndexX.tolist(), IndexY.tolist(),
+        Module.Thickness[IndexY, IndexX].astype(Data.float64).tolist(), Module.Theta[IndexY, IndexX].astype(Data.float64).tolist())]
 
-            Module.ExportSVG = [Export.Drawing(
-                Module.Dimension[0] * Module.CellSize,
-                Module.Dimension[1] * Math.sqrt(3 * (Module.CellSize ** 2) / 4),
-                origin = (0, 0)), 
-                Export.Group(id = "Outline"), 
-                Export.Group(id = "Auxetics")
-            ]
+    def RenderLoop(Module): # Idle Poll, Frames are only drawn when something changes (See RequestFrame)
         
-        global CanvasFocus, OffSet
-        Module.Clock.tick(40) # Limit Frame Rate to 40 FPS
-        RenderEngine.draw.rect(ScreenObject, # Drawing Border for Grid
-        (0, 0, 0),
-        (OffSet[0] - 0.5 * Module.CellSize, OffSet[1] - Math.sqrt(3 * Module.CellSize ** 2 / 4), # Grid Moves With Offset
-        Module.CellSize * (Module.Dimension[0] + 0.5), 
-        Math.sqrt(3 * Module.CellSize ** 2 / 4) * (Module.Dimension[1] + 1)), 1, 5)
-        if RenderEngine.time.get_ticks() < 1000: Module.RenderGrid()
+        global CanvasFocus
+        Starting = RenderEngine.time.get_ticks() < 1000
+        if Starting: Module.RequestFrame(Moved = True) # Window is still being laid out
         Module.HandleEventListeners()
-        if Module.RunProgram: WindowRendering.after(20, Module.RenderLoop) # Theoretical Frame Rate of 50 FPS
+        if Module.RunProgram: WindowRendering.after(Module.FrameTime if Starting else Module.IdleTime, Module.RenderLoop)
         else: ClearEntireScreen(ScreenObject)
         if not CanvasFocus: UpdateScreen()
         CanvasFocus = RenderEngine.mouse.get_focused()
 
-    def RenderGrid(Module):
+    def Wake(Module, Event = None): # Input reported by Tkinter, processed as soon as Tkinter is idle (No Polling Delay)
+
+        Module.ExtendSelection = Event != None and bool(Event.state & 0x0001) # Keyboard Modifiers are only known to Tkinter
+        Module.ZoomModifier = Event != None and bool(Event.state & 0x0004) # Control + Scrolling Zooms (The Wheel is Button-4/5 on X11, MouseWheel elsewhere)
+        if Module.RunProgram: WindowRendering.after_idle(Module.HandleEventListeners)
+
+    def RequestFrame(Module, Moved = False): # Schedules a single Frame for every change made before it is drawn
+
+        Module.Moved = Module.Moved or Moved
+
+        if Module.FramePending != None or not Module.RunProgram: return
+
+        Module.FramePending = WindowRendering.after(max(Module.FrameTime - (RenderEngine.time.get_ticks() - Module.LastFrame), 0), Module.RenderFrame)
+
+    def RenderFrame(Module): # Draws everything changed since the last Frame
+
+        Module.FramePending = None
+
+        if not Module.RunProgram: return
+
+        Module.LastFrame = RenderEngine.time.get_ticks()
+        Profile.BeginFrame()
+        Module.RenderDirty()
+
+        if Module.Moved: 
+            
+            Module.Moved = False
+            Module.RenderGrid()
+
+        Profile.EndFrame(ScreenObject) # Overlay is drawn over the presented Frame
+
+    def RenderBorder(Module, Surface, Shift):
+
+        RenderEngine.draw.rect(Surface, # Drawing Border for Grid
+        (0, 0, 0),
+        (Shift[0] - 0.5 * Module.CellSize * Module.Zoom, Shift[1] - Math.sqrt(3 * Module.CellSize ** 2 / 4) * Module.Zoom, # Grid Moves With Offset
+        Module.CellSize * (Module.Dimension[0] + 0.5) * Module.Zoom, 
+        Math.sqrt(3 * Module.CellSize ** 2 / 4) * (Module.Dimension[1] + 1) * Module.Zoom), 1, 5)
+
+    def RenderCanvas(Module, Margin = 256): # Renders the cells around the Viewport onto the Off-screen Canvas (Only when cell data changes, or the Viewport leaves it)
+
+        Size = (ScreenObject.get_width() + 2 * Margin, ScreenObject.get_height() + 2 * Margin)
+
+        if Module.Canvas is None or Module.Canvas.get_size() != Size: Module.Canvas = RenderEngine.Surface(Size, 0, ScreenObject)
+
+        Module.CanvasShift = (round(OffSet[0]) + Margin, round(OffSet[1]) + Margin)
+        Module.CanvasRange = Geometry.CellRange((-Module.CanvasShift[0] / Module.Zoom, -Module.CanvasShift[1] / Module.Zoom, (Size[0] - Module.CanvasShift[0]) / Module.Zoom, (Size[1] - Module.CanvasShift[1]) / Module.Zoom), Module.CellSize, Module.Dimension)
 
-        ClearEntireScreen(ScreenObject)
+        if not Module.Detailed(): # Cost depends on the size of the Canvas, not the number of cells on it
 
-        Module.ExportSVG = [Export.Drawing(
-            Module.Dimension[0] * Module.CellSize,
-            Module.Dimension[1] * Math.sqrt(3 * (Module.CellSize ** 2) / 4),
-            origin = (0, 0)), 
-            Export.Group(id = "Outline"), 
-            Export.Group(id = "Auxetics")
-        ]
+            Module.Geometry = None
+            Profile.Call("Shading", Module.RenderShading)
+            Module.RenderBorder(Module.Canvas, Module.CanvasShift)
+            Module.Dirty = set()
+            return
+
+        Profile.Call("Geometry", Module.CanvasGeometry)
+        ClearEntireScreen(Module.Canvas)
+        Module.RenderBorder(Module.Canvas, Module.CanvasShift)
         
-        [[XPosition.CellRendering() if XPosition != None else None
-        for XPosition in YPosition] for YPosition in Module.Grid]
+        with Profile.Span("Render Canvas"): [Cell.CellRendering(Module.Canvas, Module.CanvasShift) for Cell in Module.Cells(*Module.CanvasRange)] # Only cells overlapping the Canvas (Viewport Culling)
+
+        Module.Dirty = set()
+
+    def Detailed(Module): # Cells are large enough on the Screen to draw their Cuts
+
+        return Module.CellSize * Module.Zoom >= Module.DetailSize
+
+    def ShadingColours(Module, Rows = slice(None), Columns = slice(None)): # Colour of each cell of a block (Indexed [Y][X]), Selected cells are shaded by Theta (Blue to Red) and Thickness (Lighter to Darker)
+
+        (ThicknessMinimum, ThicknessMaximum), (ThetaMinimum, ThetaMaximum) = Regions.Limits(Module.CellSize)
+        Thickness, Theta, Selected = Module.GridArrays(Rows, Columns)
+        Theta = Data.clip((Theta - ThetaMinimum) / (ThetaMaximum - ThetaMinimum), 0, 1)[..., None]
+        Thickness = Data.clip((Thickness - ThicknessMinimum) / (ThicknessMaximum - ThicknessMinimum), 0, 1)[..., None]
+        Colours = (1 - Theta) * Data.float32(Geometry.Colours[1]) + Theta * Data.float32(Geometry.Colours[0])
+        Colours = 255 + (Colours - 255) * (0.35 + 0.65 * Thickness) # Thin cells fade towards White
+        Colours = Data.where(Selected[..., None], Colours, Data.where(Module.Exists[Rows, Columns][..., None], 225, 255)) # Unselected cells are Grey
+
+        return Colours.astype(Data.uint8)
+
+    def RenderShading(Module): # Draws every cell on the Canvas as a filled triangle (Level of Detail for small cells), using the analytic Hit-Test on each Pixel
+
+        Width, Height = Module.Canvas.get_size()
+        Rows, Columns = Module.CanvasRange
+        Extent = (Module.CanvasShift[0] - 0.5 * Module.CellSize * Module.Zoom, Module.CanvasShift[1] - Geometry.CellHeight(Module.CellSize) * Module.Zoom,
+        Module.CanvasShift[0] + Module.CellSize * (Module.Dimension[0] + 0.5) * Module.Zoom, Module.CanvasShift[1] + Geometry.CellHeight(Module.CellSize) * Module.Dimension[1] * Module.Zoom) # Pixels covered by the Grid
+        PixelColumns = slice(min(max(Math.floor(Extent[0]), 0), Width), min(max(Math.ceil(Extent[2]), 0), Width))
+        PixelRows = slice(min(max(Math.floor(Extent[1]), 0), Height), min(max(Math.ceil(Extent[3]), 0), Height))
+        Colours = Module.ShadingColours(Rows, Columns)
+        Table = Data.concatenate([Colours.reshape(-1, 3), Data.full((1, 3), 255, dtype = Data.uint8)]) # Last Colour is outside the Grid
+        X = (Data.arange(PixelColumns.start, PixelColumns.stop) + 0.5 - Module.CanvasShift[0]) / Module.Zoom
+        Y = (Data.arange(PixelRows.start, PixelRows.stop) + 0.5 - Module.CanvasShift[1]) / Module.Zoom
+        IndexX, IndexY = Geometry.CellIndex(X[:, None], Y[None, :], Module.CellSize)
+        IndexX, IndexY = IndexX - Columns.start, IndexY - Rows.start
+        Inside = (0 <= IndexX) & (IndexX < Colours.shape[1]) & (0 <= IndexY) & (IndexY < Colours.shape[0])
+        Pixels = Data.full((Width, Height, 3), 255, dtype = Data.uint8) # Indexed [X][Y] (pygame.surfarray)
+        Pixels[PixelColumns, PixelRows] = Table[Data.where(Inside, IndexY * Colours.shape[1] + IndexX, len(Table) - 1)] # One lookup per Pixel
+        RenderEngine.surfarray.blit_array(Module.Canvas, Pixels)
+
+    def ZoomAt(Module, Position, Factor): # Zooms around a Position on the Screen (The point of the Grid under it stays in place)
+
+        Zoom = min(max(Module.Zoom * Factor, Module.ZoomLimits[0]), Module.ZoomLimits[1])
+
+        if Zoom == Module.Zoom: return
 
+        OffSet[0] = Position[0] - (Position[0] - OffSet[0]) * Zoom / Module.Zoom
+        OffSet[1] = Position[1] - (Position[1] - OffSet[1]) * Zoom / Module.Zoom
+        Module.Zoom = Zoom
+        Module.Invalidate() # Canvas is drawn again at the new Zoom (Cached Sprites are kept per Zoom)
+
+    def RenderGrid(Module): # Presents the Canvas at the current OffSet (Re-rendered only if cell data changed or the Viewport left the Canvas)
+
+        Position = (round(OffSet[0]) - Module.CanvasShift[0], round(OffSet[1]) - Module.CanvasShift[1]) # Position of Canvas on Screen
+
+        if (Module.Canvas is None or Module.CanvasRange == None or Position[0] > 0 or Position[1] > 0 or
+        Position[0] + Module.Canvas.get_width() < ScreenObject.get_width() or Position[1] + Module.Canvas.get_height() < ScreenObject.get_height()): 
+            
+            Module.RenderCanvas()
+            Position = (round(OffSet[0]) - Module.CanvasShift[0], round(OffSet[1]) - Module.CanvasShift[1])
+
+        ScreenObject.blit(Module.Canvas, Position)
         UpdateScreen()
 
+    def InCanvas(Module, Index): # Checks if a cell is drawn on the Canvas
+
+        return Module.CanvasRange[0].start <= Index[1] < Module.CanvasRange[0].stop and Module.CanvasRange[1].start <= Index[0] < Module.CanvasRange[1].stop
+
+    def RenderDirty(Module): # Clears and Redraws only the dirty cells (and the cells touching them) on the Canvas, instead of the entire Grid
+
+        if Module.Canvas is None or Module.CanvasRange == None: return Module.RenderGrid()
+
+        if not Module.Dirty: return
+
+        if not Module.Detailed(): # Shading is redrawn in one pass
+
+            Module.CanvasRange = None
+            return Module.RenderGrid()
+
+        Areas = []
+
+        for Index in Module.Dirty: # Each dirty cell is cleared and redrawn within its own bounding box, so nothing is drawn twice
+
+            if not Module.InCanvas(Index): continue # Off-screen cells are drawn when the Canvas reaches them
+
+            Points = Data.array(Module(Index).CellPoints(Module.CanvasShift))
+            Area = RenderEngine.Rect(*(Points.min(axis = 0) - 3), *(Points.max(axis = 0) - Points.min(axis = 0) + 7))
+            Module.Canvas.set_clip(Area)
+            Module.Canvas.fill((255, 255, 255), Area)
+            [Cell.CellRendering(Module.Canvas, Module.CanvasShift) for Cell in (Module((Index[0] + X, Index[1] + Y)) for Y in range(-1, 2) for X in range(-2, 3)) if Cell != None and Module.InCanvas(Cell.Index)] # Cells sharing a Node with the dirty cell
+            Module.RenderBorder(Module.Canvas, Module.CanvasShift)
+            Areas.append(Area)
+
+        Module.Canvas.set_clip(None)
+        Module.Dirty = set()
+        Areas = [(ScreenObject.blit(Module.Canvas, Area.move(round(OffSet[0]) - Module.CanvasShift[0], round(OffSet[1]) - Module.CanvasShift[1]), Area)) for Area in Areas] # Copy Redrawn Areas to the Screen
+        Profile.Call("Display", RenderEngine.display.update, Areas) # Only Update the Redrawn Areas
+
+    def Invalidate(Module, Index = None): # Marks an edited cell and its Neighbours as dirty (Entire Grid if no Index is given)
+
+        if Index == None: 
+            
+            Module.CanvasRange = None # Canvas is Re-rendered on the next RenderGrid
+            return Module.RequestFrame(Moved = True)
+
+        Module.InvalidateCells([Index])
+
+    def InvalidateCells(Module, Indices): # Marks edited cells and their Neighbours as dirty, in a single update
+
+        Indices = Data.array(Indices, dtype = Data.int64).reshape(-1, 2)
+        Cells = Data.concatenate([Indices, Geometry.NeighbourIndices(Indices[:, 0], Indices[:, 1]).reshape(-1, 2)]) # Neighbour cuts are averaged with these cells
+        Cells = Cells[(0 <= Cells[:, 0]) & (Cells[:, 0] < Module.Exists.shape[1]) & (0 <= Cells[:, 1]) & (Cells[:, 1] < Module.Exists.shape[0])]
+        Cells = set(map(tuple, Cells[Module.Exists[Cells[:, 1], Cells[:, 0]]].tolist()))
+        Module.UpdateGeometry(list(Cells))
+        Module.Dirty.update(Cells)
+        [Module.Fragments.pop(_, None) for _ in Cells]
+        Module.RequestFrame()
+
+    def SetValues(Module, Indices, Thickness, Theta): # Applies one Thickness and Theta to many (Selected) cells
+
+        Indices = Data.array(Indices, dtype = Data.int64).reshape(-1, 2)
+        Old = History.CellValues(*Module.GridArrays(), Indices[:, 0], Indices[:, 1])
+        Module.Thickness[Indices[:, 1], Indices[:, 0]] = Thickness
+        Module.Theta[Indices[:, 1], Indices[:, 0]] = Theta
+        Module.Selected[Indices[:, 1], Indices[:, 0]] = True
+        Module.Commit(Indices[:, 0], Indices[:, 1], Old)
+        Module.InvalidateCells(Indices)
+
+    def EditRegion(Module, Mask, Thickness = None, Theta = None, Select = True): # Sets Thickness and Theta of every cell in a Region (Regions.RectangleMask, LassoMask, FloodMask ...) from a Field, with a single Redraw
+
+        IndexY, IndexX = Data.nonzero(Data.asarray(Mask, dtype = bool) & Module.Exists)
+        Old = History.CellValues(*Module.GridArrays(), IndexX, IndexY)
+        IndexX, IndexY = Regions.EditRegion(Module.Thickness, Module.Theta, Module.Selected, Mask, Thickness, Theta, Module.CellSize, Select)
+        Module.Commit(IndexX, IndexY, Old) # A single Entry for the whole Region
+        Module.InvalidateRegion(IndexX, IndexY)
+
+    def InvalidateRegion(Module, IndexX, IndexY): # Marks many edited cells as dirty, Large Regions re-render the Canvas once instead
+
+        if len(IndexX) <= Module.RegionLimit: return Module.InvalidateCells(Data.column_stack([IndexX, IndexY])) # Small Regions are redrawn cell by cell
+
+        Edited = Data.zeros(Module.Exists.shape, dtype = bool)
+        Cells = Geometry.NeighbourIndices(IndexX, IndexY).reshape(-1, 2)
+        Cells = Cells[(0 <= Cells[:, 0]) & (Cells[:, 0] < Edited.shape[1]) & (0 <= Cells[:, 1]) & (Cells[:, 1] < Edited.shape[0])]
+        Edited[IndexY, IndexX] = True
+        Edited[Cells[:, 1], Cells[:, 0]] = True
+        Module.Fragments = {Index: Fragment for Index, Fragment in Module.Fragments.items() if not Edited[Index[1], Index[0]]}
+        Module.Invalidate() # Canvas is re-rendered once
+
+    def Commit(Module, IndexX, IndexY, Old): # Records an edit (Old values of the edited cells, from History.CellValues) as one Undo Entry
+
+        Module.Edits.Record(IndexX, IndexY, Old, History.CellValues(*Module.GridArrays(), IndexX, IndexY))
+
+    def Undo(Module): # Restores the cells of the last edit (Only they are redrawn)
+
+        Cells = Module.Edits.Undo(*Module.GridArrays())
+
+        if Cells != None: Module.InvalidateRegion(*Cells)
+
+    def Redo(Module):
+
+        Cells = Module.Edits.Redo(*Module.GridArrays())
+
+        if Cells != None: Module.InvalidateRegion(*Cells)
+
+    def OpenJournal(Module, Path): # Replays unsaved edits left in the Journal of a .baux file (Path), then journals new edits to it
+
+        Replay = History.ReplayJournal(History.JournalPath(Path), Path, *Module.GridArrays(), Module.Edits)
+
+        if Replay != None:
+
+            print(f"Recovered {Replay.Position} unsaved Edit{'s' if Replay.Position != 1 else ''} of {System.path.basename(Path)}\n")
+            Module.Invalidate()
+
+        elif System.path.exists(History.JournalPath(Path)): System.remove(History.JournalPath(Path)) # Stale Journal (The design was changed since it was written)
+
+        Module.Edits.Open(History.JournalPath(Path), Path)
+
+    def ExtendAdjustment(Module, Index): # Adds a cell to (or removes it from) the open Adjustment Panel
+
+        if Index in Module.Selection: 
+            
+            if len(Module.Selection) > 1: Module.Selection.remove(Index)
+
+        else: Module.Selection.append(Index)
+
+        Module.SelectionLabel.config(text = f"{len(Module.Selection)} Cell{'s' if len(Module.Selection) > 1 else ''}")
+
+    def CanvasGeometry(Module): # Computes Geometry of every cell on the Canvas in one batch (Off-screen Geometry is only produced when exported)
+
+        Rows, Columns = Module.CanvasRange
+        Indices, Corners, Cuts, Outlines, Keys = Geometry.BlockGeometry(*Module.GridArrays(), Rows, Columns, Module.CellSize, Cache = Module.GeometryCache)
+        Shape = (Rows.stop - Rows.start, Columns.stop - Columns.start)
+        Module.Geometry = (Data.zeros((*Shape, 3, 3, 2)), Data.zeros((*Shape, 3), dtype = bool), Data.zeros((*Shape, 6)))
+        Module.Geometry[0][Indices[:, 1] - Rows.start, Indices[:, 0] - Columns.start] = Cuts
+        Module.Geometry[1][Indices[:, 1] - Rows.start, Indices[:, 0] - Columns.start] = Outlines
+        Module.Geometry[2][Indices[:, 1] - Rows.start, Indices[:, 0] - Columns.start] = Keys
+
+    def UpdateGeometry(Module, Indices): # Recomputes cached Geometry of the given (edited) Cells, if they are on the Canvas
+
+        if Module.CanvasRange == None or Module.Geometry is None: return
+
+        Indices = [Index for Index in Indices if Module.InCanvas(Index) and Module.Selected[Index[1], Index[0]]]
+
+        if not Indices: return
+
+        IndexX, IndexY = Data.array(Indices).T
+        Cuts, Outlines, Keys = Profile.Call("Geometry", Geometry.CellGeometry, Module.Thickness, Module.Theta, Module.Selected, IndexX, IndexY, Module.CellSize, 3, Module.GeometryCache)
+        IndexX, IndexY = IndexX - Module.CanvasRange[1].start, IndexY - Module.CanvasRange[0].start
+        Module.Geometry[0][IndexY, IndexX] = Cuts
+        Module.Geometry[1][IndexY, IndexX] = Outlines
+        Module.Geometry[2][IndexY, IndexX] = Keys
+
+    def GridArrays(Module, Rows = slice(None), Columns = slice(None)): # Thickness, Theta and Selection of a block of cells (Indexed [Y][X])
+
+        return Module.Thickness[Rows, Columns], Module.Theta[Rows, Columns], Module.Selected[Rows, Columns]
+
+    def ExportSVG(Module, Destination, Optimize = False, BlockSize = 16384): # Writes the Grid to an .svg file, Built on demand (Drawing does no SVG work)
+
+        if Optimize: return Export.WriteSVG(Destination, Module.Dimension, Module.CellSize, *Module.GridArrays(), Optimize = True) # Cuts ordered for the laser (Whole Design)
+
+        IndexY, IndexX = Data.nonzero(Module.Selected)
+        Cells = list(zip(IndexX.tolist(), IndexY.tolist()))
+        Missing = [_ for _ in Cells if _ not in Module.Fragments] # Only cells edited since the last Export are regenerated
+        Numbers = {}
+
+        for Start in range(0, len(Missing), BlockSize):
+
+            Block = Data.array(Missing[Start:Start + BlockSize])
+            with Profile.Span("SVG Elements"): Module.Fragments.update(zip(Missing[Start:Start + BlockSize], Export.CellFragments(*Module.GridArrays(), Block[:, 0], Block[:, 1], Module.CellSize, Cache = Module.GeometryCache, Numbers = Numbers)))
+
+        Profile.Count("SVG Elements", 2 * len(Missing)) # Outline and Auxetics of each regenerated cell
+        Profile.Call("Write SVG", Export.WriteFragments, Destination, Module.Dimension, Module.CellSize, [Module.Fragments[_] for _ in Cells])
+
     def HandleEventListeners(Module):
 
         Module.EventLog = RenderEngine.event.get(pump = False) # Get All Event Listeners (Use Pump = False to Avoid GIL Error)
+        Profile.Count("Events", len(Module.EventLog))
+        Start = Profile.Clock()
 
         for _ in Module.EventLog: # Loop through and process triggered Events
             
@@ -466,27 +722,33 @@ class Grid: # Sets up Grid of GridCell objects based on preset argument or Scree
 
                 if _.button == 1:
                     
-                    for Cell in Module.Grid[int(((_.pos[1] - OffSet[1]) // Math.sqrt(3 * (Module.CellSize ** 2) / 4)) + 1)]:
+                    Cell = Module.CellAt(_.pos)
 
-                        if Cell != None: Cell.ClickEvent() if TrianglePointTestII(_.pos, *(Cell.GridPoints)) else None
+                    if Cell != None: Cell.ClickEvent()
     
                 elif _.button == 3:
 
-                    for Cell in Module.Grid[int(((_.pos[1] - OffSet[1]) // Math.sqrt(3 * (Module.CellSize ** 2) / 4)) + 1)]:
+                    Cell = Module.CellAt(_.pos)
 
-                        if Cell != None: Cell.CellValueAdjustment() if TrianglePointTestII(_.pos, *(Cell.GridPoints)) and Cell.Data[2] else None
+                    if Cell != None and Cell.Data[2]: 
                         
-                elif _.button == 4: # Scrolling Up
+                        if Module.ExtendSelection and Module.Selection: Module.ExtendAdjustment(Cell.Index) # Shift + Right Click while the Panel is open
+                        
+                        else: Cell.CellValueAdjustment()
+                        
+                elif _.button == 4: # Scrolling Up (Zooms in around the Cursor if Control is held)
 
-                    Module.GUI.AdjustOffset([0, 4])
+                    if Module.ZoomModifier: Module.ZoomAt(_.pos, 1.25)
+                    else: Module.GUI.AdjustOffset([0, 4])
 
                 elif _.button == 5: # Scrolling Down
 
-                    Module.GUI.AdjustOffset([0, -4])
+                    if Module.ZoomModifier: Module.ZoomAt(_.pos, 0.8)
+                    else: Module.GUI.AdjustOffset([0, -4])
 
-                RenderEngine.event.pump() # Update Events and Process Queue
+                RenderEngine.event.pump() # Update Events and Process Queue (Edits and Scrolling request their own Frame)
 
-                Module.RenderGrid()
+        Profile.Add("Events", Start)
 
 # --------- Graphical Interface ---------
 
@@ -498,24 +760,41 @@ class StudioGraphicalElementI:
         
         Module.Arguments = Arguments
 
-        LogoBox()
+        Module.StudioApplication = None # Grid (Built once the design to open has been read)
+
+        Module.DesignPath = None # .baux file the Grid was opened from or saved to (None if unsaved)
+
+        Files = [_ for _ in ArgumentManage.argv[1:] if not _.startswith("--profile")] # Flags are not designs
+
+        Loading = Session.LoadInBackground(Session.StartupDesign, Files[0] if Files else None) # Design passed on the Command Line (or the last session) is read while the Window is set up
 
         Module.CreateGUIWindow()
 
+        Splash = LogoBox(WindowRendering)
+
         Module.Menu = ApplicationMenu()
 
         Module.Menu([
-        "File"], [
+        "File", "Edit"], [
         ["Save As", "Import",
         "Reset", "Export",
-        "Exit"]], [[
+        "Laser Export", "Exit"],
+        ["Undo", "Redo"]], [[
         Module.Save, Module.Import, 
         Module.Reset, Module.Export,
-        Module.Exit]])
+        Module.LaserExport, Module.Exit],
+        [lambda: Module.StudioApplication.Undo(), lambda: Module.StudioApplication.Redo()]])
 
-        Module.StudioApplication = Grid(Module, Arguments[0], Dimension = [0, 0])
+        while not Loading.done(): # Splash stays responsive until the design is read
 
-        if len(ArgumentManage.argv) > 1: Module.Import(Name = ArgumentManage.argv[1]) # Support for opening .baux file type.
+            WindowRendering.update()
+            WindowRendering.after(10)
+
+        Module.OpenStartup(Loading) # Support for opening .baux file type (Loaded directly, without an empty Grid first).
+
+        Module.StudioApplication.RenderFrame() # First Frame is drawn before the Splash is removed
+
+        Splash.destroy()
 
         WindowRendering.mainloop()
 
@@ -543,6 +822,15 @@ class StudioGraphicalElementI:
         WindowRendering.bind('<Up>', lambda I: Module.AdjustOffset([0, 2])) # RenderEngine Event Listener does not work for keyboard strokes.
         WindowRendering.bind('<Down>', lambda I: Module.AdjustOffset([0, -2]))
         WindowRendering.bind('<Configure>', Module.ScreenRotationResize) # Handle Screen Rotation
+        WindowRendering.bind('<Control-z>', lambda I: Module.StudioApplication.Undo()) # Undo and Redo of Edits
+        WindowRendering.bind('<Control-y>', lambda I: Module.StudioApplication.Redo())
+        WindowRendering.bind('<Control-Z>', lambda I: Module.StudioApplication.Redo()) # Control + Shift + Z
+        WindowRendering.bind_all('<ButtonPress>', lambda I: Module.StudioApplication.Wake(I), "+") # Clicks and Scrolling wake the Grid with their Modifiers (Pygame Events are read when Tkinter is idle)
+        WindowRendering.bind_all('<MouseWheel>', lambda I: Module.StudioApplication.Wake(I), "+") # Scrolling on Windows and macOS (Its Control Modifier Zooms)
+        WindowRendering.bind('<Control-equal>', lambda I: Module.StudioApplication.ZoomAt(RenderEngine.mouse.get_pos(), 1.25)) # Zoom around the Cursor
+        WindowRendering.bind('<Control-plus>', lambda I: Module.StudioApplication.ZoomAt(RenderEngine.mouse.get_pos(), 1.25))
+        WindowRendering.bind('<Control-minus>', lambda I: Module.StudioApplication.ZoomAt(RenderEngine.mouse.get_pos(), 0.8))
+        WindowRendering.bind('<Control-0>', lambda I: Module.StudioApplication.ZoomAt(RenderEngine.mouse.get_pos(), 1 / Module.StudioApplication.Zoom)) # Actual Size
 
     def ScreenRotationResize(Module, Arguments): # In Case of Screen Rotation Grid Will Adapt
 
@@ -551,30 +839,21 @@ class StudioGraphicalElementI:
         if Arguments.widget == WindowRendering:
 
             if not (LimitScreenSize((750, 750, 2000, 1100)) and GetScreenScale() >= 1 and GetScreenScale() <= 1.5): Module.Exit()
-            OffSet[0] = 0 if Module.StudioApplication.Dimension[0] > int(WindowSize()[0] // Module.Arguments[0]) else (WindowSize()[0] / 2 - 0.5 * Module.Arguments[0] * (Module.StudioApplication.Dimension[0] - 0.5)) # Adjust in case of Screen Rotation
-            OffSet[1] = 0 if Module.StudioApplication.Dimension[1] > int(WindowSize()[1] // Math.sqrt(3 * Module.Arguments[0] ** 2 / 4)) else (WindowSize()[1] / 2 - 0.5 * Math.sqrt(3 * Module.Arguments[0] ** 2 / 4) * Module.StudioApplication.Dimension[1])       
+            CellSize = Module.Arguments[0] * Module.StudioApplication.Zoom # On the Screen
+            OffSet[0] = 0 if Module.StudioApplication.Dimension[0] > int(WindowSize()[0] // CellSize) else (WindowSize()[0] / 2 - 0.5 * CellSize * (Module.StudioApplication.Dimension[0] - 0.5)) # Adjust in case of Screen Rotation
+            OffSet[1] = 0 if Module.StudioApplication.Dimension[1] > int(WindowSize()[1] // Math.sqrt(3 * CellSize ** 2 / 4)) else (WindowSize()[1] / 2 - 0.5 * Math.sqrt(3 * CellSize ** 2 / 4) * Module.StudioApplication.Dimension[1])       
+            Module.StudioApplication.RequestFrame(Moved = True)
             
     def AdjustOffset(Module, Input):
 
         global OffSet # Apply Offset adjustment, and check, if offsets take screen off canvas.
-        if OffSet[0] + Input[0] <= 0 and WindowSize()[0] - OffSet[0] - Input[0] < Module.Arguments[0] * (Module.StudioApplication.Dimension[0]): OffSet[0] += Input[0]
-        if OffSet[1] + Input[1] <= 0 and WindowSize()[1] - OffSet[1] - Input[1] < Module.StudioApplication.Dimension[1] * Math.sqrt(3 * (Module.Arguments[0]) ** 2 / 4): OffSet[1] += Input[1]
-        Module.StudioApplication.RenderGrid()
+        if OffSet[0] + Input[0] <= 0 and WindowSize()[0] - OffSet[0] - Input[0] < Module.Arguments[0] * (Module.StudioApplication.Dimension[0]) * Module.StudioApplication.Zoom: OffSet[0] += Input[0]
+        if OffSet[1] + Input[1] <= 0 and WindowSize()[1] - OffSet[1] - Input[1] < Module.StudioApplication.Dimension[1] * Math.sqrt(3 * (Module.Arguments[0]) ** 2 / 4) * Module.StudioApplication.Zoom: OffSet[1] += Input[1]
+        Module.StudioApplication.RequestFrame(Moved = True)
 
     def UpdateGridMap(Module):
 
-        Module.GridMap = list(ToolI(*[[XPosition for XPosition in YPosition]
-        for YPosition in Module.StudioApplication.Grid])) # List out all the Grid Cell Modules
-
-        Grid = []
-
-        for _ in Module.GridMap: 
-            
-            if _ != None:
-                
-                if _.Data[2] is True: Grid.append((_.Index, _.Data[0], _.Data[1])) # Select only activated cells
-
-        Module.GridMap = Grid
+        Module.GridMap = Module.StudioApplication.CellList() # Select only activated cells
 
     def Import(Module, Name = None):
 
@@ -590,67 +869,107 @@ class StudioGraphicalElementI:
 
         if FileSource != "":
 
-            FileSource = FileManage.load(open(FileSource, "r", encoding="utf-8")) # Load .baux file as readonly in 'utf-8'
+            Design = Format.LoadDesign(FileSource) # Load .baux file (JSON or Binary, Cell Arrays are memory-mapped)
+            Module.OpenDesign(FileSource, Design.Dimension, Design)
+
+    def OpenDesign(Module, Path, Dimension, Input, Position = None, Zoom = 1.0): # Replaces the Grid with a Design (Path is None for an unsaved Grid, Input is a Design or its Grid Arrays), Centred unless a Viewport Position is given
+
+        if Dimension[0] >= 10 and Dimension[1] >= 10: # Only Cells on the Canvas are rendered, so there is no upper limit
+
+            global OffSet
+            OffSet[0] = 0 if Dimension[0] > int(WindowSize()[0] // 50) else (WindowSize()[0] / 2 - 0.5 * 50 * (Dimension[0] - 0.5))# Reset OffSet to [0, 0] if Screen Smaller than File Dimensions (0.5 is for Grid Offset of 1/2 Cell)
+            OffSet[1] = 0 if Dimension[1] > int(WindowSize()[1] // Math.sqrt(3 * 50 ** 2 / 4)) else (WindowSize()[1] / 2 - 0.5 * Math.sqrt(3 * 50 ** 2 / 4) * Dimension[1]) # Otherwise, Align it in the center of the screen.
 
-            if FileSource["Grid Size"][0] >= 10 and FileSource["Grid Size"][1] >= 10 and FileSource["Grid Size"][0] <= 80 and FileSource["Grid Size"][1] <= 40:
+            if Position != None: OffSet[:] = Position # Where the last session left the Viewport
+
+            if Module.StudioApplication != None:
 
-                global OffSet
-                OffSet[0] = 0 if FileSource["Grid Size"][0] > int(WindowSize()[0] // 50) else (WindowSize()[0] / 2 - 0.5 * 50 * (FileSource["Grid Size"][0] - 0.5))# Reset OffSet to [0, 0] if Screen Smaller than File Dimensions (0.5 is for Grid Offset of 1/2 Cell)
-                OffSet[1] = 0 if FileSource["Grid Size"][1] > int(WindowSize()[1] // Math.sqrt(3 * 50 ** 2 / 4)) else (WindowSize()[1] / 2 - 0.5 * Math.sqrt(3 * 50 ** 2 / 4) * FileSource["Grid Size"][1]) # Otherwise, Align it in the center of the screen.
                 Module.StudioApplication.RunProgram = False
-                Module.StudioApplication = Grid(Module, 50, 
-                Input = [(_[0], _[1], _[2]) for _ in FileSource["Data"]], # Load Existing Data Points
-                Dimension = (FileSource["Grid Size"][0], FileSource["Grid Size"][1])) # Grid Size
-                Module.UpdateGridMap()
-                WindowRendering.after(25, Module.StudioApplication.RenderGrid) # Update Grid
-                UpdateScreen()
+                Module.StudioApplication.Edits.Close(Remove = True) # Unsaved Edits of the previous design are discarded
+
+            Module.StudioApplication = Grid(Module, 50, 
+            Input = Input, # Load Existing Data Points
+            Dimension = Dimension) # Grid Size
+            Module.StudioApplication.Zoom = Zoom
+
+            if Path != None: Module.StudioApplication.OpenJournal(Path) # Recover Edits that were not saved
+
+            Module.DesignPath = Path
+            Module.UpdateGridMap()
+            Module.StudioApplication.RequestFrame(Moved = True) # Update Grid
+            UpdateScreen()
+
+        else: print(f"Error: {System.path.basename(Path) if Path != None else 'The last session'} does not meet the Grid Size Requirements (At least 10 by 10 cells)\n")
+
+    def OpenStartup(Module, Loading): # Opens the design read on startup (An empty Grid if there is none, or it could not be read)
+
+        try: Startup = Loading.result()
+
+        except Exception as Error:
+
+            print(f"Error: The design could not be opened ({Error})\n")
+            Startup = None
+
+        if Startup != None: Module.OpenDesign(*Startup)
 
-            else: print(f"Error: {FileSource["Name"]}.baux does not meet the Grid Size Requirements (At least 10 by 10 cells / Smaller than 80 by 40 cells)\n")
+        if Module.StudioApplication == None: Module.StudioApplication = Grid(Module, Module.Arguments[0], Dimension = [0, 0])
+
+    def KeepSession(Module, Edited = None): # Keeps the Grid for the next start (Warm Start), Edited if it differs from Module.DesignPath
+
+        with ToolII(OSError): Session.SaveSession(*Module.StudioApplication.GridArrays(), Module.Arguments[0], OffSet, Module.DesignPath, len(Module.StudioApplication.Edits) > 0 if Edited == None else Edited, Module.StudioApplication.Zoom)
 
     def Save(Module):
 
-        FileSource = FileSaveI(filetypes=[("Bauxite Designs", "*.baux")], defaultextension=".baux")
+        FileSource = FileSaveII(filetypes=[("Bauxite Designs", "*.baux")], defaultextension=".baux")
 
-        if FileSource != None:
+        if FileSource:
 
-            Module.UpdateGridMap()
-        
-            FileManage.dump(({
-                "Name": System.path.splitext(System.path.basename(FileSource.name))[0],
-                "Cell Size": Module.Arguments[0],
-                "Grid Size": Module.StudioApplication.Dimension,
-                "Data": Module.GridMap
-            }), FileSource)
+            Format.SaveDesign(FileSource, Format.DesignFromGrid(System.path.splitext(System.path.basename(FileSource))[0],
+            Module.Arguments[0], *Module.StudioApplication.GridArrays())) # Binary (Version 2) .baux file
+
+            Module.StudioApplication.Edits.Close(Remove = True) # Edits are saved
+
+            Module.DesignPath = FileSource
+
+            Module.KeepSession(Edited = False)
 
             Module.StudioApplication.RunProgram = False
 
             WindowRendering.destroy()
 
-    def Export(Module):
+    def Export(Module, Optimize = False):
 
         with ToolII(FileNotFoundError):
 
             FileSource = FileSaveII(filetypes=[("Scalable Vector Graphics", "*.svg")], defaultextension=".svg")
 
-        if FileSource != "":
+        if FileSource:
+
+            Report = Module.StudioApplication.ExportSVG(FileSource, Optimize)
+
+            if Report != None: print(f"Exported {System.path.basename(FileSource)} ({Export.Toolpath.ReportText(Report)})\n")
+
+    def LaserExport(Module): # Cuts merged and ordered for the laser
 
-            Module.StudioApplication.ExportSVG[0].append(Module.StudioApplication.ExportSVG[1])
-            Module.StudioApplication.ExportSVG[0].append(Module.StudioApplication.ExportSVG[2])
-            Module.StudioApplication.ExportSVG[0].save_svg(FileSource)
+        Module.Export(Optimize = True)
 
     def Reset(Module):
 
         global OffSet
         OffSet = [0, 0]
         Module.StudioApplication.RunProgram = False # Removes Game Event Loop
+        Module.StudioApplication.Edits.Close(Remove = True)
         Module.StudioApplication = Grid(Module, Module.Arguments[0], Dimension = [0, 0])
+        Module.DesignPath = None
         Module.UpdateGridMap() # Updates Values of Map of Selected Cells
-        WindowRendering.after(25, Module.StudioApplication.RenderGrid)
+        Module.StudioApplication.RequestFrame(Moved = True)
     
     def Exit(Module):
 
         Module.GridMap = []
         Module.StudioApplication.RunProgram = False
+        Module.KeepSession() # The next start continues this session
+        Module.StudioApplication.Edits.Close(Remove = True) # Unsaved Edits live on in the Session, not in the Journal (It only outlives a crash)
         RenderEngine.display.quit() # End RenderEngine Process
         WindowRendering.destroy() # Close Application
         print("Session Completed.\n")
@@ -681,6 +1000,6 @@ class StudioTextElementI:
 
 # --------- Main Interface ---------
 
-Studio = StudioTextElementI()
+if __name__ == "__main__": Studio = StudioTextElementI() # Importing the Module (Headless Tools) does not open the Studio
 
 # ----------------------------------
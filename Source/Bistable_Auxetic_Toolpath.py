@@ -0,0 +1,219 @@
+#
+# Bistable Auxetic Toolpath - Developed By Dinuk Wijesiri
+#
+# Overview:
+#
+# Prepares the cuts of a design for a laser cutter. Segments are snapped
+# to a grid, so coincident (duplicated) edges are only cut once. Segments
+# sharing an end point are joined into continuous polylines, dropping the
+# points between collinear segments. Polylines are then ordered to reduce
+# travel between them: a nearest neighbour tour (using a bucket grid of
+# end points), improved by a windowed 2-opt pass that may also reverse
+# the direction of paths.
+#
+
+# --------- Imports ---------
+
+import math as Math # Basic Mathematical Operations
+import numpy as Data # Batched (Vectorized) Mathematical Operations
+
+# --------- Utilities (Functions) ---------
+
+def PathLengths(Polylines, Start = (0, 0)): # Cut Length (Along Polylines) and Travel Length (Between them, from Start), in the given Order
+
+    if not len(Polylines): return 0.0, 0.0
+
+    Points = Data.concatenate([Data.asarray(_, dtype = Data.float64) for _ in Polylines])
+    Steps = Data.hypot(*Data.diff(Points, axis = 0).T)
+    Steps[Data.cumsum([len(_) for _ in Polylines])[:-1] - 1] = 0 # Steps between Polylines are Travel
+    Cut = float(Steps.sum())
+    Starts, Ends = Data.array([_[0] for _ in Polylines], dtype = Data.float64), Data.array([_[-1] for _ in Polylines], dtype = Data.float64)
+
+    return Cut, float(Data.hypot(*(Starts - Data.concatenate([[Start], Ends[:-1]])).T).sum())
+
+def UniqueSegments(Polylines, Precision = 3): # Segments of all Polylines snapped to Integers (10 ** -Precision units), without Duplicates or Zero Length Segments -> (S, 2, 2)
+
+    if isinstance(Polylines, Data.ndarray): Segments = [Data.stack([Polylines[:, :-1], Polylines[:, 1:]], axis = 2).reshape(-1, 2, 2)] # Polylines of equal Length (Lines, Points, 2)
+
+    else: Segments = [Data.stack([Points[:-1], Points[1:]], axis = 1) for Points in (Data.asarray(_, dtype = Data.float64) for _ in Polylines) if len(Points) > 1]
+
+    if not Segments: return Data.zeros((0, 2, 2), dtype = Data.int64)
+
+    Segments = Data.rint(Data.concatenate(Segments) * 10 ** Precision).astype(Data.int64)
+    Swap = (Segments[:, 0, 0] > Segments[:, 1, 0]) | ((Segments[:, 0, 0] == Segments[:, 1, 0]) & (Segments[:, 0, 1] > Segments[:, 1, 1])) # Same Direction for Coincident Segments
+    Segments[Swap] = Segments[Swap][:, ::-1]
+    Segments = Segments[(Segments[:, 0] != Segments[:, 1]).any(axis = 1)]
+    _, First = Data.unique(Segments.reshape(-1, 4), axis = 0, return_index = True)
+    return Segments[Data.sort(First)] # Keep the Original Order (First Occurrence)
+
+def JoinSegments(Segments): # Chains of Segments meeting at Nodes shared by exactly two Segments -> List of Point Lists (Integers)
+
+    if not len(Segments): return []
+
+    Nodes, Ends = Data.unique(Segments.reshape(-1, 2), axis = 0, return_inverse = True)
+    Ends = Ends.reshape(-1, 2)
+    Incident = Data.argsort(Ends.ravel(), kind = "stable") // 2 # Segments around each Node (Compressed Rows)
+    Offsets = Data.concatenate([[0], Data.cumsum(Data.bincount(Ends.ravel(), minlength = len(Nodes)))])
+    Degree = Data.diff(Offsets)
+    Nodes, Ends, Incident, Offsets = Nodes.tolist(), Ends.tolist(), Incident.tolist(), Offsets.tolist()
+    Used = [False] * len(Ends)
+
+    def Walk(Node, Segment): # Follow unused Segments until the Chain ends, branches or closes
+
+        Points = [Nodes[Node]]
+
+        while True:
+
+            Used[Segment] = True
+            Node = Ends[Segment][1] if Ends[Segment][0] == Node else Ends[Segment][0]
+            Point = Nodes[Node]
+
+            if len(Points) > 1: # Drop the last Point, if it lies between two collinear Segments
+
+                (AX, AY), (BX, BY) = Points[-2], Points[-1]
+
+                if (BX - AX) * (Point[1] - BY) == (BY - AY) * (Point[0] - BX) and (BX - AX) * (Point[0] - BX) + (BY - AY) * (Point[1] - BY) > 0: Points.pop()
+
+            Points.append(Point)
+
+            if Degree[Node] != 2: return Points
+
+            Segment = next((_ for _ in Incident[Offsets[Node]:Offsets[Node + 1]] if not Used[_]), None)
+
+            if Segment == None: return Points
+
+    Chains = []
+
+    for Node in Data.nonzero(Degree != 2)[0].tolist(): # Open Chains start at Ends and Branches
+
+        for Segment in Incident[Offsets[Node]:Offsets[Node + 1]]:
+
+            if not Used[Segment]: Chains.append(Walk(Node, Segment))
+
+    for Segment in range(len(Ends)): # Remaining Segments form Closed Loops
+
+        if not Used[Segment]: Chains.append(Walk(Ends[Segment][0], Segment))
+
+    return Chains
+
+def NearestNeighbourOrder(Starts, Ends, Start = (0, 0)): # Greedy Tour visiting every Path (Entered from either End) -> Order, Reversed
+
+    Count = len(Starts)
+    Points = Data.concatenate([Starts, Ends])
+    Extent = Points.max(axis = 0) - Points.min(axis = 0)
+    Size = max(Math.sqrt(max(Extent[0], 1) * max(Extent[1], 1) / max(Count, 1)), 1e-9) # About one Path per Bucket
+    Origin = Points.min(axis = 0)
+    Keys = Data.floor((Points - Origin) / Size).astype(Data.int64).tolist()
+    Points = Points.tolist()
+    Buckets = {}
+
+    for Entry, Key in enumerate(Keys): Buckets.setdefault(tuple(Key), []).append(Entry) # Entry is a Path (< Count) or the End of one (>= Count)
+
+    Limit = int(Data.floor(Extent / Size).max()) + 1
+    Used, Order, Reversed = [False] * Count, [], []
+    Position = [float(Start[0]), float(Start[1])]
+
+    for _ in range(Count):
+
+        Centre = [int(Math.floor((Position[Axis] - Origin[Axis]) / Size)) for Axis in range(2)]
+        Best, BestDistance, Ring = None, Math.inf, 0
+
+        while Best == None or BestDistance > (Ring - 1) * Size: # Buckets in Ring R are at least (R - 1) Buckets away
+
+            if Ring > Limit + max(abs(Centre[0]), abs(Centre[1])) + 1: break
+
+            for X in range(Centre[0] - Ring, Centre[0] + Ring + 1):
+
+                for Y in (range(Centre[1] - Ring, Centre[1] + Ring + 1) if abs(X - Centre[0]) == Ring else (Centre[1] - Ring, Centre[1] + Ring)):
+
+                    Entries = Buckets.get((X, Y))
+
+                    if not Entries: continue
+
+                    Entries[:] = [_ for _ in Entries if not Used[_ % Count]] # Forget visited Paths
+
+                    for Entry in Entries:
+
+                        Distance = Math.hypot(Points[Entry][0] - Position[0], Points[Entry][1] - Position[1])
+
+                        if Distance < BestDistance: Best, BestDistance = Entry, Distance
+
+            Ring += 1
+
+        Used[Best % Count] = True
+        Order.append(Best % Count)
+        Reversed.append(Best >= Count)
+        Position = Points[Best - Count] if Best >= Count else Points[Best + Count] # Leave from the other End
+
+    return Data.array(Order, dtype = Data.int64), Data.array(Reversed, dtype = bool)
+
+def TwoOpt(Starts, Ends, Start = (0, 0), Window = 32, Passes = 3): # Windowed 2-opt on a Tour of Paths (Reversing a run of Paths also reverses each Path) -> Order, Reversed
+
+    Starts, Ends = Data.array(Starts, dtype = Data.float64), Data.array(Ends, dtype = Data.float64)
+    Count = len(Starts)
+    Order, Reversed = Data.arange(Count), Data.zeros(Count, dtype = bool)
+
+    for _ in range(Passes):
+
+        Improved = False
+        Travel = Data.hypot(*(Starts - Data.concatenate([[Start], Ends[:-1]])).T)
+        Candidates = Data.nonzero(Travel > 2 * Data.median(Travel))[0].tolist() if Count else [] # Only a long Travel can be shortened much
+
+        for First in Candidates:
+
+            Last = Data.arange(First, min(First + Window, Count))
+            Previous = Data.asarray(Start, dtype = Data.float64) if First == 0 else Ends[First - 1]
+            Following = Data.minimum(Last + 1, Count - 1)
+            Tail = Last + 1 < Count
+            Old = Data.hypot(*(Previous - Starts[First])) + Tail * Data.hypot(*(Ends[Last] - Starts[Following]).T)
+            New = Data.hypot(*(Previous - Ends[Last]).T) + Tail * Data.hypot(*(Starts[First] - Starts[Following]).T)
+            Best = int(Data.argmax(Old - New))
+
+            if Old[Best] - New[Best] > 1e-9:
+
+                Run = slice(First, int(Last[Best]) + 1)
+                Starts[Run], Ends[Run] = Ends[Run][::-1].copy(), Starts[Run][::-1].copy()
+                Order[Run], Reversed[Run] = Order[Run][::-1].copy(), ~Reversed[Run][::-1]
+                Improved = True
+
+        if not Improved: break
+
+    return Order, Reversed
+
+def OrderPaths(Polylines, Start = (0, 0), Window = 32): # Polylines ordered (and possibly reversed) to reduce Travel
+
+    if not Polylines: return []
+
+    Starts, Ends = Data.array([_[0] for _ in Polylines], dtype = Data.float64), Data.array([_[-1] for _ in Polylines], dtype = Data.float64)
+    Order, Reversed = NearestNeighbourOrder(Starts, Ends, Start)
+    Starts, Ends = Data.where(Reversed[:, None], Ends[Order], Starts[Order]), Data.where(Reversed[:, None], Starts[Order], Ends[Order])
+    Improved, Flipped = TwoOpt(Starts, Ends, Start, Window)
+    Order, Reversed = Order[Improved], Reversed[Improved] ^ Flipped
+
+    return [Polylines[Path][::-1] if Flip else Polylines[Path] for Path, Flip in zip(Order.tolist(), Reversed.tolist())]
+
+def OptimizePaths(Layers, Precision = 3, Start = (0, 0), Window = 32): # Dedup, Join and Order the Polylines of each Layer (Cut in the given Order) -> Optimized Layers, Report
+
+    Report = {"Paths": [0, 0], "Cut Length": [0.0, 0.0], "Travel Length": [0.0, 0.0]} # [Before, After]
+    Optimized, Before, After = [], Start, Start
+
+    for Polylines in Layers:
+
+        Cut, Travel = PathLengths(Polylines, Before)
+        Report["Paths"][0] += len(Polylines)
+        Report["Cut Length"][0] += Cut
+        Report["Travel Length"][0] += Travel
+        Before = Polylines[-1][-1] if len(Polylines) else Before
+
+        Chains = [Data.array(_, dtype = Data.float64) / 10 ** Precision for _ in JoinSegments(UniqueSegments(Polylines, Precision))]
+        Chains = OrderPaths(Chains, After, Window)
+        Cut, Travel = PathLengths(Chains, After)
+        Report["Paths"][1] += len(Chains)
+        Report["Cut Length"][1] += Cut
+        Report["Travel Length"][1] += Travel
+        After = Chains[-1][-1] if Chains else After
+        Optimized.append(Chains)
+
+    return Optimized, Report
+
+ReportText = lambda Report: ", ".join(f"{Name} {Before:.{0 if Name == 'Paths' else 1}f} -> {After:.{0 if Name == 'Paths' else 1}f}" for Name, (Before, After) in Report.items())